@@ -13,14 +13,23 @@ from __future__ import annotations
 import argparse
 import re
 from pathlib import Path
-
-
-def parse_cells(line: str) -> list[str]:
-    return [c.strip() for c in line.strip().strip("|").split("|")]
-
-
-def format_row(cells: list[str]) -> str:
-    return "| " + " | ".join(cells) + " |"
+from typing import Callable, Iterable, Iterator
+
+from glossary import load_table, table_version
+from handover_ir import (
+    Node,
+    NodeStream,
+    Row,
+    Table,
+    TextLine,
+    demote_table,
+    has_nested_table,
+    iter_nodes,
+    render_text,
+    sep_row,
+    table_lines,
+)
+from translation_cache import shared_cache, translator_version
 
 
 def split_words(name: str) -> list[str]:
@@ -29,360 +38,24 @@ def split_words(name: str) -> list[str]:
     return [p for p in s.split("_") if p]
 
 
-WORD_MAP = {
-    "home": "首页",
-    "tech": "技术",
-    "manager": "经理",
-    "managers": "经理",
-    "publish": "发布",
-    "messages": "消息",
-    "message": "消息",
-    "me": "我的",
-    "search": "搜索",
-    "patent": "专利",
-    "orders": "订单",
-    "order": "订单",
-    "checkout": "支付",
-    "deposit": "订金",
-    "final": "尾款",
-    "success": "成功",
-    "achievement": "成果",
-    "achievements": "成果",
-    "chat": "会话",
-    "support": "客服",
-    "faq": "常见问题",
-    "contact": "联系",
-    "legal": "法律",
-    "privacy": "隐私",
-    "terms": "条款",
-    "guide": "指引",
-    "onboarding": "新手引导",
-    "choose": "选择",
-    "identity": "身份",
-    "verification": "认证",
-    "form": "表单",
-    "notifications": "通知",
-    "notification": "通知",
-    "announcements": "公告",
-    "announcement": "公告",
-    "listing": "挂牌",
-    "listings": "挂牌",
-    "favorites": "收藏",
-    "organizations": "机构",
-    "inventors": "发明人",
-    "map": "地图",
-    "trade": "交易",
-    "rules": "规则",
-    "contracts": "合同",
-    "invoices": "发票",
-    "addresses": "地址",
-    "address": "地址",
-    "edit": "编辑",
-    "my": "我的",
-    "claims": "认领",
-    "claim": "认领",
-    "maintenance": "维保",
-    "settings": "设置",
-    "about": "关于",
-    "profile": "资料",
-    "login": "登录",
-    "ipc": "IPC",
-    "picker": "选择器",
-    "media": "媒体",
-    "video": "视频",
-    "preview": "预览",
-    "cooperation": "合作",
-    "modes": "方式",
-    "mode": "方式",
-    "line": "行",
-    "json": "JSON",
-    "at": "时间",
-    "in": "内",
-    "seconds": "秒",
-    "second": "秒",
-    "expires": "过期",
-    "reply": "回复",
-    "counterpart": "对方",
-    "applicant": "申请人",
-    "assignee": "受让方",
-    "confidence": "置信度",
-    "scope": "范围",
-    "featured": "推荐",
-    "rank": "排序位",
-    "jurisdiction": "法域",
-    "provider": "渠道",
-    "ok": "成功",
-    "key": "键",
-    "job": "任务",
-    "defaults": "默认配置",
-    "defaults2": "默认配置",
-    "window": "窗口",
-    "minutes": "分钟",
-    "minute": "分钟",
-    "fen": "分",
-    "evidence": "凭证",
-    "masked": "脱敏",
-    "note": "备注",
-    "notes": "备注",
-    "sla": "SLA",
-    "can": "可",
-    "auto": "自动",
-    "payout": "放款",
-    "timeout": "超时",
-    "commission": "佣金",
-    "deal": "成交",
-    "plain": "文本",
-    "features": "特征",
-    "strategy": "策略",
-    "hot": "热门",
-    "sensitive": "敏感",
-    "taxonomy": "分类",
-    "rule": "规则",
-    "rules2": "规则",
-    "trade2": "交易",
-    "template": "模板",
-    "templates": "模板",
-    "item": "项",
-    "items": "条目",
-    "offline": "下线",
-    "publish2": "发布",
-    "audio": "音频",
-    "parse2": "解析",
-    "agent": "坐席",
-    "conversation": "会话",
-    "display": "显示",
-    "until": "截止",
-    "level": "等级",
-    "claim2": "认领",
-    "event": "事件",
-    "events": "事件",
-    "summary2": "汇总",
-    "stats": "统计",
-    "recommendation": "推荐",
-    "sensitivewords": "敏感词",
-    "no": "编号",
-    "admin": "后台",
-    "verifications": "认证审核",
-    "refunds": "退款",
-    "settlements": "结算",
-    "reports": "报表",
-    "comments": "评论",
-    "audit": "审计",
-    "logs": "日志",
-    "rbac": "权限",
-    "config": "配置",
-    "regions": "地区",
-    "operations": "业务操作",
-    "conversations": "会话",
-    "platform": "平台",
-    "auth": "认证",
-    "session": "会话",
-    "user": "用户",
-    "users": "用户",
-    "role": "角色",
-    "roles": "角色",
-    "permission": "权限",
-    "permissions": "权限",
-    "id": "ID",
-    "uuid": "唯一ID",
-    "status": "状态",
-    "type": "类型",
-    "name": "名称",
-    "title": "标题",
-    "summary": "摘要",
-    "description": "描述",
-    "content": "内容",
-    "phone": "手机号",
-    "email": "邮箱",
-    "avatar": "头像",
-    "url": "地址",
-    "code": "编码",
-    "region": "地区",
-    "province": "省",
-    "city": "市",
-    "district": "区",
-    "amount": "金额",
-    "price": "价格",
-    "fee": "费用",
-    "rate": "费率",
-    "tax": "税额",
-    "total": "总额",
-    "count": "数量",
-    "page": "页码",
-    "size": "每页条数",
-    "created": "创建",
-    "updated": "更新",
-    "deleted": "删除",
-    "time": "时间",
-    "date": "日期",
-    "start": "开始",
-    "end": "结束",
-    "is": "是否",
-    "has": "是否",
-    "enabled": "启用",
-    "disabled": "停用",
-    "active": "有效",
-    "default": "默认",
-    "cover": "封面",
-    "file": "文件",
-    "files": "文件",
-    "source": "来源",
-    "target": "目标",
-    "result": "结果",
-    "results": "结果",
-    "reason": "原因",
-    "remark": "备注",
-    "note": "说明",
-    "operator": "操作人",
-    "owner": "所有者",
-    "buyer": "买家",
-    "seller": "卖家",
-    "cs": "客服",
-    "finance": "财务",
-    "invoice": "发票",
-    "contract": "合同",
-    "payment": "支付",
-    "refund": "退款",
-    "settlement": "结算",
-    "parse": "解析",
-    "ai": "AI",
-    "hot": "热门",
-    "banner": "横幅",
-    "tag": "标签",
-    "industry": "行业",
-    "keyword": "关键词",
-    "maturity": "成熟度",
-    "sort": "排序",
-    "wechat": "微信",
-    "bind": "绑定",
-    "unbind": "解绑",
-    "approve": "审核通过",
-    "reject": "审核驳回",
-    "upload": "上传",
-    "download": "下载",
-    "send": "发送",
-    "read": "已读",
-    "unread": "未读",
-    "detail": "详情",
-    "list": "列表",
-    "index": "首页",
-}
-
-
-ACTION_MAP = {
-    "approve": "审核通过",
-    "reject": "审核驳回",
-    "publish": "发布",
-    "off-shelf": "下架",
-    "offshelf": "下架",
-    "ack": "确认",
-    "export": "导出",
-    "upload": "上传",
-    "download": "下载",
-    "bind": "绑定",
-    "unbind": "解绑",
-    "login": "登录",
-    "logout": "退出登录",
-    "refresh": "刷新",
-    "submit": "提交",
-    "cancel": "取消",
-    "close": "关闭",
-    "open": "开启",
-    "assign": "分配",
-    "reply": "回复",
-    "send": "发送",
-    "read": "已读",
-    "unread": "标记未读",
-    "restore": "恢复",
-    "delete": "删除",
-    "remove": "移除",
-}
-
-
-PAGE_EXACT = {
-    "pages/home/index": "首页",
-    "pages/tech-managers/index": "技术经理页",
-    "pages/publish/index": "发布页",
-    "pages/messages/index": "消息页",
-    "pages/me/index": "我的页",
-    "subpackages/search/index": "搜索页",
-    "subpackages/patent/detail/index": "专利详情",
-    "subpackages/orders/index": "订单列表",
-    "subpackages/orders/detail/index": "订单详情",
-    "subpackages/checkout/deposit-pay/index": "订金支付",
-    "subpackages/checkout/deposit-success/index": "订金支付成功",
-    "subpackages/checkout/final-pay/index": "尾款支付",
-    "subpackages/checkout/final-success/index": "尾款支付成功",
-    "subpackages/publish/patent/index": "发布专利",
-    "subpackages/publish/achievement/index": "发布成果",
-    "subpackages/messages/chat/index": "聊天会话",
-    "subpackages/support/index": "客服中心",
-    "subpackages/support/faq/index": "常见问题",
-    "subpackages/support/faq/detail/index": "问题详情",
-    "subpackages/support/contact/index": "联系客服",
-    "subpackages/legal/privacy/index": "隐私政策",
-    "subpackages/legal/terms/index": "服务条款",
-    "subpackages/legal/privacy-guide/index": "隐私指引",
-    "subpackages/onboarding/choose-identity/index": "选择身份",
-    "subpackages/onboarding/verification-form/index": "实名认证表单",
-    "subpackages/notifications/index": "通知列表",
-    "subpackages/notifications/detail/index": "通知详情",
-    "subpackages/home-announcements/index": "首页公告列表",
-    "subpackages/home-announcements/detail/index": "首页公告详情",
-    "subpackages/listing/detail/index": "挂牌详情",
-    "subpackages/achievement/detail/index": "成果详情",
-    "subpackages/favorites/index": "我的收藏",
-    "subpackages/organizations/index": "机构列表",
-    "subpackages/organizations/detail/index": "机构详情",
-    "subpackages/inventors/index": "发明人列表",
-    "subpackages/patent-map/index": "专利地图",
-    "subpackages/tech-managers/detail/index": "技术经理详情",
-    "subpackages/trade-rules/index": "交易规则",
-    "subpackages/contracts/index": "合同中心",
-    "subpackages/invoices/index": "发票中心",
-    "subpackages/addresses/index": "地址管理",
-    "subpackages/addresses/edit/index": "地址编辑",
-    "subpackages/my-listings/index": "我的挂牌",
-    "subpackages/my-achievements/index": "我的成果",
-    "subpackages/patent-claims/index": "专利认领",
-    "subpackages/maintenance/index": "维保服务",
-    "subpackages/settings/notifications/index": "通知设置",
-    "subpackages/about/index": "关于我们",
-    "subpackages/profile/edit/index": "资料编辑",
-    "subpackages/login/index": "登录页",
-    "subpackages/ipc-picker/index": "IPC 选择",
-    "subpackages/media/video-preview/index": "视频预览",
-}
-
-
-ROUTE_EXACT = {
-    "/login": "登录页",
-    "/": "后台首页",
-    "verifications": "实名认证审核管理",
-    "listings": "挂牌审核管理",
-    "tech-managers": "技术经理管理",
-    "orders": "订单管理",
-    "orders/:orderId": "订单详情",
-    "cases": "客服工单管理",
-    "refunds": "退款管理",
-    "settlements": "结算管理",
-    "invoices": "发票管理",
-    "reports": "经营报表",
-    "comments": "评论管理",
-    "audit-logs": "审计日志",
-    "rbac": "权限角色管理",
-    "config": "系统配置",
-    "home-announcements": "首页公告管理",
-    "maintenance": "专利维保管理",
-    "regions": "地区字典管理",
-    "patents": "专利库管理",
-    "patents/operations": "专利业务操作",
-    "patents/claims": "专利认领审核",
-    "conversations/platform": "平台会话管理",
-}
+WORD_MAP = load_table("annotate.word")
+ACTION_MAP = load_table("annotate.action")
+PAGE_EXACT = load_table("annotate.page_exact")
+ROUTE_EXACT = load_table("annotate.route_exact")
+
+
+# Field names repeat thousands of times across schema tables; cache per raw identifier.
+TRANSLATION_CACHE = shared_cache()
+CACHE_VERSION = translator_version(
+    table_version("annotate.word"), __file__, Path(__file__).with_name("handover_ir.py")
+)
 
 
 def translate_identifier(name: str) -> str:
+    return TRANSLATION_CACHE.lookup("annotate.identifier", CACHE_VERSION, name, _translate_identifier)
+
+
+def _translate_identifier(name: str) -> str:
     raw = name.strip("`")
     if not raw:
         return "-"
@@ -506,111 +179,92 @@ def field_desc(field_path: str) -> str:
     return last_zh
 
 
-def enhance_document(text: str) -> str:
-    lines = text.splitlines()
-    out: list[str] = []
+RowRewriter = Callable[[list[str]], "list[str] | None"]
+
+
+def _rewrite_page_row(row: list[str]) -> list[str] | None:
+    if len(row) >= 4 and row[0].startswith("MP-"):
+        return [row[0], row[1], row[2], row[3], page_desc(row[3])]
+    return None
+
+
+def _rewrite_route_row(row: list[str]) -> list[str] | None:
+    if len(row) >= 3 and row[0].startswith("ADM-"):
+        return [row[0], row[1], row[2], admin_route_desc(row[2])]
+    return None
+
+
+def _rewrite_api_row(row: list[str]) -> list[str] | None:
+    if len(row) >= 7 and row[0]:
+        desc = api_desc(row[0], row[1], row[2], row[3])
+        return [row[0], row[1], row[2], row[3], row[4], row[5], row[6], desc]
+    return None
 
-    # remove section 8 and anything after it
-    cut_idx = None
-    for idx, line in enumerate(lines):
-        if line.startswith("## 8."):
-            cut_idx = idx
-            break
-    if cut_idx is not None:
-        lines = lines[:cut_idx]
-
-    section = 0
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-
-        if "阅读建议" in line:
-            i += 1
+
+def _rewrite_schema_field_row(row: list[str]) -> list[str] | None:
+    if len(row) >= 5 and row[0].startswith("`"):
+        return [row[0], row[1], row[2], row[3], field_desc(row[0])]
+    return None
+
+
+def _rewrite_db_field_row(row: list[str]) -> list[str] | None:
+    if len(row) >= 5 and row[0].startswith("`"):
+        return [row[0], row[1], row[2], row[3], row[4], field_desc(row[0])]
+    return None
+
+
+def match_table_rule(section: int, header: list[str]) -> tuple[list[str], RowRewriter] | None:
+    # Returns (new header, row rewriter); rows the rewriter maps to None are dropped.
+    if section == 3 and len(header) == 4:
+        return ["页面编号", "包名", "页面路径", "完整路径", "页面说明"], _rewrite_page_row
+    if section == 4 and len(header) == 3:
+        return ["路由编号", "类型", "路由路径", "功能说明"], _rewrite_route_row
+    if section == 5 and len(header) == 7:
+        return ["端别", "方法", "路径", "OperationId", "鉴权", "标签", "关联 Schema", "接口中文说明"], _rewrite_api_row
+    # Section 6 table(s): fill description column
+    if section == 6 and len(header) == 5 and "字段" in header[0]:
+        return ["字段路径", "类型", "必填", "枚举", "说明"], _rewrite_schema_field_row
+    # Section 7 table(s): add description column
+    if section == 7 and len(header) == 5 and header[0] in {"字段", "Field"}:
+        return ["字段", "类型", "必填", "枚举", "Prisma 属性", "字段说明"], _rewrite_db_field_row
+    return None
+
+
+def annotate_nodes(nodes: Iterable[Node]) -> Iterator[Node]:
+    stream = NodeStream(nodes)
+    for node in stream:
+        if isinstance(node, TextLine):
+            # remove section 8 and anything after it
+            if node.text.startswith("## 8."):
+                return
+            if "阅读建议" not in node.text:
+                yield node
             continue
 
-        if line.startswith("## "):
-            m = re.match(r"^##\s+(\d+)\.", line)
-            if m:
-                section = int(m.group(1))
-            out.append(line)
-            i += 1
+        # "阅读建议" lines are skipped before table detection, so such a header never opens a table.
+        if "阅读建议" in node.header.render():
+            stream.push(demote_table(node, keep_header=False))
             continue
 
-        # Section 3 table
-        if section == 3 and line.startswith("|") and i + 1 < len(lines) and lines[i + 1].startswith("|---"):
-            header = parse_cells(line)
-            if len(header) == 4:
-                out.append(format_row(["页面编号", "包名", "页面路径", "完整路径", "页面说明"]))
-                out.append("|---|---|---|---|---|")
-                i += 2
-                while i < len(lines) and lines[i].startswith("|"):
-                    row = parse_cells(lines[i])
-                    if len(row) >= 4 and row[0].startswith("MP-"):
-                        out.append(format_row([row[0], row[1], row[2], row[3], page_desc(row[3])]))
-                    i += 1
-                continue
-
-        # Section 4 table
-        if section == 4 and line.startswith("|") and i + 1 < len(lines) and lines[i + 1].startswith("|---"):
-            header = parse_cells(line)
-            if len(header) == 3:
-                out.append(format_row(["路由编号", "类型", "路由路径", "功能说明"]))
-                out.append("|---|---|---|---|")
-                i += 2
-                while i < len(lines) and lines[i].startswith("|"):
-                    row = parse_cells(lines[i])
-                    if len(row) >= 3 and row[0].startswith("ADM-"):
-                        out.append(format_row([row[0], row[1], row[2], admin_route_desc(row[2])]))
-                    i += 1
-                continue
-
-        # Section 5 table
-        if section == 5 and line.startswith("|") and i + 1 < len(lines) and lines[i + 1].startswith("|---"):
-            header = parse_cells(line)
-            if len(header) == 7:
-                out.append(format_row(["端别", "方法", "路径", "OperationId", "鉴权", "标签", "关联 Schema", "接口中文说明"]))
-                out.append("|---|---|---|---|---|---|---|---|")
-                i += 2
-                while i < len(lines) and lines[i].startswith("|"):
-                    row = parse_cells(lines[i])
-                    if len(row) >= 7 and row[0]:
-                        desc = api_desc(row[0], row[1], row[2], row[3])
-                        out.append(format_row([row[0], row[1], row[2], row[3], row[4], row[5], row[6], desc]))
-                    i += 1
-                continue
-
-        # Section 6 table(s): fill description column
-        if section == 6 and line.startswith("|") and i + 1 < len(lines) and lines[i + 1].startswith("|---"):
-            header = parse_cells(line)
-            if len(header) == 5 and "字段" in header[0]:
-                out.append(format_row(["字段路径", "类型", "必填", "枚举", "说明"]))
-                out.append("|---|---|---|---|---|")
-                i += 2
-                while i < len(lines) and lines[i].startswith("|"):
-                    row = parse_cells(lines[i])
-                    if len(row) >= 5 and row[0].startswith("`"):
-                        out.append(format_row([row[0], row[1], row[2], row[3], field_desc(row[0])]))
-                    i += 1
-                continue
-
-        # Section 7 table(s): add description column
-        if section == 7 and line.startswith("|") and i + 1 < len(lines) and lines[i + 1].startswith("|---"):
-            header = parse_cells(line)
-            if len(header) == 5 and header[0] in {"字段", "Field"}:
-                out.append(format_row(["字段", "类型", "必填", "枚举", "Prisma 属性", "字段说明"]))
-                out.append("|---|---|---|---|---|---|")
-                i += 2
-                while i < len(lines) and lines[i].startswith("|"):
-                    row = parse_cells(lines[i])
-                    if len(row) >= 5 and row[0].startswith("`"):
-                        out.append(format_row([row[0], row[1], row[2], row[3], row[4], field_desc(row[0])]))
-                    i += 1
-                continue
-
-        out.append(line)
-        i += 1
-
-    return "\n".join(out).rstrip() + "\n"
+        rule = match_table_rule(node.section, node.header.cells)
+        if rule is None:
+            if has_nested_table(node) or any("阅读建议" in line for line in table_lines(node)[1:]):
+                stream.push(demote_table(node))
+            else:
+                yield node
+            continue
+
+        header, rewrite_row = rule
+        rows: list[Row] = []
+        for row in node.rows:
+            cells = rewrite_row(row.cells)
+            if cells is not None:
+                rows.append(Row(cells=cells))
+        yield Table(Row(cells=header), sep_row(len(header)), rows, node.section)
+
+
+def enhance_document(text: str) -> str:
+    return render_text(annotate_nodes(iter_nodes(text.splitlines())))
 
 
 def main() -> None:
@@ -625,13 +279,25 @@ def main() -> None:
         default="docs/architecture/client-handover-mini-program-admin.md",
         help="Output markdown path",
     )
+    parser.add_argument(
+        "--translation-cache",
+        default="",
+        help="Optional translation cache file reused across runs",
+    )
     args = parser.parse_args()
 
     in_path = Path(args.input)
     out_path = Path(args.output)
+    cache_path = Path(args.translation_cache) if args.translation_cache else None
+    if cache_path is not None:
+        TRANSLATION_CACHE.load(cache_path)
+
     text = in_path.read_text(encoding="utf-8-sig")
     enhanced = enhance_document(text)
     out_path.write_text(enhanced, encoding="utf-8-sig", newline="\n")
+    if cache_path is not None:
+        TRANSLATION_CACHE.save(cache_path)
+        print(f"translation cache: {TRANSLATION_CACHE.stats()}")
     print(out_path)
 
 
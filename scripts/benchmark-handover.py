@@ -0,0 +1,352 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+交接文档工具链基准测试：
+- 以现有交接文档为模板，生成 1x / 10x / 100x 规模的合成文档（页面、接口、字段行按倍数扩充）
+- enhance_document（注释阶段）读取还原为注释前布局的合成文档，其余阶段读取合成文档本身
+- 每个阶段在独立子进程中运行，记录耗时与峰值内存（RSS）
+- 与基线文件比较，超过阈值或缺少基线即以非零状态退出；--update-baseline 刷新基线
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Iterator
+
+from handover_ir import SECTION_RE, format_row, parse_cells, section_number, sep_row
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BASELINE_FORMAT = 2
+STAGES = ("enhance_markdown", "enhance_document", "phrase_to_cn", "strip_trailing_annotation")
+SCRIPTS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPTS_DIR.parent
+DEFAULT_DOC = REPO_ROOT / "docs" / "architecture" / "client-handover-mini-program-admin.md"
+DEFAULT_BASELINE = REPO_ROOT / "docs" / "engineering" / "handover-benchmark-baseline.json"
+
+# 合成副本用的后缀词：副本中的标识符拼接后缀，得到词典未直接收录的新短语
+VARIANT_WORDS = ("Draft", "Archive", "Snapshot", "History", "Backup", "Review", "Batch", "Export", "Import", "Summary")
+PAGE_ID_RE = re.compile(r"\b(MP|ADM)-(\d+)")
+CODE_SPAN_RE = re.compile(r"`([^`\n]+)`")
+IDENTIFIER_RE = re.compile(r"[A-Za-z_][\w.\[\]]*")
+ROW_CHUNK = 4096
+PRE_ANNOTATION_STAGES = ("enhance_document",)
+
+# 仓库内的交接文档已是流水线输出：章节已重新编号、说明列已补齐，注释规则一条都不命中。
+# 注释阶段的输入按生成器布局还原：当前章节号 -> (生成器章节号, 保留的列；None 为整行保留)
+PRE_ANNOTATION_LAYOUT: dict[int, tuple[int, tuple[int, ...] | None]] = {
+    1: (3, (0, 3, 1, 1)),  # 页面编号 / 包名 / 页面路径 / 完整路径
+    2: (4, (0, 1, 2)),  # 路由编号 / 类型 / 路由路径
+    3: (4, None),
+    4: (5, (0, 1, 2, 3, 4, 5, 6)),  # 去掉接口说明
+    5: (6, (0, 1, 2, 3, 4)),
+    6: (7, (0, 1, 2, 3, 4)),  # 去掉字段说明
+}
+
+
+def load_script(name: str, filename: str) -> ModuleType:
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / filename)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"cannot load {filename}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def variant_suffix(copy: int) -> str:
+    word = VARIANT_WORDS[(copy - 1) % len(VARIANT_WORDS)]
+    round_no = (copy - 1) // len(VARIANT_WORDS)
+    return word if round_no == 0 else f"{word}{round_no + 1}"
+
+
+def vary_line(line: str, copy: int) -> str:
+    # 第 0 份保持原样；其余副本改写页面编号、接口路径、页面路径与字段标识符
+    if copy == 0:
+        return line
+    suffix = variant_suffix(copy)
+
+    def vary_code(match: re.Match[str]) -> str:
+        value = match.group(1)
+        if value.startswith("/"):
+            return f"`/v{copy + 1}{value}`"
+        if value.startswith("pages/"):
+            return f"`pages/v{copy + 1}/{value[6:]}`"
+        if IDENTIFIER_RE.fullmatch(value):
+            return f"`{value}{suffix}`"
+        return match.group(0)
+
+    line = PAGE_ID_RE.sub(lambda m: f"{m.group(1)}-{m.group(2)}-{copy}", line)
+    return CODE_SPAN_RE.sub(vary_code, line)
+
+
+def iter_synthetic_lines(template: list[str], scale: int) -> Iterator[str]:
+    # 前言（含目录）保留一份；每个 "## N." 章节的正文重复 scale 次
+    index = 0
+    while index < len(template) and not re.match(r"^##\s+\d+\.", template[index]):
+        yield template[index]
+        index += 1
+    while index < len(template):
+        heading = template[index]
+        end = index + 1
+        while end < len(template) and not re.match(r"^##\s+\d+\.", template[end]):
+            end += 1
+        body = template[index + 1 : end]
+        yield heading
+        for copy in range(scale):
+            for line in body:
+                yield vary_line(line, copy)
+        index = end
+
+
+def iter_pre_annotation_lines(lines: Iterator[str]) -> Iterator[str]:
+    columns: tuple[int, ...] | None = None
+    in_table = False
+    for line in lines:
+        number = section_number(line)
+        if number is not None:
+            section, columns = PRE_ANNOTATION_LAYOUT.get(number, (number, None))
+            yield SECTION_RE.sub(f"## {section}.", line, count=1)
+            in_table = False
+            continue
+        if not line.startswith("|"):
+            in_table = False
+            yield line
+            continue
+        cells = parse_cells(line)
+        if columns is None or len(cells) <= max(columns):
+            yield line
+        elif in_table and line.startswith("|---"):
+            yield sep_row(len(columns))
+        else:
+            yield format_row([cells[i] for i in columns])
+        in_table = True
+
+
+def write_synthetic_doc(template: list[str], scale: int, out_path: Path, *, pre_annotation: bool = False) -> int:
+    count = 0
+    lines = iter_synthetic_lines(template, scale)
+    if pre_annotation:
+        lines = iter_pre_annotation_lines(lines)
+    with out_path.open("w", encoding="utf-8-sig", newline="\n") as fh:
+        for line in lines:
+            fh.write(line)
+            fh.write("\n")
+            count += 1
+    return count
+
+
+def peak_rss_kb() -> int | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def iter_row_chunks(path: Path) -> Iterator[list[str]]:
+    chunk: list[str] = []
+    with path.open("r", encoding="utf-8-sig") as fh:
+        for raw in fh:
+            if raw.startswith("|") and not raw.startswith("|---"):
+                chunk.append(raw.rstrip("\n"))
+                if len(chunk) >= ROW_CHUNK:
+                    yield chunk
+                    chunk = []
+    if chunk:
+        yield chunk
+
+
+def run_stage(stage: str, doc_path: Path) -> dict[str, float | int | None]:
+    # 子进程入口：只计入被测函数本身的耗时，输入准备不计时
+    normalize = load_script("normalize_client_handover_cn", "normalize-client-handover-cn.py")
+
+    clock = time.perf_counter
+    elapsed = 0.0
+    items = 0
+    if stage in ("enhance_markdown", "enhance_document"):
+        text = doc_path.read_text(encoding="utf-8-sig")
+        if stage == "enhance_markdown":
+            transform = normalize.enhance_markdown
+        else:
+            transform = load_script("annotate_client_handover", "annotate-client-handover.py").enhance_document
+        items = text.count("\n")
+        start = clock()
+        transform(text)
+        elapsed = clock() - start
+    elif stage == "phrase_to_cn":
+        phrase_to_cn = normalize.phrase_to_cn
+        for chunk in iter_row_chunks(doc_path):
+            phrases = [normalize.field_base_from_path(parse_cells(row)[0]) for row in chunk if row.startswith("| `")]
+            phrases = [p for p in phrases if p]
+            start = clock()
+            for phrase in phrases:
+                phrase_to_cn(phrase)
+            elapsed += clock() - start
+            items += len(phrases)
+    elif stage == "strip_trailing_annotation":
+        strip = normalize.strip_trailing_annotation
+        for chunk in iter_row_chunks(doc_path):
+            cells = [cell for row in chunk for cell in parse_cells(row)]
+            start = clock()
+            for cell in cells:
+                strip(cell)
+            elapsed += clock() - start
+            items += len(cells)
+    else:
+        raise ValueError(f"unknown stage: {stage}")
+    return {"seconds": elapsed, "items": items, "peak_rss_kb": peak_rss_kb()}
+
+
+def measure(stage: str, doc_path: Path, repeat: int) -> dict[str, float | int | None]:
+    # 每次重复都起新进程（冷缓存，与命令行实际运行一致）；取最短耗时与最大峰值内存
+    best: dict[str, float | int | None] | None = None
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, str(Path(__file__).resolve()), "--child", stage, "--child-input", str(doc_path)],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        if best is None:
+            best = result
+            continue
+        rss = [v for v in (best["peak_rss_kb"], result["peak_rss_kb"]) if v is not None]
+        best["seconds"] = min(best["seconds"], result["seconds"])
+        best["peak_rss_kb"] = max(rss) if rss else None
+    assert best is not None
+    return best
+
+
+def load_baseline(path: Path) -> dict[str, dict[str, float | int | None]]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8-sig"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("format") != BASELINE_FORMAT:
+        return {}
+    results = payload.get("results")
+    return results if isinstance(results, dict) else {}
+
+
+def save_baseline(path: Path, results: dict[str, dict[str, float | int | None]]) -> None:
+    payload = {
+        "format": BASELINE_FORMAT,
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "results": results,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def compare(
+    key: str,
+    current: dict[str, float | int | None],
+    baseline: dict[str, dict[str, float | int | None]],
+    threshold: float,
+    noise_floor: float,
+) -> tuple[str, list[str]]:
+    base = baseline.get(key)
+    if not base:
+        return "-", [f"{key}: no baseline entry"]
+    problems: list[str] = []
+    seconds, base_seconds = current["seconds"], base.get("seconds")
+    delta = "-"
+    if isinstance(base_seconds, (int, float)) and base_seconds > 0:
+        delta = f"{(seconds / base_seconds - 1) * 100:+.1f}%"
+        if seconds > base_seconds * (1 + threshold) and seconds - base_seconds > noise_floor:
+            problems.append(f"{key}: time {base_seconds:.3f}s -> {seconds:.3f}s")
+    rss, base_rss = current["peak_rss_kb"], base.get("peak_rss_kb")
+    if isinstance(rss, int) and isinstance(base_rss, int) and base_rss > 0 and rss > base_rss * (1 + threshold):
+        problems.append(f"{key}: peak RSS {base_rss / 1024:.1f} MB -> {rss / 1024:.1f} MB")
+    return delta, problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--doc", default=str(DEFAULT_DOC), help="作为模板的交接文档")
+    parser.add_argument("--scales", default="1,10,100", help="合成文档倍数，逗号分隔")
+    parser.add_argument("--stages", default=",".join(STAGES), help="要测的阶段，逗号分隔")
+    parser.add_argument("--repeat", type=int, default=1, help="每个阶段重复次数（取最短耗时）")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="基线文件")
+    parser.add_argument("--threshold", type=float, default=0.25, help="允许的相对回退（0.25 = 25%%）")
+    parser.add_argument("--noise-floor-ms", type=float, default=20.0, help="耗时差低于该值时不判为回退")
+    parser.add_argument("--update-baseline", action="store_true", help="用本次结果覆盖基线")
+    parser.add_argument("--keep-docs", default="", help="保留合成文档的目录（可选）")
+    parser.add_argument("--child", default="", help=argparse.SUPPRESS)
+    parser.add_argument("--child-input", default="", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_stage(args.child, Path(args.child_input))))
+        return
+
+    stages = [s.strip() for s in args.stages.split(",") if s.strip()]
+    unknown = [s for s in stages if s not in STAGES]
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(unknown)}")
+    scales = [int(s) for s in args.scales.split(",") if s.strip()]
+    template = Path(args.doc).read_text(encoding="utf-8-sig").splitlines()
+    baseline_path = Path(args.baseline)
+    baseline = load_baseline(baseline_path)
+    if not baseline and not args.update_baseline:
+        print(f"[handover-bench] no baseline at {baseline_path}; run with --update-baseline to record one")
+        sys.exit(1)
+
+    results: dict[str, dict[str, float | int | None]] = {}
+    problems: list[str] = []
+    print(f"{'scale':<7}{'stage':<28}{'lines':>10}{'items':>10}{'seconds':>10}{'peak MB':>10}{'vs base':>10}")
+    with tempfile.TemporaryDirectory(prefix="handover-bench-") as tmp:
+        doc_dir = Path(args.keep_docs) if args.keep_docs else Path(tmp)
+        doc_dir.mkdir(parents=True, exist_ok=True)
+        for scale in scales:
+            docs: dict[bool, tuple[Path, int]] = {}
+            for pre_annotation in sorted({stage in PRE_ANNOTATION_STAGES for stage in stages}):
+                name = f"handover-{scale}x-pre-annotation.md" if pre_annotation else f"handover-{scale}x.md"
+                doc_path = doc_dir / name
+                line_count = write_synthetic_doc(template, scale, doc_path, pre_annotation=pre_annotation)
+                docs[pre_annotation] = (doc_path, line_count)
+            for stage in stages:
+                key = f"{scale}x/{stage}"
+                doc_path, line_count = docs[stage in PRE_ANNOTATION_STAGES]
+                current = measure(stage, doc_path, max(1, args.repeat))
+                results[key] = current
+                delta, found = compare(key, current, baseline, args.threshold, args.noise_floor_ms / 1000)
+                problems.extend(found)
+                rss = current["peak_rss_kb"]
+                rss_text = f"{rss / 1024:.1f}" if isinstance(rss, int) else "-"
+                print(
+                    f"{f'{scale}x':<7}{stage:<28}{line_count:>10}{current['items']:>10}"
+                    f"{current['seconds']:>10.3f}{rss_text:>10}{delta:>10}"
+                )
+
+    if args.update_baseline:
+        # 只覆盖本次测到的条目，其余规模/阶段的基线保留
+        save_baseline(baseline_path, {**baseline, **results})
+        print(f"[handover-bench] baseline updated: {baseline_path}")
+        return
+    if problems:
+        for problem in problems:
+            print(f"[handover-bench] regression {problem}")
+        sys.exit(1)
+    print("[handover-bench] ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+"""
+Benchmark the content bbox backends of normalize-rendered-images.py on real rendered diagrams.
+
+For every PNG both backends (NumPy and PIL) run on the same decoded RGB image; the best of
+--repeat runs is reported per file together with the speedup. Exits non-zero if the two
+backends ever disagree on a bbox.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+
+from PIL import Image
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPTS_DIR.parent
+DEFAULT_DIR = REPO_ROOT / "docs" / "architecture" / "rendered"
+
+
+def load_script(name: str, filename: str) -> ModuleType:
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / filename)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"cannot load {filename}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def best_of(fn, repeat: int) -> tuple[float, object]:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare NumPy vs PIL content bbox detection on rendered PNGs.")
+    parser.add_argument("paths", nargs="*", default=[str(DEFAULT_DIR)], help="PNG files or directories.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per backend and file; the best is reported.")
+    parser.add_argument("--tolerance", type=int, default=4, help="Same meaning as in normalize-rendered-images.py.")
+    args = parser.parse_args()
+
+    normalize = load_script("normalize_rendered_images", "normalize-rendered-images.py")
+    if normalize.np is None:
+        print("numpy is not installed; nothing to compare.", file=sys.stderr)
+        return 2
+
+    paths = normalize._iter_images([Path(p) for p in args.paths])
+    if not paths:
+        print("No PNG files found.", file=sys.stderr)
+        return 2
+
+    total_np = total_pil = 0.0
+    pixels = 0
+    mismatches = 0
+    print(f"{'file':<48}{'MPix':>7}{'numpy ms':>10}{'pil ms':>10}{'speedup':>9}")
+    for path in paths:
+        with Image.open(path) as img:
+            rgb = img.convert("RGB")
+        bg_rgb = normalize._sample_background_rgb(rgb)
+        t_np, bbox_np = best_of(lambda: normalize._content_bbox_numpy(rgb, bg_rgb, args.tolerance), args.repeat)
+        t_pil, bbox_pil = best_of(lambda: normalize._content_bbox_pil(rgb, bg_rgb, args.tolerance), args.repeat)
+        total_np += t_np
+        total_pil += t_pil
+        pixels += rgb.width * rgb.height
+        flag = ""
+        if bbox_np != bbox_pil:
+            mismatches += 1
+            flag = f"  MISMATCH numpy={bbox_np} pil={bbox_pil}"
+        print(
+            f"{path.name:<48}{rgb.width * rgb.height / 1e6:>7.1f}{t_np * 1000:>10.1f}{t_pil * 1000:>10.1f}"
+            f"{t_pil / t_np if t_np else 0:>8.1f}x{flag}"
+        )
+        rgb.close()
+
+    print(
+        f"Total: {len(paths)} files, {pixels / 1e6:.0f} MPix, numpy {total_np:.2f}s, pil {total_pil:.2f}s, "
+        f"speedup {total_pil / total_np if total_np else 0:.1f}x, mismatches {mismatches}"
+    )
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -17,6 +17,7 @@ param(
   [switch]$UseVirtualTimeBudget,
   [switch]$IncludePdf,
   [switch]$MergeAll,
+  [ValidateSet("fast","balanced","smallest","smallest-palette")][string]$MergePngProfile = "smallest",
   [switch]$Zip,
   [switch]$ListOnly,
   [string[]]$PageFilter = @(),
@@ -381,7 +382,7 @@ if ($MergeAll) {
   }
 
   $outBoard = Join-Path $outDirAbs "ui-all.png"
-  python $mergeScript --input-dir $outDirAbs --output $outBoard
+  python $mergeScript --input-dir $outDirAbs --output $outBoard --png-profile $MergePngProfile
   if ($LASTEXITCODE -ne 0) { throw "merge-ui-screenshots.py failed." }
   Write-Host "[capture] Board: $outBoard"
 }
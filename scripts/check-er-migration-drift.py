@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+离线检查 ER 文档与数据库迁移是否一致（无需数据库连接）：
+- 按目录名顺序回放 apps/api/prisma/migrations，重建每张表的列
+- 与 docs/architecture/er-diagram.mmd（或 --prisma 指定的 schema）比较
+- 报告缺失/多余的表与列、类型不一致；--fail-on 指定哪些类别使退出码非零
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from er_diagram.drift import CATEGORIES, diff_model
+from er_diagram.migrations import migration_dirs, replay_migrations
+from er_diagram.pipeline import load_model
+
+PREFIX = "[er-drift]"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--input", default="docs/architecture/er-diagram.mmd", help="ER mmd")
+    parser.add_argument("--prisma", default="", help="改为比较 Prisma schema（例如 apps/api/prisma/schema.prisma）")
+    parser.add_argument("--migrations", default="apps/api/prisma/migrations", help="Prisma 迁移目录")
+    parser.add_argument(
+        "--fail-on",
+        default="missing",
+        help=f"出现哪些差异时退出码为 1，逗号分隔（{', '.join(CATEGORIES)}；any 为全部，none 只报告）",
+    )
+    parser.add_argument("--verbose", action="store_true", help="逐条列出 extra（ER 未收录的表/列）")
+    args = parser.parse_args()
+
+    fail_on = {x.strip() for x in args.fail_on.split(",") if x.strip()}
+    if "any" in fail_on:
+        fail_on = set(CATEGORIES)
+    fail_on.discard("none")
+    unknown = fail_on - set(CATEGORIES)
+    if unknown:
+        parser.error(f"unknown --fail-on categories: {', '.join(sorted(unknown))}")
+
+    started = time.perf_counter()
+    migrations_dir = Path(args.migrations)
+    tables = replay_migrations(migrations_dir)
+    if args.prisma:
+        model = load_model(prisma_path=Path(args.prisma))
+    else:
+        model = load_model(mmd_path=Path(args.input))
+    report = diff_model(model, tables)
+    elapsed = time.perf_counter() - started
+
+    for name in report.missing_tables:
+        print(f"{PREFIX} missing table: {name}")
+    for table, column in report.missing_columns:
+        print(f"{PREFIX} missing column: {table}.{column}")
+    for table, column, er_type, db_type in report.type_mismatches:
+        print(f"{PREFIX} type mismatch: {table}.{column} er={er_type} migrations={db_type}")
+    if args.verbose or "extra" in fail_on:
+        for name in report.extra_tables:
+            print(f"{PREFIX} extra table: {name}")
+        for table, column in report.extra_columns:
+            print(f"{PREFIX} extra column: {table}.{column}")
+
+    counts = report.counts()
+    print(
+        f"{PREFIX} migrations={len(migration_dirs(migrations_dir))} tables={len(tables)} entities={len(model.entities)} "
+        + " ".join(f"{k}={v}" for k, v in counts.items())
+        + f" elapsed={elapsed * 1000:.0f}ms"
+    )
+    failed = sorted(k for k in fail_on if counts[k])
+    if failed:
+        print(f"{PREFIX} drift detected ({', '.join(failed)})", file=sys.stderr)
+        return 1
+    print(f"{PREFIX} ok")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
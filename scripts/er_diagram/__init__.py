@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+"""
+ER 图生成共用包（单次解析，多路渲染）：
+- model：ErModel / EntityDef / FieldDef / RelationDef
+- mmd / prisma：两个前端，分别读取 er-diagram.mmd 与 schema.prisma（后者按文件哈希缓存）
+- render_cn / render_brief：中文 mmd 与甲方讲解 Markdown 渲染器
+- pipeline：渲染器登记表与加载/输出入口（见 scripts/generate-er-diagrams.py）
+"""
+
+from er_diagram.model import EntityDef, ErModel, FieldDef, RelationDef
+
+__all__ = ["EntityDef", "ErModel", "FieldDef", "RelationDef"]
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+ER 字段术语覆盖率：直接基于 ErModel 统计，不需要渲染。
+
+- 先把所有实体的字段名建成索引（字段名 -> 出现次数），每个不同的字段名只分析一次
+- 字段名命中整词表（field_exact）即视为已覆盖；否则按 "_" 切词，查不到词表的词即回退为英文原文
+- 缺词按出现次数排序，并给出补上该词后可完全中文化的字段数（unlocks）
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+
+from er_diagram.model import ErModel
+
+
+@dataclass
+class MissingToken:
+    token: str
+    occurrences: int  # 含该词且未覆盖的字段出现次数
+    unlocks: int  # 只缺该词的字段出现次数（补词后即完全覆盖）
+    examples: list[str] = field(default_factory=list)
+
+
+@dataclass
+class CoverageReport:
+    field_total: int
+    field_covered: int
+    distinct_total: int
+    distinct_covered: int
+    missing: list[MissingToken]
+    tables_missing: list[str]
+
+    @property
+    def ratio(self) -> float:
+        return self.field_covered / self.field_total if self.field_total else 1.0
+
+
+def index_fields(model: ErModel) -> Counter[str]:
+    return Counter(f.name for ent in model.entities for f in ent.fields)
+
+
+def missing_tokens(name: str, exact: dict[str, str], tokens: dict[str, str]) -> list[str]:
+    # 与 render_cn / render_brief 的 field_cn 一致：整词优先，其次逐词（小写）查表
+    if name in exact:
+        return []
+    return [w for w in name.split("_") if w and w.lower() not in tokens]
+
+
+def analyze(
+    model: ErModel,
+    exact: dict[str, str],
+    tokens: dict[str, str],
+    table_cn: dict[str, str],
+    *,
+    index: Counter[str] | None = None,
+    max_examples: int = 3,
+) -> CoverageReport:
+    counts = index if index is not None else index_fields(model)
+    by_token: dict[str, MissingToken] = {}
+    field_covered = 0
+    distinct_covered = 0
+    for name, count in counts.items():
+        missing = missing_tokens(name, exact, tokens)
+        if not missing:
+            field_covered += count
+            distinct_covered += 1
+            continue
+        distinct = set(w.lower() for w in missing)
+        for key in distinct:
+            entry = by_token.get(key)
+            if entry is None:
+                entry = by_token[key] = MissingToken(token=key, occurrences=0, unlocks=0)
+            entry.occurrences += count
+            if len(distinct) == 1:
+                entry.unlocks += count
+            if len(entry.examples) < max_examples:
+                entry.examples.append(name)
+
+    ranked = sorted(by_token.values(), key=lambda t: (-t.occurrences, -t.unlocks, t.token))
+    tables_missing = [ent.name for ent in model.entities if ent.name not in table_cn]
+    return CoverageReport(
+        field_total=sum(counts.values()),
+        field_covered=field_covered,
+        distinct_total=len(counts),
+        distinct_covered=distinct_covered,
+        missing=ranked,
+        tables_missing=tables_missing,
+    )
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""ER 模型与迁移回放结果的差异：缺失/多余的表与列、类型不一致。"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from er_diagram.migrations import TableDef
+from er_diagram.model import ErModel
+
+CATEGORIES = ("missing", "extra", "type")
+
+
+@dataclass
+class DriftReport:
+    # missing：ER 中有、迁移回放后不存在；extra：迁移中有、ER 未收录
+    missing_tables: list[str] = field(default_factory=list)
+    extra_tables: list[str] = field(default_factory=list)
+    missing_columns: list[tuple[str, str]] = field(default_factory=list)
+    extra_columns: list[tuple[str, str]] = field(default_factory=list)
+    type_mismatches: list[tuple[str, str, str, str]] = field(default_factory=list)
+
+    def counts(self) -> dict[str, int]:
+        return {
+            "missing": len(self.missing_tables) + len(self.missing_columns),
+            "extra": len(self.extra_tables) + len(self.extra_columns),
+            "type": len(self.type_mismatches),
+        }
+
+
+def diff_model(model: ErModel, tables: dict[str, TableDef]) -> DriftReport:
+    report = DriftReport()
+    # ER 实体名是大写表名；按小写表名索引到回放得到的列表
+    seen: set[str] = set()
+    for ent in model.entities:
+        key = ent.name.lower()
+        seen.add(key)
+        table = tables.get(key)
+        if table is None:
+            report.missing_tables.append(ent.name)
+            continue
+        documented: set[str] = set()
+        for f in ent.fields:
+            documented.add(f.name)
+            db_type = table.columns.get(f.name)
+            if db_type is None:
+                report.missing_columns.append((ent.name, f.name))
+            elif db_type != f.ftype:
+                report.type_mismatches.append((ent.name, f.name, f.ftype, db_type))
+        for column in table.columns:
+            if column not in documented:
+                report.extra_columns.append((ent.name, column))
+    for name in tables:
+        if name not in seen:
+            report.extra_tables.append(name.upper())
+    return report
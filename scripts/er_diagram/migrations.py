@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""
+离线回放 apps/api/prisma/migrations，重建每张表的列（不连接数据库）。
+
+只解释影响表/列结构的语句，其余（索引、枚举、数据修复、约束）忽略：
+- CREATE TABLE [IF NOT EXISTS]
+- ALTER TABLE ... ADD/DROP/RENAME COLUMN、ALTER COLUMN ... TYPE、RENAME TO、ADD ... PRIMARY KEY
+- DROP TABLE [IF EXISTS] a, b [CASCADE]
+DO $$ ... $$ 块内的语句按普通语句处理。
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+IDENT = r'(?:"[^"]+"|[A-Za-z_][A-Za-z0-9_]*)'
+
+CREATE_TABLE_RE = re.compile(rf"^CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?((?:{IDENT}\.)?{IDENT})\s*\((.*)\)\s*$", re.I | re.S)
+ALTER_TABLE_RE = re.compile(rf"^ALTER\s+TABLE\s+(?:IF\s+EXISTS\s+)?(?:ONLY\s+)?((?:{IDENT}\.)?{IDENT})\s+(.*)$", re.I | re.S)
+DROP_TABLE_RE = re.compile(r"^DROP\s+TABLE\s+(?:IF\s+EXISTS\s+)?(.*?)(?:\s+(?:CASCADE|RESTRICT))?\s*$", re.I | re.S)
+BLOCK_PREFIX_RE = re.compile(r"^(?:DO\s+\$\$\s*)?(?:BEGIN\s+)?", re.I)
+
+ADD_COLUMN_RE = re.compile(rf"^ADD\s+(?:COLUMN\s+)?(?:IF\s+NOT\s+EXISTS\s+)?({IDENT})\s+(.+)$", re.I | re.S)
+DROP_COLUMN_RE = re.compile(rf"^DROP\s+(?:COLUMN\s+)?(?:IF\s+EXISTS\s+)?({IDENT})(?:\s+(?:CASCADE|RESTRICT))?$", re.I)
+RENAME_COLUMN_RE = re.compile(rf"^RENAME\s+(?:COLUMN\s+)?({IDENT})\s+TO\s+({IDENT})$", re.I)
+RENAME_TABLE_RE = re.compile(rf"^RENAME\s+TO\s+({IDENT})$", re.I)
+ALTER_TYPE_RE = re.compile(rf"^ALTER\s+(?:COLUMN\s+)?({IDENT})\s+(?:SET\s+DATA\s+)?TYPE\s+(.+?)(?:\s+USING\s+.*)?$", re.I | re.S)
+PRIMARY_KEY_RE = re.compile(r"PRIMARY\s+KEY\s*\(([^)]*)\)", re.I)
+CONSTRAINT_START_RE = re.compile(r"^(?:CONSTRAINT|PRIMARY\s+KEY|UNIQUE|FOREIGN\s+KEY|CHECK|EXCLUDE)\b", re.I)
+TYPE_END_RE = re.compile(
+    r"\s+(?:NOT\s+NULL|NULL|DEFAULT|PRIMARY\s+KEY|UNIQUE|REFERENCES|CHECK|CONSTRAINT|COLLATE|GENERATED)\b.*$",
+    re.I | re.S,
+)
+
+# SQL 列类型 -> ER 图类型；未登记的带引号类型视为枚举（string）
+SQL_TYPES = {
+    "uuid": "uuid",
+    "text": "string",
+    "varchar": "string",
+    "character varying": "string",
+    "char": "string",
+    "character": "string",
+    "citext": "string",
+    "timestamp": "datetime",
+    "timestamp without time zone": "datetime",
+    "timestamp with time zone": "datetime",
+    "timestamptz": "datetime",
+    "date": "date",
+    "integer": "int",
+    "int": "int",
+    "int4": "int",
+    "smallint": "int",
+    "serial": "int",
+    "bigint": "bigint",
+    "int8": "bigint",
+    "bigserial": "bigint",
+    "double precision": "float",
+    "real": "float",
+    "decimal": "decimal",
+    "numeric": "decimal",
+    "boolean": "boolean",
+    "bool": "boolean",
+    "jsonb": "json",
+    "json": "json",
+    "bytea": "bytes",
+}
+
+
+@dataclass
+class TableDef:
+    # 列名 -> ER 类型；dict 保持建表/加列顺序
+    columns: dict[str, str] = field(default_factory=dict)
+    primary_key: list[str] = field(default_factory=list)
+
+
+def unquote(name: str) -> str:
+    name = name.strip()
+    if "." in name and not (name.startswith('"') and name.endswith('"') and name.count('"') == 2):
+        name = name.rsplit(".", 1)[1]
+    return name[1:-1] if name.startswith('"') and name.endswith('"') else name.lower()
+
+
+def er_type(sql_type: str) -> str:
+    raw = sql_type.strip()
+    if raw.startswith('"'):
+        return "string"
+    base = re.sub(r"\(.*?\)", "", raw).strip().lower()
+    is_array = base.endswith("[]")
+    base = base.removesuffix("[]").strip()
+    mapped = SQL_TYPES.get(base, base.replace(" ", "_"))
+    return f"{mapped}_array" if is_array else mapped
+
+
+def split_statements(sql: str) -> Iterator[str]:
+    # 按顶层分号切分；跳过 -- 注释，单引号字符串与双引号标识符内的分号不切分
+    buf: list[str] = []
+    i = 0
+    n = len(sql)
+    start = 0
+    while i < n:
+        ch = sql[i]
+        if ch == "-" and sql.startswith("--", i):
+            buf.append(sql[start:i])
+            nl = sql.find("\n", i)
+            i = n if nl < 0 else nl
+            start = i
+            continue
+        if ch == "'" or ch == '"':
+            end = sql.find(ch, i + 1)
+            while end >= 0 and ch == "'" and sql.startswith("''", end):
+                end = sql.find(ch, end + 2)
+            i = n if end < 0 else end + 1
+            continue
+        if ch == ";":
+            buf.append(sql[start:i])
+            stmt = "".join(buf).strip()
+            if stmt:
+                yield stmt
+            buf = []
+            i += 1
+            start = i
+            continue
+        i += 1
+    buf.append(sql[start:])
+    stmt = "".join(buf).strip()
+    if stmt:
+        yield stmt
+
+
+def split_top_level(text: str) -> list[str]:
+    # 按不在括号/引号内的逗号切分
+    parts: list[str] = []
+    depth = 0
+    quote = ""
+    start = 0
+    for i, ch in enumerate(text):
+        if quote:
+            if ch == quote:
+                quote = ""
+        elif ch in "'\"":
+            quote = ch
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            parts.append(text[start:i].strip())
+            start = i + 1
+    tail = text[start:].strip()
+    if tail:
+        parts.append(tail)
+    return parts
+
+
+def _column_type(rest: str) -> str:
+    return er_type(TYPE_END_RE.sub("", rest))
+
+
+def _apply_create(tables: dict[str, TableDef], name: str, body: str) -> None:
+    table = tables.setdefault(name, TableDef())
+    for item in split_top_level(body):
+        if CONSTRAINT_START_RE.match(item):
+            m = PRIMARY_KEY_RE.search(item)
+            if m:
+                table.primary_key = [unquote(x) for x in m.group(1).split(",")]
+            continue
+        m = re.match(rf"^({IDENT})\s+(.+)$", item, re.S)
+        if m:
+            table.columns[unquote(m.group(1))] = _column_type(m.group(2))
+            if re.search(r"\bPRIMARY\s+KEY\b", m.group(2), re.I):
+                table.primary_key = [unquote(m.group(1))]
+
+
+def _apply_alter(tables: dict[str, TableDef], name: str, actions: str) -> None:
+    for action in split_top_level(actions):
+        m = RENAME_TABLE_RE.match(action)
+        if m:
+            if name in tables:
+                tables[unquote(m.group(1))] = tables.pop(name)
+            return
+        table = tables.get(name)
+        if table is None:
+            continue
+        m = ADD_COLUMN_RE.match(action)
+        if m and not CONSTRAINT_START_RE.match(action[3:].lstrip()):
+            table.columns[unquote(m.group(1))] = _column_type(m.group(2))
+            continue
+        if re.match(r"^ADD\s+", action, re.I):
+            pk = PRIMARY_KEY_RE.search(action)
+            if pk:
+                table.primary_key = [unquote(x) for x in pk.group(1).split(",")]
+            continue
+        m = DROP_COLUMN_RE.match(action)
+        if m and not re.match(r"^DROP\s+CONSTRAINT\b", action, re.I):
+            table.columns.pop(unquote(m.group(1)), None)
+            continue
+        m = RENAME_COLUMN_RE.match(action)
+        if m:
+            old, new = unquote(m.group(1)), unquote(m.group(2))
+            if old in table.columns:
+                # 重命名保持列的原有位置
+                table.columns = {new if k == old else k: v for k, v in table.columns.items()}
+            continue
+        m = ALTER_TYPE_RE.match(action)
+        if m:
+            col = unquote(m.group(1))
+            if col in table.columns:
+                table.columns[col] = er_type(m.group(2))
+
+
+def apply_sql(tables: dict[str, TableDef], sql: str) -> None:
+    for stmt in split_statements(sql):
+        stmt = BLOCK_PREFIX_RE.sub("", stmt, count=1)
+        head = stmt[:12].upper()
+        if head.startswith("CREATE TABLE"):
+            m = CREATE_TABLE_RE.match(stmt)
+            if m:
+                _apply_create(tables, unquote(m.group(1)), m.group(2))
+        elif head.startswith("ALTER TABLE"):
+            m = ALTER_TABLE_RE.match(stmt)
+            if m:
+                _apply_alter(tables, unquote(m.group(1)), m.group(2))
+        elif head.startswith("DROP TABLE"):
+            m = DROP_TABLE_RE.match(stmt)
+            if m:
+                for name in split_top_level(m.group(1)):
+                    tables.pop(unquote(name), None)
+
+
+def migration_dirs(migrations_dir: Path) -> list[Path]:
+    # Prisma 按目录名（时间戳前缀）顺序应用
+    return sorted(p for p in migrations_dir.iterdir() if p.is_dir() and (p / "migration.sql").is_file())
+
+
+def replay_migrations(migrations_dir: Path) -> dict[str, TableDef]:
+    tables: dict[str, TableDef] = {}
+    for path in migration_dirs(migrations_dir):
+        apply_sql(tables, (path / "migration.sql").read_text(encoding="utf-8-sig"))
+    return tables
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Mermaid erDiagram 前端：解析 docs/architecture/er-diagram.mmd 为 ErModel。
+
+逐行按缩进与首字符分派，每类行只试一个预编译正则：
+- 缩进 2、首字符 "}"：实体结束
+- 缩进 2、以 "{" 结尾：实体开始；否则按关系行匹配
+- 缩进 4（实体内）：字段
+关系支持 Mermaid 全部基数写法（||、|o、}|、}o 与 ||、o|、|{、o{ 的组合，-- 或 ..）。
+"""
+
+from __future__ import annotations
+
+import re
+
+from er_diagram.model import EntityDef, ErModel, FieldDef, RelationDef
+
+ENTITY_RE = re.compile(r"([A-Z0-9_]+)\s*\{")
+FIELD_RE = re.compile(r"([a-zA-Z0-9_]+)\s+([a-zA-Z0-9_]+)(?:\s+([A-Z ]+))?")
+CARDINALITY = r"[|}][|o](?:--|\.\.)[|o][|{]"
+RELATION_RE = re.compile(rf"([A-Z0-9_]+)\s+({CARDINALITY})\s+([A-Z0-9_]+)\s*:\s*([a-zA-Z0-9_]+|\"[^\"]*\")")
+KEY_TAGS = frozenset({"PK", "FK"})
+
+
+def parse_er_mmd(text: str) -> ErModel:
+    init_line = ""
+    entities: list[EntityDef] = []
+    relations: list[RelationDef] = []
+    fields: list[FieldDef] | None = None  # 非 None 表示位于实体块内
+    entity_match = ENTITY_RE.fullmatch
+    field_match = FIELD_RE.fullmatch
+    relation_match = RELATION_RE.fullmatch
+
+    for raw in text.splitlines():
+        line = raw.rstrip()
+        body = line.lstrip()
+        if not body:
+            continue
+        if not init_line and body.startswith("%%{init:"):
+            init_line = raw
+        indent = len(line) - len(body)
+
+        if fields is not None:
+            # 实体块内只认字段与结束行，其余行（含关系）忽略
+            if indent == 4:
+                m = field_match(body)
+                if m:
+                    ftype, name, tags = m.groups()
+                    fields.append(FieldDef(ftype, name, [x for x in tags.split() if x in KEY_TAGS] if tags else []))
+            elif indent == 2 and body == "}":
+                fields = None
+            continue
+
+        if indent == 2:
+            if body[-1] == "{":
+                m = entity_match(body)
+                if m:
+                    fields = []
+                    entities.append(EntityDef(name=m.group(1), fields=fields))
+                    continue
+            m = relation_match(body)
+            if m:
+                relations.append(RelationDef(*m.groups()))
+    return ErModel(init_line=init_line, entities=entities, relations=relations)
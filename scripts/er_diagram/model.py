@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""ER 图的内存模型：实体、字段、关系。"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class FieldDef:
+    ftype: str
+    name: str
+    key_tags: list[str]
+
+
+@dataclass
+class EntityDef:
+    name: str
+    fields: list[FieldDef]
+
+
+@dataclass
+class RelationDef:
+    left: str
+    card: str
+    right: str
+    label: str
+
+
+@dataclass
+class ErModel:
+    init_line: str
+    entities: list[EntityDef]
+    relations: list[RelationDef]
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+单次解析、多路渲染：
+- 从 er-diagram.mmd 或 schema.prisma 构建一次 ErModel
+- 按名称选择渲染器（中文 mmd、甲方讲解 Markdown ……），在同一进程内依次输出
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, TextIO
+
+from er_diagram.mmd import parse_er_mmd
+from er_diagram.model import ErModel
+from er_diagram.prisma import load_prisma_model
+from er_diagram.render_brief import write_markdown
+from er_diagram.render_cn import write_cn_mmd
+
+
+@dataclass(frozen=True)
+class Renderer:
+    write: Callable[[ErModel, TextIO], None]
+    default_output: str
+
+
+# 新增输出时在此登记；渲染器直接写入打开的输出文件
+RENDERERS: dict[str, Renderer] = {
+    "cn-mmd": Renderer(write_cn_mmd, "docs/architecture/er-diagram-cn.mmd"),
+    "brief": Renderer(write_markdown, "docs/architecture/er-diagram-client-brief.md"),
+}
+
+
+def default_prisma_cache(schema_path: Path) -> Path:
+    return schema_path.with_name(schema_path.name + ".er-cache.json")
+
+
+def load_model(mmd_path: Path | None = None, prisma_path: Path | None = None, prisma_cache: Path | None = None) -> ErModel:
+    if prisma_path is not None:
+        model, cached = load_prisma_model(prisma_path, prisma_cache)
+        print(f"prisma: entities={len(model.entities)} relations={len(model.relations)} cache={'hit' if cached else 'miss'}")
+        return model
+    if mmd_path is None:
+        raise ValueError("mmd_path or prisma_path is required")
+    return parse_er_mmd(mmd_path.read_text(encoding="utf-8-sig"))
+
+
+def write_output(name: str, model: ErModel, out_path: Path) -> None:
+    with out_path.open("w", encoding="utf-8-sig", newline="\n") as out:
+        RENDERERS[name].write(model, out)
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""
+Prisma schema 前端：把 schema.prisma 直接编译为 EntityDef / FieldDef / RelationDef。
+
+- 实体名取 @@map 表名（大写）；字段名取 @map 列名，类型按 Prisma 标量映射为 ER 图类型，枚举记为 string
+- PK：@id 或 @@id；FK：出现在任一 @relation(fields: [...]) 中的标量字段
+- 关系由持有外键的一侧生成：被引用实体 ||--o{ 外键实体；外键字段唯一时为 ||--||
+- 解析结果可按 schema 文件哈希缓存为 JSON，schema 未变化时跳过解析
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from er_diagram.model import EntityDef, ErModel, FieldDef, RelationDef
+
+CACHE_FORMAT = 1
+
+BLOCK_RE = re.compile(r"^(model|enum|type|view)\s+(\w+)\s*\{\s*$")
+FIELD_RE = re.compile(r"^(\w+)\s+(\w+)(\[\])?(\?)?(?:\s+(.*))?$")
+MAP_RE = re.compile(r'(?<!@)@map\(\s*"([^"]+)"\s*\)')
+TABLE_MAP_RE = re.compile(r'^@@map\(\s*"([^"]+)"\s*\)')
+BLOCK_KEYS_RE = re.compile(r"^@@(id|unique)\(\s*(?:fields:\s*)?\[([^\]]*)\]")
+RELATION_FIELDS_RE = re.compile(r"\bfields:\s*\[([^\]]*)\]")
+ID_RE = re.compile(r"(?<!@)@id\b")
+UNIQUE_RE = re.compile(r"(?<!@)@unique\b")
+DB_TYPE_RE = re.compile(r"@db\.(\w+)")
+
+SCALAR_TYPES = {
+    "String": "string",
+    "Int": "int",
+    "BigInt": "bigint",
+    "Float": "float",
+    "Decimal": "decimal",
+    "Boolean": "boolean",
+    "DateTime": "datetime",
+    "Json": "json",
+    "Bytes": "bytes",
+}
+
+# @db 原生类型对展示类型的细化
+DB_TYPES = {
+    "Uuid": "uuid",
+    "Date": "date",
+}
+
+
+@dataclass
+class _Column:
+    name: str
+    column: str
+    ftype: str
+    is_id: bool
+    is_unique: bool
+
+
+@dataclass
+class _Relation:
+    name: str
+    target: str
+    fields: list[str]
+
+
+@dataclass
+class _Model:
+    name: str
+    table: str = ""
+    columns: list[_Column] = field(default_factory=list)
+    relations: list[_Relation] = field(default_factory=list)
+    id_fields: list[str] = field(default_factory=list)
+    unique_sets: list[frozenset[str]] = field(default_factory=list)
+
+
+def strip_comment(line: str) -> str:
+    # 只去掉引号外的 // 注释（默认值里可能出现 "http://..."）
+    quoted = False
+    for i, ch in enumerate(line):
+        if ch == '"':
+            quoted = not quoted
+        elif ch == "/" and not quoted and line.startswith("//", i):
+            return line[:i]
+    return line
+
+
+def snake_case(name: str) -> str:
+    return re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", name).lower()
+
+
+def _split_names(raw: str) -> list[str]:
+    return [x.strip() for x in raw.split(",") if x.strip()]
+
+
+def _parse_blocks(text: str) -> tuple[list[_Model], set[str], set[str]]:
+    models: list[_Model] = []
+    enums: set[str] = set()
+    composites: set[str] = set()
+    lines = [line for line in (strip_comment(raw).strip() for raw in text.splitlines()) if line]
+    # 第一遍先收集 enum / type 名：它们可以声明在引用它们的 model 之后
+    for line in lines:
+        m = BLOCK_RE.match(line)
+        if m and m.group(1) == "enum":
+            enums.add(m.group(2))
+        elif m and m.group(1) == "type":
+            composites.add(m.group(2))
+    current: _Model | None = None
+    kind = ""
+    for line in lines:
+        if not kind:
+            m = BLOCK_RE.match(line)
+            if m:
+                kind = m.group(1)
+                if kind in ("model", "view"):
+                    current = _Model(name=m.group(2))
+                    models.append(current)
+            continue
+        if line == "}":
+            kind = ""
+            current = None
+            continue
+        if current is None:
+            continue
+        if line.startswith("@@"):
+            m = TABLE_MAP_RE.match(line)
+            if m:
+                current.table = m.group(1)
+                continue
+            m = BLOCK_KEYS_RE.match(line)
+            if m:
+                names = _split_names(m.group(2))
+                if m.group(1) == "id":
+                    current.id_fields = names
+                current.unique_sets.append(frozenset(names))
+            continue
+        m = FIELD_RE.match(line)
+        if not m:
+            continue
+        name, ftype, is_list, _, attrs = m.groups()
+        attrs = attrs or ""
+        if "@relation" in attrs or (ftype not in SCALAR_TYPES and ftype not in enums and ftype not in composites):
+            # 关系字段：只有持有 fields: [...] 的一侧产生关系；另一侧（含列表）是反向引用
+            if not is_list:
+                fk = RELATION_FIELDS_RE.search(attrs)
+                if fk:
+                    current.relations.append(_Relation(name=name, target=ftype, fields=_split_names(fk.group(1))))
+            continue
+        m_map = MAP_RE.search(attrs)
+        m_db = DB_TYPE_RE.search(attrs)
+        if ftype in SCALAR_TYPES:
+            mapped = SCALAR_TYPES[ftype]
+        elif ftype in enums:
+            mapped = "string"
+        else:
+            mapped = "json"
+        if m_db and m_db.group(1) in DB_TYPES:
+            mapped = DB_TYPES[m_db.group(1)]
+        if is_list:
+            mapped = f"{mapped}_array"
+        column = _Column(
+            name=name,
+            column=m_map.group(1) if m_map else name,
+            ftype=mapped,
+            is_id=bool(ID_RE.search(attrs)),
+            is_unique=bool(UNIQUE_RE.search(attrs)),
+        )
+        current.columns.append(column)
+    return models, enums, composites
+
+
+def entity_name(model: _Model) -> str:
+    return (model.table or snake_case(model.name)).upper()
+
+
+def compile_schema(text: str) -> tuple[list[EntityDef], list[RelationDef]]:
+    models, _, _ = _parse_blocks(text)
+    by_name = {m.name: m for m in models}
+
+    entities: list[EntityDef] = []
+    relations: list[RelationDef] = []
+    for model in models:
+        fk_fields = {name for rel in model.relations for name in rel.fields}
+        pk_fields = set(model.id_fields) | {c.name for c in model.columns if c.is_id}
+        fields: list[FieldDef] = []
+        for col in model.columns:
+            key_tags: list[str] = []
+            if col.name in pk_fields:
+                key_tags.append("PK")
+            if col.name in fk_fields:
+                key_tags.append("FK")
+            fields.append(FieldDef(ftype=col.ftype, name=col.column, key_tags=key_tags))
+        entities.append(EntityDef(name=entity_name(model), fields=fields))
+
+        single_unique = {c.name for c in model.columns if c.is_id or c.is_unique}
+        for rel in model.relations:
+            target = by_name.get(rel.target)
+            if target is None:
+                continue
+            keys = frozenset(rel.fields)
+            one_to_one = (len(rel.fields) == 1 and rel.fields[0] in single_unique) or keys in model.unique_sets
+            relations.append(
+                RelationDef(
+                    left=entity_name(target),
+                    card="||--||" if one_to_one else "||--o{",
+                    right=entity_name(model),
+                    label=snake_case(rel.name),
+                )
+            )
+    return entities, relations
+
+
+def _engine_version() -> str:
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(Path(__file__).read_bytes())
+    digest.update(Path(__file__).with_name("model.py").read_bytes())
+    return digest.hexdigest()
+
+
+def _dump(entities: list[EntityDef], relations: list[RelationDef]) -> dict:
+    return {
+        "entities": [[e.name, [[f.ftype, f.name, f.key_tags] for f in e.fields]] for e in entities],
+        "relations": [[r.left, r.card, r.right, r.label] for r in relations],
+    }
+
+
+def _restore(payload: dict) -> tuple[list[EntityDef], list[RelationDef]]:
+    entities = [
+        EntityDef(name=name, fields=[FieldDef(ftype=t, name=n, key_tags=list(tags)) for t, n, tags in fields])
+        for name, fields in payload["entities"]
+    ]
+    relations = [RelationDef(left=l, card=c, right=r, label=lab) for l, c, r, lab in payload["relations"]]
+    return entities, relations
+
+
+def load_prisma_model(path: Path, cache_path: Path | None = None) -> tuple[ErModel, bool]:
+    """解析 schema.prisma；第二个返回值表示是否命中缓存。"""
+    data = path.read_bytes()
+    source_hash = hashlib.blake2b(data, digest_size=16).hexdigest()
+    engine = _engine_version()
+
+    if cache_path is not None and cache_path.exists():
+        try:
+            payload = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            payload = None
+        if (
+            isinstance(payload, dict)
+            and payload.get("format") == CACHE_FORMAT
+            and payload.get("engine") == engine
+            and payload.get("source") == source_hash
+        ):
+            entities, relations = _restore(payload)
+            return ErModel(init_line="", entities=entities, relations=relations), True
+
+    entities, relations = compile_schema(data.decode("utf-8-sig"))
+    if cache_path is not None:
+        payload = {"format": CACHE_FORMAT, "engine": engine, "source": source_hash, **_dump(entities, relations)}
+        tmp = cache_path.with_name(cache_path.name + ".tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, cache_path)
+    return ErModel(init_line="", entities=entities, relations=relations), False
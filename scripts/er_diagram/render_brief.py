@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+《ER 图专项讲解（甲方评审版）》Markdown 渲染器：
+- 流式写出（write_markdown），逐行写入目标文件，不在内存中拼接整篇文档
+- 实体序号、业务域与说明按实体预先计算，字段中文注释按字段名缓存，整体线性于字段数
+"""
+
+from __future__ import annotations
+
+import io
+from functools import lru_cache
+from typing import TextIO
+
+from er_diagram.model import ErModel
+from glossary import load_table
+
+TABLE_CN = load_table("er.table")
+DOMAIN_MAP = load_table("er_brief.table_domain")
+REL_LABEL_CN = load_table("er.rel_label")
+TOKEN_CN = load_table("er_brief.token")
+FIELD_EXACT_CN = load_table("er_brief.field_exact")
+CARDINALITY_CN = load_table("er_brief.cardinality")
+
+CORE_TRADE_TABLES = frozenset({"LISTINGS", "ORDERS", "PAYMENTS", "CONTRACTS", "SETTLEMENTS"})
+ACCOUNT_TABLES = frozenset({"USERS", "RBAC_ROLES", "RBAC_USER_ROLES", "USER_VERIFICATIONS"})
+GOVERNANCE_TABLES = frozenset({"AUDIT_LOGS", "IDEMPOTENCY_KEYS", "SYSTEM_CONFIGS"})
+
+INTRO = """# ER 图专项讲解（甲方评审版）
+
+## 1. 图文件说明
+
+- 图文件：`docs/architecture/er-diagram-cn.mmd`
+- 渲染图：`docs/architecture/rendered/er-diagram.png`
+- 目标：用于甲乙双方对齐“核心数据对象、字段口径、关系边界、交易与资金闭环”。
+
+## 2. 先讲结论（评审开场可直接使用）
+
+1. 本图覆盖用户、挂牌、订单、支付、合同、结算、售后、会话、通知、审计、维保的核心数据闭环。
+2. 交易主链路为：`用户 -> 挂牌 -> 订单 -> 支付 -> 合同 -> 结算 -> 售后`。
+3. 平台治理能力（幂等键、审计日志、系统配置）已独立建模，可支撑合规留痕与稳定性保障。
+
+## 3. 实体总览（中英对照）
+
+| 英文表名 | 中文表名 | 业务域 | 说明 |
+|---|---|---|---|
+"""
+
+RELATIONS_HEAD = """
+## 4. 关系总览（中文翻译）
+
+| 左表 | 右表 | 基数关系 | 关系标签（原文） | 中文释义 |
+|---|---|---|---|---|
+"""
+
+HIGHLIGHTS = """
+## 5. 重点链路讲解（甲方重点关注）
+
+### 5.1 交易与资金闭环
+
+1. `LISTINGS` 记录可交易标的及挂牌状态。
+2. `ORDERS` 在挂牌基础上形成交易单，沉淀买卖双方、金额、发票信息。
+3. `PAYMENTS` 记录支付流水，区分支付类型、渠道、状态与交易流水号。
+4. `CONTRACTS` 记录合同文件与签署状态，作为交易履约依据。
+5. `SETTLEMENTS` 记录佣金、放款金额、放款状态与凭证，完成资金闭环。
+
+### 5.2 售后与客服闭环
+
+1. `REFUND_REQUESTS` 记录退款申请与状态流转。
+2. `CS_CASES` + `CS_MILESTONES` + `CS_CASE_NOTES` + `CS_CASE_EVIDENCES` 形成工单处理全链路留痕。
+3. `CONVERSATIONS` + `CONVERSATION_PARTICIPANTS` + `CONVERSATION_MESSAGES` 记录沟通过程与责任边界。
+
+### 5.3 合规与平台治理
+
+1. `AUDIT_LOGS` 记录操作前后快照，可用于审计追溯。
+2. `IDEMPOTENCY_KEYS` 防止重复提交，保障支付/下单等关键操作幂等。
+3. `SYSTEM_CONFIGS` 管理可配置项，支撑线上策略调节。
+
+## 6. 全量字段中文注释（按表）
+
+> 说明：以下字段来自 `er-diagram-cn.mmd`，用于甲乙双方字段级对齐。
+
+"""
+
+FIELDS_HEAD = """
+| 字段名 | 类型 | 键属性 | 中文注释 |
+|---|---|---|---|
+"""
+
+OUTRO = """## 7. 评审讲解建议（可直接念）
+
+1. 先指向图中央交易链路：`LISTINGS -> ORDERS -> PAYMENTS/CONTRACTS -> SETTLEMENTS`。
+2. 再讲两条保障链：一条是“售后客服链”（退款、工单、会话），一条是“治理合规链”（幂等、审计、配置）。
+3. 最后落到字段：重点确认金额、状态、时间、责任人四类字段在双方口径一致。
+
+## 8. 对接注意事项
+
+- 本文档用于讲解与对齐，不替代接口文档与 Prisma Schema 的精确约束。
+- 如果后续有模型新增/字段变更，请同步更新 `er-diagram-cn.mmd` 并重新生成本文件。
+"""
+
+
+def split_words(name: str) -> list[str]:
+    s = name.strip()
+    return [x for x in s.split("_") if x]
+
+
+@lru_cache(maxsize=8192)
+def field_cn(name: str) -> str:
+    if name in FIELD_EXACT_CN:
+        return FIELD_EXACT_CN[name]
+    words = split_words(name)
+    out: list[str] = []
+    for w in words:
+        lw = w.lower()
+        out.append(TOKEN_CN.get(lw, w))
+    result = "".join(out).strip()
+    return result or name
+
+
+def table_cn(name: str) -> str:
+    return TABLE_CN.get(name, name)
+
+
+def table_desc(name: str) -> str:
+    if name in CORE_TRADE_TABLES:
+        return "交易资金主链路核心表"
+    if name in ACCOUNT_TABLES:
+        return "账户、权限与身份认证"
+    if name.startswith("CS_") or name.startswith("CONVERSATION"):
+        return "客服协同与沟通留痕"
+    if name.startswith("PATENT_MAINTENANCE"):
+        return "专利维保计划与执行闭环"
+    if name in GOVERNANCE_TABLES:
+        return "治理、审计与稳定性保障"
+    return "业务支撑表"
+
+
+def write_markdown(model: ErModel, out: TextIO) -> None:
+    write = out.write
+    write(INTRO)
+    # 表名中文只查一次；第 4、6 节按名称复用
+    names_cn: dict[str, str] = {}
+    for ent in model.entities:
+        en = ent.name
+        cn = names_cn[en] = table_cn(en)
+        write(f"| `{en}` | {cn} | {DOMAIN_MAP.get(en, '其他')} | {table_desc(en)} |\n")
+
+    write(RELATIONS_HEAD)
+    for rel in model.relations:
+        left_cn = names_cn.get(rel.left) or table_cn(rel.left)
+        right_cn = names_cn.get(rel.right) or table_cn(rel.right)
+        card = CARDINALITY_CN.get(rel.card, rel.card)
+        label_cn = REL_LABEL_CN.get(rel.label, rel.label)
+        write(f"| `{rel.left}`（{left_cn}） | `{rel.right}`（{right_cn}） | {card} | `{rel.label}` | {label_cn} |\n")
+
+    write(HIGHLIGHTS)
+    for ordinal, ent in enumerate(model.entities, start=1):
+        write(f"### 6.{ordinal} `{ent.name}`（{names_cn[ent.name]}）\n")
+        write(FIELDS_HEAD)
+        for f in ent.fields:
+            key = "/".join(f.key_tags) if f.key_tags else "-"
+            write(f"| `{f.name}` | `{f.ftype}` | {key} | {field_cn(f.name)} |\n")
+        write("\n")
+    write(OUTRO)
+
+
+def render_markdown(model: ErModel) -> str:
+    buf = io.StringIO()
+    write_markdown(model, buf)
+    return buf.getvalue()
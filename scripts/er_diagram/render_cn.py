@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""中文展示版 Mermaid ER 渲染器：实体/字段名追加中文，关系标签中文化。"""
+
+from __future__ import annotations
+
+from typing import TextIO
+
+from er_diagram.model import ErModel
+from glossary import load_table
+
+TABLE_CN = load_table("er.table")
+REL_LABEL_CN = load_table("er.rel_label")
+TOKEN_CN = load_table("er.token")
+FIELD_EXACT_CN = load_table("er.field_exact")
+
+# 源文件没有 %%{init:...}%% 时使用（例如 Prisma 前端）
+DEFAULT_INIT_LINE = (
+    "%%{init: {'theme':'base','themeVariables': {'fontFamily': 'Microsoft YaHei, PingFang SC, Noto Sans CJK SC, Helvetica Neue, Arial, sans-serif'}}}%%"
+)
+
+
+def field_cn(name: str) -> str:
+    if name in FIELD_EXACT_CN:
+        return FIELD_EXACT_CN[name]
+    out: list[str] = []
+    for token in name.split("_"):
+        key = token.lower()
+        out.append(TOKEN_CN.get(key, token))
+    return "".join(out) or name
+
+
+def make_entity_alias(name: str) -> str:
+    cn = TABLE_CN.get(name, name)
+    alias = f"{name}_{cn}"
+    alias = alias.replace("（", "_").replace("）", "_").replace(" ", "_")
+    return alias
+
+
+def render_cn_mmd(model: ErModel) -> str:
+    alias: dict[str, str] = {e.name: make_entity_alias(e.name) for e in model.entities}
+
+    out: list[str] = []
+    if model.init_line:
+        out.append(model.init_line)
+    else:
+        out.append(DEFAULT_INIT_LINE)
+    out.append("erDiagram")
+
+    for ent in model.entities:
+        out.append(f"  {alias[ent.name]} {{")
+        for f in ent.fields:
+            cname = field_cn(f.name)
+            fname = f"{f.name}_{cname}"
+            key = f" {' '.join(f.key_tags)}" if f.key_tags else ""
+            out.append(f"    {f.ftype} {fname}{key}")
+        out.append("  }")
+        out.append("")
+
+    for rel in model.relations:
+        left = alias.get(rel.left, rel.left)
+        right = alias.get(rel.right, rel.right)
+        label = REL_LABEL_CN.get(rel.label, rel.label)
+        out.append(f"  {left} {rel.card} {right} : {label}")
+
+    return "\n".join(out).rstrip() + "\n"
+
+
+def write_cn_mmd(model: ErModel, out: TextIO) -> None:
+    out.write(render_cn_mmd(model))
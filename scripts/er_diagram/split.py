@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+按业务域拆分 ER 图：
+- 每个业务域一张子图：本域实体完整展示，跨域关系的另一端以空实体（桩）出现
+- 一张总览图：节点为业务域，边为域间关系（标注关系条数）
+- 业务域取自 er_brief.table_domain（未登记的表归入“其他”），文件名取 er_split.domain_slug
+- 输出目录中的 .er-split-manifest.json 记录本工具写出的文件，清理旧子图时只删这些
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from er_diagram.model import EntityDef, ErModel, RelationDef
+from er_diagram.render_cn import DEFAULT_INIT_LINE, render_cn_mmd
+from glossary import load_table
+
+DOMAIN_MAP = load_table("er_brief.table_domain")
+DOMAIN_SLUG = load_table("er_split.domain_slug")
+
+DEFAULT_DOMAIN = "其他"
+OVERVIEW_NAME = "overview"
+MANIFEST_NAME = ".er-split-manifest.json"
+MANIFEST_FORMAT = 1
+
+
+def domain_of(name: str) -> str:
+    return DOMAIN_MAP.get(name, DEFAULT_DOMAIN)
+
+
+def domain_slug(domain: str) -> str:
+    slug = DOMAIN_SLUG.get(domain)
+    if slug:
+        return slug
+    return "domain-" + hashlib.sha1(domain.encode("utf-8")).hexdigest()[:8]
+
+
+def split_by_domain(model: ErModel) -> list[tuple[str, ErModel]]:
+    """按实体首次出现的顺序返回 (业务域, 子图模型)。"""
+    members: dict[str, list[EntityDef]] = {}
+    for ent in model.entities:
+        members.setdefault(domain_of(ent.name), []).append(ent)
+
+    # 邻接：每个域收集一端落在本域的关系；另一端不在本域时记为桩
+    touching: dict[str, list[RelationDef]] = {domain: [] for domain in members}
+    stubs: dict[str, dict[str, None]] = {domain: {} for domain in members}
+    for rel in model.relations:
+        left = domain_of(rel.left)
+        right = domain_of(rel.right)
+        for domain, other_name, other_domain in ((left, rel.right, right), (right, rel.left, left)):
+            if domain not in touching:
+                continue
+            if not touching[domain] or touching[domain][-1] is not rel:
+                touching[domain].append(rel)
+            if other_domain != domain:
+                stubs[domain][other_name] = None
+
+    parts: list[tuple[str, ErModel]] = []
+    for domain, ents in members.items():
+        stub_entities = [EntityDef(name=name, fields=[]) for name in stubs[domain]]
+        parts.append((domain, ErModel(init_line=model.init_line, entities=ents + stub_entities, relations=touching[domain])))
+    return parts
+
+
+def _domain_alias(domain: str) -> str:
+    return f"{domain_slug(domain).upper().replace('-', '_')}_{domain}"
+
+
+def render_overview(model: ErModel) -> str:
+    domains: dict[str, int] = {}
+    for ent in model.entities:
+        domain = domain_of(ent.name)
+        domains[domain] = domains.get(domain, 0) + 1
+
+    edges: dict[tuple[str, str], int] = {}
+    for rel in model.relations:
+        left = domain_of(rel.left)
+        right = domain_of(rel.right)
+        if left != right:
+            # 域间边不分方向：A->B 与 B->A 合并计数
+            key = (left, right) if left < right else (right, left)
+            edges[key] = edges.get(key, 0) + 1
+
+    out: list[str] = [model.init_line or DEFAULT_INIT_LINE, "erDiagram"]
+    for domain, count in domains.items():
+        out.append(f"  {_domain_alias(domain)} {{")
+        out.append(f"    int 表数量_{count}")
+        out.append("  }")
+        out.append("")
+    for (left, right), count in edges.items():
+        out.append(f'  {_domain_alias(left)} }}o..o{{ {_domain_alias(right)} : "{count} 条关系"')
+    return "\n".join(out).rstrip() + "\n"
+
+
+def write_domain_diagrams(model: ErModel, out_dir: Path) -> list[Path]:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written: list[Path] = []
+    for domain, part in split_by_domain(model):
+        path = out_dir / f"{domain_slug(domain)}.mmd"
+        path.write_text(render_cn_mmd(part), encoding="utf-8-sig", newline="\n")
+        written.append(path)
+    path = out_dir / f"{OVERVIEW_NAME}.mmd"
+    path.write_text(render_overview(model), encoding="utf-8-sig", newline="\n")
+    written.append(path)
+
+    # 业务域调整后删除不再生成的旧子图，避免渲染出过期文件；
+    # 只删除清单里记录的、上次由本工具写出的文件，目录中的其他 mmd 不动
+    keep = {p.name for p in written}
+    for name in _load_manifest(out_dir) - keep:
+        stale = out_dir / name
+        if stale.suffix == ".mmd" and stale.parent == out_dir and stale.is_file():
+            stale.unlink()
+    _save_manifest(out_dir, keep)
+    return written
+
+
+def _load_manifest(out_dir: Path) -> set[str]:
+    try:
+        payload = json.loads((out_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return set()
+    if not isinstance(payload, dict) or payload.get("format") != MANIFEST_FORMAT:
+        return set()
+    files = payload.get("files")
+    return {name for name in files if isinstance(name, str)} if isinstance(files, list) else set()
+
+
+def _save_manifest(out_dir: Path, names: set[str]) -> None:
+    path = out_dir / MANIFEST_NAME
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps({"format": MANIFEST_FORMAT, "files": sorted(names)}, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+一次解析 ER 源，同时生成中文展示版 mmd 与《ER 图专项讲解（甲方评审版）》：
+- 来源：docs/architecture/er-diagram.mmd，或 --prisma 指定的 Prisma schema
+- 输出：docs/architecture/er-diagram-cn.mmd、docs/architecture/er-diagram-client-brief.md
+- 讲解文档直接使用内存中的模型，不再回读刚生成的中文 mmd
+- 可选 --domains-dir：按业务域拆分为子图与总览图（见 er_diagram/split.py）
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from er_diagram.pipeline import RENDERERS, default_prisma_cache, load_model, write_output
+from er_diagram.split import write_domain_diagrams
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--input", default="docs/architecture/er-diagram.mmd", help="输入 ER mmd")
+    parser.add_argument("--prisma", default="", help="Prisma schema（指定时忽略 --input，例如 apps/api/prisma/schema.prisma）")
+    parser.add_argument(
+        "--prisma-cache",
+        default="",
+        help="Prisma 解析缓存文件（默认：<schema>.er-cache.json；传 none 关闭）",
+    )
+    parser.add_argument(
+        "--only",
+        default=",".join(RENDERERS),
+        help=f"只生成指定输出，逗号分隔（可选：{', '.join(RENDERERS)}）",
+    )
+    for name, renderer in RENDERERS.items():
+        parser.add_argument(f"--{name}-output", default=renderer.default_output, help=f"{name} 输出文件")
+    parser.add_argument(
+        "--domains-dir",
+        default="",
+        help="按业务域拆分的子图输出目录（例如 docs/architecture/er-domains；为空则不拆分）",
+    )
+    args = parser.parse_args()
+
+    names = [x.strip() for x in args.only.split(",") if x.strip()]
+    unknown = [x for x in names if x not in RENDERERS]
+    if unknown:
+        parser.error(f"unknown renderer(s): {', '.join(unknown)}")
+
+    if args.prisma:
+        schema_path = Path(args.prisma)
+        if args.prisma_cache == "none":
+            cache_path = None
+        else:
+            cache_path = Path(args.prisma_cache) if args.prisma_cache else default_prisma_cache(schema_path)
+        model = load_model(prisma_path=schema_path, prisma_cache=cache_path)
+    else:
+        model = load_model(mmd_path=Path(args.input))
+
+    for name in names:
+        out_path = Path(getattr(args, f"{name.replace('-', '_')}_output"))
+        write_output(name, model, out_path)
+        print(out_path)
+
+    if args.domains_dir:
+        for path in write_domain_diagrams(model, Path(args.domains_dir)):
+            print(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@
 """
 兼容入口：
 - 供 build-client-handover.ps1 的 -Regenerate 调用
-- 当前实现为执行统一中文化修复脚本
+- 当前实现为执行一体化流水线（注释 + 中文化同进程串联，中文化阶段增量重算）
 """
 
 from __future__ import annotations
@@ -15,7 +15,7 @@ from pathlib import Path
 
 def main() -> None:
     repo_root = Path(__file__).resolve().parents[1]
-    script = repo_root / "scripts" / "normalize-client-handover-cn.py"
+    script = repo_root / "scripts" / "handover-pipeline.py"
     md_path = repo_root / "docs" / "architecture" / "client-handover-mini-program-admin.md"
 
     cmd = [
@@ -25,6 +25,7 @@ def main() -> None:
         str(md_path),
         "--output",
         str(md_path),
+        "--incremental",
     ]
     subprocess.run(cmd, check=True)
     print(str(md_path))
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+术语表编译与加载：
+- 编译：读取 glossary_source.py，报告表内重复键与同类表之间的译法冲突，生成 glossary.json
+- 加载：各脚本通过 load_table() 按需读取 glossary.json（每个进程只解析一次），不再导入源数据
+- 版本：每张表记录内容哈希，整体版本用于译文缓存与增量清单失效
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+from translation_cache import dictionary_version
+
+GLOSSARY_FORMAT = 1
+SOURCE_PATH = Path(__file__).with_name("glossary_source.py")
+ARTIFACT_PATH = Path(__file__).with_name("glossary.json")
+
+_LOADED: dict | None = None
+
+
+def _load() -> dict:
+    global _LOADED
+    if _LOADED is None:
+        try:
+            payload = json.loads(ARTIFACT_PATH.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            raise RuntimeError(f"无法读取术语表产物 {ARTIFACT_PATH}（请先运行 python scripts/glossary.py）: {exc}") from exc
+        if not isinstance(payload, dict) or payload.get("format") != GLOSSARY_FORMAT:
+            raise RuntimeError(f"术语表产物格式不符：{ARTIFACT_PATH}（请重新运行 python scripts/glossary.py）")
+        _LOADED = payload
+    return _LOADED
+
+
+def load_table(name: str) -> dict[str, str]:
+    return _load()["tables"][name]["entries"]
+
+
+def table_version(*names: str) -> str:
+    tables = _load()["tables"]
+    if len(names) == 1:
+        return tables[names[0]]["version"]
+    digest = hashlib.sha1("\0".join(tables[name]["version"] for name in names).encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+
+def glossary_version() -> str:
+    return _load()["version"]
+
+
+def find_duplicate_keys(source: str) -> list[str]:
+    # dict 字面量中的重复键在运行时被静默覆盖，只能从语法树上发现
+    problems: list[str] = []
+    for node in ast.parse(source).body:
+        if not (isinstance(node, ast.Assign) and isinstance(node.value, ast.Dict)):
+            continue
+        name = node.targets[0].id if isinstance(node.targets[0], ast.Name) else "?"
+        seen: dict[str, str] = {}
+        for key, value in zip(node.value.keys, node.value.values):
+            if not (isinstance(key, ast.Constant) and isinstance(value, ast.Constant)):
+                continue
+            if key.value in seen:
+                problems.append(
+                    f"{name}: duplicate key {key.value!r} (line {key.lineno}): "
+                    f"{seen[key.value]!r} -> {value.value!r}, last one wins"
+                )
+            seen[key.value] = value.value
+    return problems
+
+
+def find_conflicts(tables: dict[str, tuple[str, dict[str, str]]]) -> list[str]:
+    # 同类表中同一个键的不同译法
+    by_kind: dict[str, list[str]] = {}
+    for name, (kind, _) in tables.items():
+        by_kind.setdefault(kind, []).append(name)
+    problems: list[str] = []
+    for kind, names in by_kind.items():
+        if len(names) < 2:
+            continue
+        values: dict[str, dict[str, str]] = {}
+        for name in names:
+            for key, value in tables[name][1].items():
+                values.setdefault(key, {})[name] = value
+        for key, per_table in values.items():
+            if len(set(per_table.values())) > 1:
+                detail = ", ".join(f"{name}={value}" for name, value in per_table.items())
+                problems.append(f"[{kind}] {key!r}: {detail}")
+    return problems
+
+
+def build_artifact(tables: dict[str, tuple[str, dict[str, str]]]) -> str:
+    # 每张表一行，便于审阅差异；表内保持源数据的插入顺序
+    versions = {name: dictionary_version(entries) for name, (_, entries) in tables.items()}
+    overall = hashlib.sha1("\0".join(f"{name}={versions[name]}" for name in tables).encode("utf-8")).hexdigest()[:12]
+    lines = [f'{{"format":{GLOSSARY_FORMAT},"version":"{overall}","tables":{{']
+    for index, (name, (kind, entries)) in enumerate(tables.items()):
+        table = {"kind": kind, "version": versions[name], "entries": entries}
+        sep = "," if index < len(tables) - 1 else ""
+        lines.append(f"{json.dumps(name)}:{json.dumps(table, ensure_ascii=False, separators=(',', ':'))}{sep}")
+    lines.append("}}")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--output", default=str(ARTIFACT_PATH), help="术语表产物（JSON）")
+    parser.add_argument("--check", action="store_true", help="只检查产物是否与源数据一致，不写文件")
+    parser.add_argument("--strict", action="store_true", help="存在重复键或译法冲突时以非零状态退出")
+    parser.add_argument("--quiet", action="store_true", help="不逐条打印冲突，只打印数量")
+    args = parser.parse_args()
+
+    import glossary_source
+
+    problems = find_duplicate_keys(SOURCE_PATH.read_text(encoding="utf-8"))
+    conflicts = find_conflicts(glossary_source.TABLES)
+    if not args.quiet:
+        for line in problems + conflicts:
+            print(f"[glossary] {line}")
+    print(f"[glossary] tables={len(glossary_source.TABLES)} duplicate_keys={len(problems)} conflicts={len(conflicts)}")
+
+    out_path = Path(args.output)
+    artifact = build_artifact(glossary_source.TABLES)
+    if args.check:
+        current = out_path.read_text(encoding="utf-8") if out_path.exists() else ""
+        if current != artifact:
+            print(f"[glossary] {out_path} is stale; run python scripts/glossary.py")
+            sys.exit(1)
+        print(f"[glossary] {out_path} is up to date")
+    else:
+        out_path.write_text(artifact, encoding="utf-8", newline="\n")
+        print(str(out_path))
+    if args.strict and (problems or conflicts):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1529 @@
+# -*- coding: utf-8 -*-
+"""
+交接文档与 ER 图脚本的术语表源数据（唯一编辑入口）：
+- 修改后运行 python scripts/glossary.py 重新生成 scripts/glossary.json（脚本运行时只读取该产物）
+- 各表按使用方划分命名空间；同类（kind 相同）表之间的不同译法由编译步骤报告，不自动合并
+- 表内顺序有意义（如 NORMALIZE_COMPOUND_MAP 按顺序替换），产物保留插入顺序
+"""
+
+# ---- normalize-client-handover-cn.py ----
+
+NORMALIZE_DOMAIN_MAP = {
+    "public discovery/search": "公共浏览与检索",
+    "public discovery/patent-map": "公共浏览与专利地图",
+    "my-content create/update/submit": "我的内容创建、编辑与提交",
+    "conversations + notifications": "会话消息与通知",
+    "auth/me/verification": "登录态、个人中心与认证",
+    "orders/payment/address/invoice": "订单、支付、地址与发票",
+    "static/config (no critical API write)": "静态配置展示（无关键写接口）",
+    "client/misc": "小程序通用能力",
+    "favorites": "收藏能力",
+    "admin/misc": "管理后台通用能力",
+    "admin/verifications": "认证审核",
+    "admin/listings-audit": "挂牌审核",
+    "admin/tech-managers": "技术经理管理",
+    "admin/orders": "订单管理",
+    "admin/refunds": "退款管理",
+    "admin/settlements": "结算管理",
+    "admin/invoices": "发票管理",
+    "admin/reports": "报表管理",
+    "admin/comments": "评论管理",
+    "admin/audit-logs": "审计日志",
+    "admin/rbac": "权限管理",
+    "admin/config": "系统配置",
+    "admin/config-home-announcements": "首页公告配置",
+    "admin/patent-maintenance": "专利维保管理",
+    "admin/regions": "地区字典管理",
+    "admin/patents": "专利与认领管理",
+    "admin/dashboard": "后台首页看板",
+}
+
+NORMALIZE_PACKAGE_MAP = {
+    "main": "主包",
+}
+
+NORMALIZE_ROUTE_TYPE_MAP = {
+    "path": "路径路由",
+    "index": "默认首页路由",
+}
+
+NORMALIZE_TAG_MAP = {
+    "Listings": "挂牌",
+    "Achievements": "成果",
+    "Comments": "评论",
+    "Messaging": "消息会话",
+    "Maintenance": "专利维保",
+    "Patents": "专利",
+    "Config": "配置",
+    "Search": "检索",
+    "Organizations": "机构",
+    "TechManagers": "技术经理",
+    "Notifications": "通知",
+    "Orders": "订单",
+    "Payments": "支付",
+    "Contracts": "合同",
+    "Invoices": "发票",
+    "Addresses": "地址",
+    "Verification": "认证",
+    "Auth": "认证",
+    "Admin": "管理后台",
+    "Regions": "地区",
+    "Cases": "工单",
+    "AI": "智能解析",
+    "RBAC": "权限",
+    "Users": "用户",
+    "Dashboard": "看板",
+    "Favorites": "收藏",
+    "Reports": "报表",
+    "Refunds": "退款",
+    "Settlements": "结算",
+    "Announcements": "公告",
+}
+
+NORMALIZE_PAGE_NAME_HINT = {
+    "verifications": "认证审核",
+    "cases": "工单",
+    "refunds": "退款",
+    "settlements": "结算",
+    "reports": "报表",
+    "comments": "评论",
+    "regions": "地区",
+    "patents": "专利",
+    "patentsoperations": "专利操作",
+    "conversationsplatform": "平台会话",
+    "trade规则": "交易规则",
+    "媒体视频preview": "媒体视频预览",
+    "审计logs": "审计日志",
+}
+
+NORMALIZE_TOKEN_MAP = {
+    "home": "首页",
+    "tech": "技术",
+    "manager": "经理",
+    "managers": "经理",
+    "publish": "发布",
+    "messages": "消息",
+    "message": "消息",
+    "me": "我的",
+    "search": "检索",
+    "patent": "专利",
+    "patents": "专利",
+    "orders": "订单",
+    "order": "订单",
+    "checkout": "支付",
+    "deposit": "订金",
+    "final": "尾款",
+    "success": "成功",
+    "achievement": "成果",
+    "achievements": "成果",
+    "chat": "会话",
+    "support": "客服",
+    "consultation": "咨询",
+    "faq": "常见问题",
+    "contact": "联系",
+    "legal": "法律",
+    "privacy": "隐私",
+    "terms": "条款",
+    "guide": "指引",
+    "onboarding": "引导",
+    "choose": "选择",
+    "identity": "身份",
+    "verification": "认证",
+    "form": "表单",
+    "notifications": "通知",
+    "notification": "通知",
+    "announcements": "公告",
+    "announcement": "公告",
+    "listing": "挂牌",
+    "listings": "挂牌",
+    "favorites": "收藏",
+    "favorite": "收藏",
+    "organizations": "机构",
+    "organization": "机构",
+    "inventors": "发明人",
+    "inventor": "发明人",
+    "map": "地图",
+    "trade": "交易",
+    "rules": "规则",
+    "contracts": "合同",
+    "contract": "合同",
+    "invoices": "发票",
+    "invoice": "发票",
+    "addresses": "地址",
+    "address": "地址",
+    "edit": "编辑",
+    "claims": "认领",
+    "claim": "认领",
+    "maintenance": "维保",
+    "settings": "设置",
+    "about": "关于",
+    "profile": "资料",
+    "login": "登录",
+    "my": "我的",
+    "ipc": "IPC",
+    "picker": "选择器",
+    "media": "媒体",
+    "video": "视频",
+    "preview": "预览",
+    "admin": "后台",
+    "misc": "杂项",
+    "dashboard": "看板",
+    "auth": "认证",
+    "session": "会话",
+    "conversations": "会话",
+    "conversation": "会话",
+    "platform": "平台",
+    "case": "工单",
+    "cases": "工单",
+    "refunds": "退款",
+    "refund": "退款",
+    "settlements": "结算",
+    "settlement": "结算",
+    "reports": "报表",
+    "report": "报表",
+    "comments": "评论",
+    "comment": "评论",
+    "audit": "审计",
+    "logs": "日志",
+    "log": "日志",
+    "rbac": "权限",
+    "config": "配置",
+    "regions": "地区",
+    "region": "地区",
+    "operations": "操作",
+    "public": "公共",
+    "discovery": "浏览",
+    "static": "静态",
+    "critical": "关键",
+    "write": "写入",
+    "api": "接口",
+    "title": "标题",
+    "summary": "摘要",
+    "description": "描述",
+    "content": "内容",
+    "intro": "简介",
+    "remark": "备注",
+    "words": "词条",
+    "word": "词条",
+    "keyword": "关键词",
+    "keywords": "关键词",
+    "industry": "行业",
+    "tags": "标签",
+    "tag": "标签",
+    "source": "来源",
+    "maturity": "成熟度",
+    "sort": "排序",
+    "name": "名称",
+    "nickname": "昵称",
+    "actor": "操作人",
+    "code": "编码",
+    "id": "ID",
+    "uuid": "唯一ID",
+    "user": "用户",
+    "users": "用户",
+    "publisher": "发布者",
+    "seller": "卖方",
+    "buyer": "买方",
+    "requester": "申请人",
+    "author": "作者",
+    "cover": "封面",
+    "file": "文件",
+    "files": "文件",
+    "type": "类型",
+    "status": "状态",
+    "mode": "模式",
+    "modes": "模式",
+    "level": "级别",
+    "total": "总",
+    "active": "有效",
+    "ranked": "排名",
+    "unassigned": "未分配",
+    "mappable": "可映射",
+    "top": "最高",
+    "plain": "纯文本",
+    "json": "JSON",
+    "is": "是否",
+    "default": "默认",
+    "at": "时间",
+    "created": "创建",
+    "updated": "更新",
+    "display": "显示",
+    "service": "服务",
+    "view": "浏览",
+    "consult": "咨询",
+    "count": "数量",
+    "price": "价格",
+    "amount": "金额",
+    "payment": "支付",
+    "payout": "放款",
+    "tax": "税额",
+    "phone": "手机号",
+    "email": "邮箱",
+    "url": "链接",
+    "role": "角色",
+    "permission": "权限",
+    "featured": "推荐",
+    "parse": "解析",
+    "ai": "智能",
+    "hot": "热门",
+    "sensitive": "敏感",
+    "taxonomy": "分类",
+    "recommendation": "推荐",
+    "banner": "横幅",
+    "template": "模板",
+    "templates": "模板",
+    "item": "条目",
+    "items": "条目",
+    "detail": "详情",
+    "task": "任务",
+    "tasks": "任务",
+    "material": "材料",
+    "materials": "材料",
+    "normalize": "规范化",
+    "list": "列表",
+    "line": "行",
+    "ok": "成功",
+    "shelf": "上架",
+    "off": "下架",
+    "submit": "提交",
+    "approve": "通过",
+    "reject": "驳回",
+    "assign": "分配",
+    "reply": "回复",
+    "send": "发送",
+    "read": "已读",
+    "unread": "未读",
+    "offline": "下线",
+    "publish2": "发布",
+    "regioncode": "地区编码",
+    "industrytags": "行业标签",
+    "keywordsjson": "关键词JSON",
+    "industrytagsjson": "行业标签JSON",
+    "cooperationmodesjson": "合作模式JSON",
+    "servicetagsjson": "服务标签JSON",
+    "reasontagsjson": "原因标签JSON",
+    "summaryplain": "纯文本摘要",
+    "actornickname": "操作人昵称",
+    "isdefault": "是否默认",
+    "page": "页码",
+    "size": "大小",
+    "org": "机构",
+    "category": "分类",
+    "routing": "路由",
+    "license": "许可",
+    "assignee": "受让方",
+    "applicant": "申请人",
+    "schedule": "日程",
+    "application": "申请",
+    "fen": "分",
+    "evidence": "凭证",
+    "proof": "凭证",
+    "duplicate": "重复",
+    "policy": "策略",
+    "operator": "操作人",
+    "reason": "原因",
+    "error": "错误",
+    "severity": "严重级别",
+    "deal": "成交",
+    "failed": "失败",
+    "mime": "媒体",
+    "processed": "处理",
+    "scope": "范围",
+    "bytes": "字节",
+    "skipped": "跳过",
+    "transfer": "转让",
+    "center": "中心",
+    "lat": "纬度",
+    "lng": "经度",
+    "channels": "渠道",
+    "channel": "渠道",
+    "fail": "失败",
+    "finished": "完成",
+    "paused": "暂停",
+    "started": "开始",
+    "verified": "已核验",
+    "encumbrance": "权利负担",
+    "expected": "预计",
+    "completion": "完成",
+    "days": "天",
+    "grant": "授权",
+    "publication": "公开",
+    "issued": "发放",
+    "paid": "已支付",
+    "review": "审核",
+    "urgency": "紧急程度",
+    "can": "可",
+    "confidence": "置信度",
+    "due": "到期",
+    "event": "事件",
+    "features": "特征",
+    "grace": "宽限",
+    "period": "期间",
+    "kind": "类别",
+    "notes": "备注",
+    "priority": "优先级",
+    "replies": "回复",
+    "assigned": "已分配",
+    "agent": "坐席",
+    "close": "关闭",
+    "filters": "筛选",
+    "invalid": "无效",
+    "model": "模型",
+    "version": "版本",
+    "parent": "父级",
+    "pinned": "置顶",
+    "reviewed": "已审核",
+    "row": "行",
+    "score": "分值",
+    "submitted": "已提交",
+    "supply": "供给",
+    "target": "目标",
+    "validated": "已校验",
+    "valid": "有效",
+    "year": "年",
+    "max": "最大",
+    "min": "最小",
+    "abstract": "摘要",
+    "attached": "附加",
+    "executed": "执行",
+    "from": "来源",
+    "late": "延迟",
+    "fee": "费用",
+    "deliverables": "交付物",
+    "loc": "位置",
+    "text": "文本",
+    "enabled": "启用",
+    "job": "任务",
+    "no": "编号",
+    "stats": "统计",
+    "result": "结果",
+    "results": "结果",
+    "applicationnonorm": "标准申请号",
+    "publicationnodisplay": "公开号展示",
+    "grantpublicationnodisplay": "授权公开号展示",
+    "officialreceiptfileid": "官方回执文件ID",
+    "topics": "主题",
+    "date": "日期",
+    "cs": "客服",
+    "cooperation": "合作",
+    "sms": "短信",
+    "intent": "支付意图",
+    "intents": "支付意图",
+    "bind": "绑定",
+    "customer": "客户",
+    "mp": "小程序",
+    "verify": "验证",
+    "execute": "执行",
+    "manual": "手动",
+    "validate": "校验",
+    "dispute": "纠纷",
+    "sla": "服务时效",
+    "notify": "通知回调",
+    "wechatpay": "微信支付",
+    "feedback": "反馈",
+    "finance": "财务",
+    "health": "健康",
+    "temporary": "临时",
+    "ack": "确认",
+    "complete": "完成",
+    "execution": "执行",
+    "overview": "概览",
+    "quote": "报价",
+    "cancel": "取消",
+    "position": "位置",
+    "stamp": "戳",
+    "str": "串",
+    "for": "对应",
+    "package": "参数包",
+    "one": "候选",
+    "of": "项",
+    "link": "链接",
+    "time": "时间",
+    "requested": "请求",
+    "masked": "脱敏",
+    "ranking": "排名",
+    "owned": "已拥有",
+    "enc": "加密",
+    "unified": "统一",
+    "social": "社会",
+    "credit": "信用",
+    "note": "备注",
+    "raw": "原始",
+    "filing": "申请",
+    "range": "范围",
+    "percent": "百分比",
+    "start": "开始",
+    "uploaded": "上传",
+    "signed": "签署",
+    "in": "内",
+    "before": "变更前",
+    "after": "变更后",
+    "request": "请求",
+    "ip": "IP",
+    "device": "设备",
+    "by": "由",
+    "import": "导入",
+    "main": "主",
+    "system": "系统",
+    "key": "键",
+    "to": "至",
+    "commission": "佣金",
+    "avatar": "头像",
+    "rank": "排名",
+    "logo": "标识",
+    "existing": "既有",
+    "negotiable": "可议价",
+    "official": "官方",
+    "receipt": "回执",
+    "pledge": "质押",
+    "rate": "费率",
+    "until": "截止",
+    "action": "操作",
+    "owner": "所有者",
+    "definition": "定义",
+    "rating": "评分",
+    "jurisdiction": "法域",
+    "reconcile": "对账",
+    "pay": "支付",
+    "end": "结束",
+    "method": "方式",
+    "norm": "规范",
+    "last": "最近",
+    "reviewer": "审核人",
+    "counterpart": "对方",
+    "sender": "发送方",
+    "deadline": "截止时间",
+    "primary": "主要",
+    "term": "期限",
+    "txn": "交易",
+    "input": "输入",
+    "normalized": "规范化",
+    "submission": "提交",
+    "boost": "提升",
+    "condition": "条件",
+    "fixed": "固定",
+    "number": "编号",
+    "requests": "请求",
+    "snapshot": "快照",
+    "auto": "自动",
+    "milestones": "里程碑",
+    "payload": "载荷",
+    "published": "已发布",
+    "root": "根",
+    "sent": "已发送",
+    "spec": "规格",
+    "weights": "权重",
+    "as": "作为",
+    "matches": "匹配",
+    "ref": "参考",
+    "cooldown": "冷却",
+    "minutes": "分钟",
+    "generated": "生成",
+    "gross": "总额",
+    "missing": "缺失",
+    "claimed": "已认领",
+    "province": "省",
+    "city": "市",
+    "q": "查询词",
+    "threshold": "阈值",
+    "triggered": "触发",
+    "watermark": "水印",
+    "batch": "批次",
+    "completed": "完成",
+    "business": "工作日",
+    "mappings": "映射",
+    "on": "当",
+    "timeout": "超时",
+    "scenario": "场景",
+    "strategy": "策略",
+    "upload": "上传",
+    "webhook": "回调",
+    "window": "窗口",
+    "audio": "音频",
+    "clear": "清除",
+    "dedupe": "去重",
+    "hours": "小时",
+    "deleted": "已删除",
+    "descendant": "子级",
+    "expires": "过期",
+    "seconds": "秒",
+    "image": "图片",
+    "industries": "行业",
+    "occurred": "发生",
+    "parsed": "解析",
+    "query": "查询",
+    "figure": "图",
+    "decay": "衰减",
+    "half": "半衰",
+    "life": "周期",
+    "value": "数值",
+    "warnings": "警告",
+    "assignments": "分配",
+    "attachments": "附件",
+    "feedbacks": "反馈",
+    "participants": "参与者",
+    "children": "子项",
+    "classifications": "分类",
+    "country": "国家",
+    "export": "导出",
+    "extra": "扩展",
+    "context": "上下文",
+    "idempotency": "幂等",
+    "keys": "键",
+    "identifiers": "标识",
+    "match": "匹配",
+    "milestone": "里程碑",
+    "next": "下一条",
+    "cursor": "游标",
+    "nonce": "随机串",
+    "parties": "参与方",
+    "patch": "补丁",
+    "applied": "已应用",
+    "provider": "服务商",
+    "recognized": "识别",
+    "refresh": "刷新",
+    "hash": "哈希",
+    "response": "响应",
+    "schema": "结构",
+    "sign": "签名",
+    "ttl": "存活期",
+    "wechat": "微信",
+    "openid": "开放ID",
+    "params": "参数",
+    "token": "令牌",
+    "access": "访问",
+}
+
+NORMALIZE_COMPOUND_MAP = {
+    "off-shelf": "下架",
+    "patent-maintenance": "专利维保",
+    "tech-managers": "技术经理",
+    "home-announcements": "首页公告",
+    "audit-logs": "审计日志",
+    "industry-tags": "行业标签",
+    "hot-search": "热门搜索",
+    "sensitive-words": "敏感词",
+    "trade-rules": "交易规则",
+    "parse-results": "解析结果",
+    "patent-claims": "专利认领",
+    "payment-confirm": "支付确认",
+    "cover-file": "封面文件",
+}
+
+NORMALIZE_ACTION_MAP = {
+    "approve": "审核通过",
+    "reject": "审核驳回",
+    "publish": "发布",
+    "off-shelf": "下架",
+    "offshelf": "下架",
+    "offline": "下线",
+    "submit": "提交",
+    "ack": "确认",
+    "export": "导出",
+    "upload": "上传",
+    "download": "下载",
+    "bind": "绑定",
+    "unbind": "解绑",
+    "login": "登录",
+    "logout": "退出登录",
+    "refresh": "刷新",
+    "cancel": "取消",
+    "close": "关闭",
+    "open": "开启",
+    "assign": "分配",
+    "reply": "回复",
+    "send": "发送",
+    "read": "已读",
+    "unread": "标记未读",
+    "remove": "移除",
+    "delete": "删除",
+    "status": "更新状态",
+    "sla": "更新SLA",
+    "notes": "新增备注",
+    "evidence": "上传凭证",
+    "agents": "分配坐席",
+    "quote": "报价",
+    "receipt": "上传回执",
+    "reconcile": "对账",
+    "payment-confirm": "确认支付",
+}
+
+# ---- annotate-client-handover.py ----
+
+ANNOTATE_WORD_MAP = {
+    "home": "首页",
+    "tech": "技术",
+    "manager": "经理",
+    "managers": "经理",
+    "publish": "发布",
+    "messages": "消息",
+    "message": "消息",
+    "me": "我的",
+    "search": "搜索",
+    "patent": "专利",
+    "orders": "订单",
+    "order": "订单",
+    "checkout": "支付",
+    "deposit": "订金",
+    "final": "尾款",
+    "success": "成功",
+    "achievement": "成果",
+    "achievements": "成果",
+    "chat": "会话",
+    "support": "客服",
+    "faq": "常见问题",
+    "contact": "联系",
+    "legal": "法律",
+    "privacy": "隐私",
+    "terms": "条款",
+    "guide": "指引",
+    "onboarding": "新手引导",
+    "choose": "选择",
+    "identity": "身份",
+    "verification": "认证",
+    "form": "表单",
+    "notifications": "通知",
+    "notification": "通知",
+    "announcements": "公告",
+    "announcement": "公告",
+    "listing": "挂牌",
+    "listings": "挂牌",
+    "favorites": "收藏",
+    "organizations": "机构",
+    "inventors": "发明人",
+    "map": "地图",
+    "trade": "交易",
+    "rules": "规则",
+    "contracts": "合同",
+    "invoices": "发票",
+    "addresses": "地址",
+    "address": "地址",
+    "edit": "编辑",
+    "my": "我的",
+    "claims": "认领",
+    "claim": "认领",
+    "maintenance": "维保",
+    "settings": "设置",
+    "about": "关于",
+    "profile": "资料",
+    "login": "登录",
+    "ipc": "IPC",
+    "picker": "选择器",
+    "media": "媒体",
+    "video": "视频",
+    "preview": "预览",
+    "cooperation": "合作",
+    "modes": "方式",
+    "mode": "方式",
+    "line": "行",
+    "json": "JSON",
+    "at": "时间",
+    "in": "内",
+    "seconds": "秒",
+    "second": "秒",
+    "expires": "过期",
+    "reply": "回复",
+    "counterpart": "对方",
+    "applicant": "申请人",
+    "assignee": "受让方",
+    "confidence": "置信度",
+    "scope": "范围",
+    "featured": "推荐",
+    "rank": "排序位",
+    "jurisdiction": "法域",
+    "provider": "渠道",
+    "ok": "成功",
+    "key": "键",
+    "job": "任务",
+    "defaults": "默认配置",
+    "defaults2": "默认配置",
+    "window": "窗口",
+    "minutes": "分钟",
+    "minute": "分钟",
+    "fen": "分",
+    "evidence": "凭证",
+    "masked": "脱敏",
+    "note": "备注",
+    "notes": "备注",
+    "sla": "SLA",
+    "can": "可",
+    "auto": "自动",
+    "payout": "放款",
+    "timeout": "超时",
+    "commission": "佣金",
+    "deal": "成交",
+    "plain": "文本",
+    "features": "特征",
+    "strategy": "策略",
+    "hot": "热门",
+    "sensitive": "敏感",
+    "taxonomy": "分类",
+    "rule": "规则",
+    "rules2": "规则",
+    "trade2": "交易",
+    "template": "模板",
+    "templates": "模板",
+    "item": "项",
+    "items": "条目",
+    "offline": "下线",
+    "publish2": "发布",
+    "audio": "音频",
+    "parse2": "解析",
+    "agent": "坐席",
+    "conversation": "会话",
+    "display": "显示",
+    "until": "截止",
+    "level": "等级",
+    "claim2": "认领",
+    "event": "事件",
+    "events": "事件",
+    "summary2": "汇总",
+    "stats": "统计",
+    "recommendation": "推荐",
+    "sensitivewords": "敏感词",
+    "no": "编号",
+    "admin": "后台",
+    "verifications": "认证审核",
+    "refunds": "退款",
+    "settlements": "结算",
+    "reports": "报表",
+    "comments": "评论",
+    "audit": "审计",
+    "logs": "日志",
+    "rbac": "权限",
+    "config": "配置",
+    "regions": "地区",
+    "operations": "业务操作",
+    "conversations": "会话",
+    "platform": "平台",
+    "auth": "认证",
+    "session": "会话",
+    "user": "用户",
+    "users": "用户",
+    "role": "角色",
+    "roles": "角色",
+    "permission": "权限",
+    "permissions": "权限",
+    "id": "ID",
+    "uuid": "唯一ID",
+    "status": "状态",
+    "type": "类型",
+    "name": "名称",
+    "title": "标题",
+    "summary": "摘要",
+    "description": "描述",
+    "content": "内容",
+    "phone": "手机号",
+    "email": "邮箱",
+    "avatar": "头像",
+    "url": "地址",
+    "code": "编码",
+    "region": "地区",
+    "province": "省",
+    "city": "市",
+    "district": "区",
+    "amount": "金额",
+    "price": "价格",
+    "fee": "费用",
+    "rate": "费率",
+    "tax": "税额",
+    "total": "总额",
+    "count": "数量",
+    "page": "页码",
+    "size": "每页条数",
+    "created": "创建",
+    "updated": "更新",
+    "deleted": "删除",
+    "time": "时间",
+    "date": "日期",
+    "start": "开始",
+    "end": "结束",
+    "is": "是否",
+    "has": "是否",
+    "enabled": "启用",
+    "disabled": "停用",
+    "active": "有效",
+    "default": "默认",
+    "cover": "封面",
+    "file": "文件",
+    "files": "文件",
+    "source": "来源",
+    "target": "目标",
+    "result": "结果",
+    "results": "结果",
+    "reason": "原因",
+    "remark": "备注",
+    "note": "说明",
+    "operator": "操作人",
+    "owner": "所有者",
+    "buyer": "买家",
+    "seller": "卖家",
+    "cs": "客服",
+    "finance": "财务",
+    "invoice": "发票",
+    "contract": "合同",
+    "payment": "支付",
+    "refund": "退款",
+    "settlement": "结算",
+    "parse": "解析",
+    "ai": "AI",
+    "hot": "热门",
+    "banner": "横幅",
+    "tag": "标签",
+    "industry": "行业",
+    "keyword": "关键词",
+    "maturity": "成熟度",
+    "sort": "排序",
+    "wechat": "微信",
+    "bind": "绑定",
+    "unbind": "解绑",
+    "approve": "审核通过",
+    "reject": "审核驳回",
+    "upload": "上传",
+    "download": "下载",
+    "send": "发送",
+    "read": "已读",
+    "unread": "未读",
+    "detail": "详情",
+    "list": "列表",
+    "index": "首页",
+}
+
+ANNOTATE_ACTION_MAP = {
+    "approve": "审核通过",
+    "reject": "审核驳回",
+    "publish": "发布",
+    "off-shelf": "下架",
+    "offshelf": "下架",
+    "ack": "确认",
+    "export": "导出",
+    "upload": "上传",
+    "download": "下载",
+    "bind": "绑定",
+    "unbind": "解绑",
+    "login": "登录",
+    "logout": "退出登录",
+    "refresh": "刷新",
+    "submit": "提交",
+    "cancel": "取消",
+    "close": "关闭",
+    "open": "开启",
+    "assign": "分配",
+    "reply": "回复",
+    "send": "发送",
+    "read": "已读",
+    "unread": "标记未读",
+    "restore": "恢复",
+    "delete": "删除",
+    "remove": "移除",
+}
+
+ANNOTATE_PAGE_EXACT = {
+    "pages/home/index": "首页",
+    "pages/tech-managers/index": "技术经理页",
+    "pages/publish/index": "发布页",
+    "pages/messages/index": "消息页",
+    "pages/me/index": "我的页",
+    "subpackages/search/index": "搜索页",
+    "subpackages/patent/detail/index": "专利详情",
+    "subpackages/orders/index": "订单列表",
+    "subpackages/orders/detail/index": "订单详情",
+    "subpackages/checkout/deposit-pay/index": "订金支付",
+    "subpackages/checkout/deposit-success/index": "订金支付成功",
+    "subpackages/checkout/final-pay/index": "尾款支付",
+    "subpackages/checkout/final-success/index": "尾款支付成功",
+    "subpackages/publish/patent/index": "发布专利",
+    "subpackages/publish/achievement/index": "发布成果",
+    "subpackages/messages/chat/index": "聊天会话",
+    "subpackages/support/index": "客服中心",
+    "subpackages/support/faq/index": "常见问题",
+    "subpackages/support/faq/detail/index": "问题详情",
+    "subpackages/support/contact/index": "联系客服",
+    "subpackages/legal/privacy/index": "隐私政策",
+    "subpackages/legal/terms/index": "服务条款",
+    "subpackages/legal/privacy-guide/index": "隐私指引",
+    "subpackages/onboarding/choose-identity/index": "选择身份",
+    "subpackages/onboarding/verification-form/index": "实名认证表单",
+    "subpackages/notifications/index": "通知列表",
+    "subpackages/notifications/detail/index": "通知详情",
+    "subpackages/home-announcements/index": "首页公告列表",
+    "subpackages/home-announcements/detail/index": "首页公告详情",
+    "subpackages/listing/detail/index": "挂牌详情",
+    "subpackages/achievement/detail/index": "成果详情",
+    "subpackages/favorites/index": "我的收藏",
+    "subpackages/organizations/index": "机构列表",
+    "subpackages/organizations/detail/index": "机构详情",
+    "subpackages/inventors/index": "发明人列表",
+    "subpackages/patent-map/index": "专利地图",
+    "subpackages/tech-managers/detail/index": "技术经理详情",
+    "subpackages/trade-rules/index": "交易规则",
+    "subpackages/contracts/index": "合同中心",
+    "subpackages/invoices/index": "发票中心",
+    "subpackages/addresses/index": "地址管理",
+    "subpackages/addresses/edit/index": "地址编辑",
+    "subpackages/my-listings/index": "我的挂牌",
+    "subpackages/my-achievements/index": "我的成果",
+    "subpackages/patent-claims/index": "专利认领",
+    "subpackages/maintenance/index": "维保服务",
+    "subpackages/settings/notifications/index": "通知设置",
+    "subpackages/about/index": "关于我们",
+    "subpackages/profile/edit/index": "资料编辑",
+    "subpackages/login/index": "登录页",
+    "subpackages/ipc-picker/index": "IPC 选择",
+    "subpackages/media/video-preview/index": "视频预览",
+}
+
+ANNOTATE_ROUTE_EXACT = {
+    "/login": "登录页",
+    "/": "后台首页",
+    "verifications": "实名认证审核管理",
+    "listings": "挂牌审核管理",
+    "tech-managers": "技术经理管理",
+    "orders": "订单管理",
+    "orders/:orderId": "订单详情",
+    "cases": "客服工单管理",
+    "refunds": "退款管理",
+    "settlements": "结算管理",
+    "invoices": "发票管理",
+    "reports": "经营报表",
+    "comments": "评论管理",
+    "audit-logs": "审计日志",
+    "rbac": "权限角色管理",
+    "config": "系统配置",
+    "home-announcements": "首页公告管理",
+    "maintenance": "专利维保管理",
+    "regions": "地区字典管理",
+    "patents": "专利库管理",
+    "patents/operations": "专利业务操作",
+    "patents/claims": "专利认领审核",
+    "conversations/platform": "平台会话管理",
+}
+
+# ---- er_diagram/render_cn.py（TABLE_CN / REL_LABEL_CN 与 er_diagram/render_brief.py 共用） ----
+
+ER_TABLE_CN = {
+    "USERS": "用户表",
+    "RBAC_ROLES": "权限角色表",
+    "RBAC_USER_ROLES": "用户角色关联表",
+    "USER_VERIFICATIONS": "用户认证表",
+    "REGIONS": "地区字典表",
+    "INDUSTRY_TAGS": "行业标签表",
+    "PATENTS": "专利主表",
+    "FILES": "文件资源表",
+    "LISTINGS": "挂牌主表",
+    "LISTING_MEDIA": "挂牌媒体表",
+    "LISTING_AUDIT_LOGS": "挂牌审核日志表",
+    "LISTING_FAVORITES": "挂牌收藏表",
+    "LISTING_STATS": "挂牌统计表",
+    "ORDERS": "订单主表",
+    "PAYMENTS": "支付流水表",
+    "REFUND_REQUESTS": "退款申请表",
+    "CONTRACTS": "合同表",
+    "SETTLEMENTS": "结算表",
+    "CS_CASES": "客服工单表",
+    "CS_MILESTONES": "工单里程碑表",
+    "CS_CASE_NOTES": "工单备注表",
+    "CS_CASE_EVIDENCES": "工单凭证表",
+    "CONVERSATIONS": "会话表",
+    "CONVERSATION_PARTICIPANTS": "会话参与人表",
+    "CONVERSATION_MESSAGES": "会话消息表",
+    "NOTIFICATIONS": "通知表",
+    "SYSTEM_CONFIGS": "系统配置表",
+    "IDEMPOTENCY_KEYS": "幂等键表",
+    "AUDIT_LOGS": "审计日志表",
+    "PATENT_MAINTENANCE_SCHEDULES": "专利维保日程表",
+    "PATENT_MAINTENANCE_TASKS": "专利维保任务表",
+    "PATENT_MAINTENANCE_ORDERS": "专利维保订单表",
+}
+
+ER_REL_LABEL_CN = {
+    "has": "拥有",
+    "assigned_to": "分配给",
+    "submits": "提交",
+    "reviews": "审核",
+    "belongs_to": "归属",
+    "applies_in": "适用地区",
+    "owns": "拥有",
+    "referenced_by": "被引用",
+    "publishes": "发布",
+    "located_in": "所在地区",
+    "attached_as": "挂载文件",
+    "audited_by": "审核记录",
+    "aggregates": "统计聚合",
+    "favored": "被收藏",
+    "favorites": "收藏",
+    "traded_as": "形成交易",
+    "buys": "购买",
+    "assigned_cs": "分配客服",
+    "invoice_file": "发票附件",
+    "paid_by": "支付记录",
+    "requests": "发起申请",
+    "signs": "签署合同",
+    "settles": "结算",
+    "contract_file": "合同附件",
+    "payout_evidence": "放款凭证",
+    "follows": "跟进工单",
+    "handles": "处理",
+    "includes": "包含",
+    "notes": "备注记录",
+    "evidences": "凭证记录",
+    "writes": "撰写",
+    "uploads": "上传",
+    "discusses": "关联会话",
+    "contains": "包含",
+    "joins": "参与",
+    "sends": "发送",
+    "receives": "接收",
+    "uses": "使用",
+    "acts": "操作",
+    "maintains": "维保计划",
+    "generates": "生成任务",
+    "creates": "生成订单",
+    "purchases": "下单购买",
+}
+
+ER_TOKEN_CN = {
+    "id": "ID",
+    "user": "用户",
+    "users": "用户",
+    "role": "角色",
+    "roles": "角色",
+    "phone": "手机号",
+    "nickname": "昵称",
+    "region": "地区",
+    "code": "编码",
+    "created": "创建",
+    "updated": "更新",
+    "submitted": "提交",
+    "reviewed": "审核",
+    "by": "人",
+    "display": "展示",
+    "name": "名称",
+    "type": "类型",
+    "status": "状态",
+    "description": "说明",
+    "patent": "专利",
+    "application": "申请",
+    "no": "号",
+    "norm": "标准化",
+    "title": "标题",
+    "legal": "法律",
+    "source": "来源",
+    "primary": "主来源",
+    "at": "时间",
+    "file": "文件",
+    "url": "地址",
+    "mime": "媒体类型",
+    "size": "大小",
+    "bytes": "字节",
+    "owner": "归属人",
+    "listing": "挂牌",
+    "seller": "卖方",
+    "trade": "交易",
+    "mode": "模式",
+    "price": "价格",
+    "deposit": "订金",
+    "amount": "金额",
+    "audit": "审核",
+    "media": "媒体",
+    "sort": "排序",
+    "action": "动作",
+    "reason": "原因",
+    "favorite": "收藏",
+    "stats": "统计",
+    "view": "浏览",
+    "consult": "咨询",
+    "comment": "评论",
+    "order": "订单",
+    "buyer": "买方",
+    "assigned": "分配",
+    "cs": "客服",
+    "deal": "成交",
+    "commission": "佣金",
+    "invoice": "发票",
+    "issued": "开具",
+    "payment": "支付",
+    "pay": "支付",
+    "channel": "渠道",
+    "transaction": "交易流水",
+    "refund": "退款",
+    "request": "申请",
+    "text": "文本",
+    "contract": "合同",
+    "signed": "签署",
+    "settlement": "结算",
+    "gross": "毛额",
+    "payout": "放款",
+    "ref": "参考号",
+    "evidence": "凭证",
+    "case": "工单",
+    "priority": "优先级",
+    "due": "到期",
+    "milestone": "里程碑",
+    "note": "备注",
+    "author": "作者",
+    "conversation": "会话",
+    "participant": "参与人",
+    "participants": "参与人",
+    "sender": "发送人",
+    "content": "内容",
+    "kind": "类别",
+    "summary": "摘要",
+    "read": "已读",
+    "system": "系统",
+    "config": "配置",
+    "key": "键",
+    "scope": "作用域",
+    "value": "值",
+    "json": "JSON",
+    "idempotency": "幂等",
+    "actor": "操作人",
+    "target": "目标",
+    "before": "变更前",
+    "after": "变更后",
+    "maintenance": "维保",
+    "schedule": "日程",
+    "task": "任务",
+    "assignee": "执行人",
+    "date": "日期",
+    "level": "层级",
+    "parent": "上级",
+    "final": "尾款",
+}
+
+ER_FIELD_EXACT_CN = {
+    "application_no_norm": "申请号标准化",
+    "source_primary": "主数据来源",
+    "source_updated_at": "来源更新时间",
+    "size_bytes": "文件大小字节",
+    "seller_user_id": "卖方用户ID",
+    "buyer_user_id": "买方用户ID",
+    "assigned_cs_user_id": "分配客服用户ID",
+    "price_amount": "挂牌价格分",
+    "deposit_amount": "订金金额分",
+    "deal_amount": "成交金额分",
+    "final_amount": "尾款金额分",
+    "commission_amount": "佣金金额分",
+    "invoice_no": "发票号",
+    "invoice_file_id": "发票文件ID",
+    "invoice_issued_at": "发票开具时间",
+    "pay_type": "支付类型",
+    "paid_at": "支付完成时间",
+    "reason_code": "退款原因编码",
+    "reason_text": "退款原因说明",
+    "contract_file_id": "合同文件ID",
+    "gross_amount": "结算毛额分",
+    "payout_amount": "放款金额分",
+    "payout_status": "放款状态",
+    "payout_ref": "放款参考号",
+    "payout_evidence_file_id": "放款凭证文件ID",
+    "payout_at": "放款时间",
+    "due_at": "工单截止时间",
+    "case_id": "工单ID",
+    "author_user_id": "备注作者用户ID",
+    "sender_user_id": "消息发送用户ID",
+    "content_type": "内容类型",
+    "read_at": "阅读时间",
+    "value_json": "配置值JSON",
+    "value_type": "配置值类型",
+    "target_type": "目标对象类型",
+    "target_id": "目标对象ID",
+    "before_json": "变更前快照JSON",
+    "after_json": "变更后快照JSON",
+    "owner_user_id": "维保归属用户ID",
+    "due_date": "维保到期日期",
+    "schedule_id": "维保日程ID",
+    "task_id": "维保任务ID",
+    "payment_channel": "支付渠道",
+    "joined_at": "加入时间",
+    "reviewed_by": "审核人用户ID",
+    "reviewed_at": "审核时间",
+    "submitted_at": "提交时间",
+    "mime_type": "媒体类型",
+    "level": "层级",
+    "parent_code": "上级地区编码",
+    "reviewer_id": "审核人用户ID",
+    "view_count": "浏览次数",
+    "favorite_count": "收藏次数",
+    "consult_count": "咨询次数",
+    "comment_count": "评论次数",
+}
+
+# ---- er_diagram/render_brief.py ----
+
+ER_BRIEF_TABLE_DOMAIN = {
+    "USERS": "用户与权限域",
+    "RBAC_ROLES": "用户与权限域",
+    "RBAC_USER_ROLES": "用户与权限域",
+    "USER_VERIFICATIONS": "用户与权限域",
+    "REGIONS": "基础字典域",
+    "INDUSTRY_TAGS": "基础字典域",
+    "PATENTS": "专利与挂牌域",
+    "FILES": "文件中心域",
+    "LISTINGS": "专利与挂牌域",
+    "LISTING_MEDIA": "专利与挂牌域",
+    "LISTING_AUDIT_LOGS": "专利与挂牌域",
+    "LISTING_FAVORITES": "专利与挂牌域",
+    "LISTING_STATS": "专利与挂牌域",
+    "ORDERS": "交易资金域",
+    "PAYMENTS": "交易资金域",
+    "REFUND_REQUESTS": "交易资金域",
+    "CONTRACTS": "交易资金域",
+    "SETTLEMENTS": "交易资金域",
+    "CS_CASES": "客服与风控域",
+    "CS_MILESTONES": "客服与风控域",
+    "CS_CASE_NOTES": "客服与风控域",
+    "CS_CASE_EVIDENCES": "客服与风控域",
+    "CONVERSATIONS": "客服与风控域",
+    "CONVERSATION_PARTICIPANTS": "客服与风控域",
+    "CONVERSATION_MESSAGES": "客服与风控域",
+    "NOTIFICATIONS": "平台治理域",
+    "SYSTEM_CONFIGS": "平台治理域",
+    "IDEMPOTENCY_KEYS": "平台治理域",
+    "AUDIT_LOGS": "平台治理域",
+    "PATENT_MAINTENANCE_SCHEDULES": "专利维保域",
+    "PATENT_MAINTENANCE_TASKS": "专利维保域",
+    "PATENT_MAINTENANCE_ORDERS": "专利维保域",
+}
+
+ER_BRIEF_TOKEN_CN = {
+    "id": "ID",
+    "uuid": "唯一标识",
+    "user": "用户",
+    "users": "用户",
+    "role": "角色",
+    "roles": "角色",
+    "phone": "手机号",
+    "nickname": "昵称",
+    "region": "地区",
+    "code": "编码",
+    "created": "创建",
+    "updated": "更新",
+    "submitted": "提交",
+    "reviewed": "审核",
+    "by": "人",
+    "display": "展示",
+    "name": "名称",
+    "type": "类型",
+    "status": "状态",
+    "description": "说明",
+    "patent": "专利",
+    "application": "申请",
+    "no": "号",
+    "norm": "标准化",
+    "title": "标题",
+    "legal": "法律",
+    "source": "来源",
+    "primary": "主来源",
+    "at": "时间",
+    "file": "文件",
+    "url": "地址",
+    "mime": "媒体类型",
+    "size": "大小",
+    "bytes": "字节",
+    "owner": "归属人",
+    "listing": "挂牌",
+    "seller": "卖方",
+    "trade": "交易",
+    "mode": "模式",
+    "price": "价格",
+    "deposit": "订金",
+    "amount": "金额",
+    "audit": "审核",
+    "media": "媒体",
+    "sort": "排序",
+    "action": "动作",
+    "reason": "原因",
+    "favorite": "收藏",
+    "stats": "统计",
+    "view": "浏览",
+    "consult": "咨询",
+    "comment": "评论",
+    "order": "订单",
+    "buyer": "买方",
+    "assigned": "分配",
+    "cs": "客服",
+    "deal": "成交",
+    "commission": "佣金",
+    "invoice": "发票",
+    "issued": "开具",
+    "payment": "支付",
+    "pay": "支付",
+    "channel": "渠道",
+    "transaction": "交易流水",
+    "refund": "退款",
+    "request": "申请",
+    "text": "文本",
+    "contract": "合同",
+    "signed": "签署",
+    "settlement": "结算",
+    "gross": "毛额",
+    "payout": "放款",
+    "ref": "参考号",
+    "evidence": "凭证",
+    "case": "工单",
+    "priority": "优先级",
+    "due": "到期",
+    "milestone": "里程碑",
+    "note": "备注",
+    "author": "作者",
+    "conversation": "会话",
+    "participant": "参与人",
+    "participantS": "参与人",
+    "participants": "参与人",
+    "sender": "发送人",
+    "content": "内容",
+    "kind": "类别",
+    "summary": "摘要",
+    "read": "已读",
+    "system": "系统",
+    "config": "配置",
+    "key": "键",
+    "scope": "作用域",
+    "value": "值",
+    "json": "JSON",
+    "idempotency": "幂等",
+    "actor": "操作人",
+    "target": "目标",
+    "before": "变更前",
+    "after": "变更后",
+    "maintenance": "维保",
+    "schedule": "日程",
+    "task": "任务",
+    "assignee": "执行人",
+    "date": "日期",
+}
+
+ER_BRIEF_FIELD_EXACT_CN = {
+    "mime_type": "媒体类型",
+    "application_no_norm": "申请号（标准化）",
+    "source_primary": "主数据来源",
+    "source_updated_at": "来源更新时间",
+    "size_bytes": "文件大小（字节）",
+    "seller_user_id": "卖方用户ID",
+    "buyer_user_id": "买方用户ID",
+    "assigned_cs_user_id": "分配客服用户ID",
+    "price_amount": "挂牌价格（分）",
+    "deposit_amount": "订金金额（分）",
+    "deal_amount": "成交金额（分）",
+    "final_amount": "尾款金额（分）",
+    "commission_amount": "佣金金额（分）",
+    "invoice_no": "发票号",
+    "invoice_file_id": "发票文件ID",
+    "invoice_issued_at": "发票开具时间",
+    "pay_type": "支付类型",
+    "paid_at": "支付完成时间",
+    "reason_code": "退款原因编码",
+    "reason_text": "退款原因说明",
+    "contract_file_id": "合同文件ID",
+    "gross_amount": "结算毛额（分）",
+    "payout_amount": "放款金额（分）",
+    "payout_status": "放款状态",
+    "payout_ref": "放款参考号",
+    "payout_evidence_file_id": "放款凭证文件ID",
+    "payout_at": "放款时间",
+    "due_at": "工单截止时间",
+    "case_id": "工单ID",
+    "author_user_id": "备注作者用户ID",
+    "sender_user_id": "消息发送用户ID",
+    "content_type": "内容类型",
+    "read_at": "阅读时间",
+    "value_json": "配置值（JSON）",
+    "value_type": "配置值类型",
+    "target_type": "目标对象类型",
+    "target_id": "目标对象ID",
+    "before_json": "变更前快照（JSON）",
+    "after_json": "变更后快照（JSON）",
+    "owner_user_id": "维保归属用户ID",
+    "due_date": "维保到期日期",
+    "schedule_id": "维保日程ID",
+    "task_id": "维保任务ID",
+    "payment_channel": "支付渠道",
+    "joined_at": "加入时间",
+    "reviewed_by": "审核人用户ID",
+    "reviewed_at": "审核时间",
+    "submitted_at": "提交时间",
+    "level": "层级",
+    "parent_code": "上级地区编码",
+    "reviewer_id": "审核人用户ID",
+    "view_count": "浏览次数",
+    "favorite_count": "收藏次数",
+    "consult_count": "咨询次数",
+    "comment_count": "评论次数",
+}
+
+# Mermaid erDiagram 全部基数写法：-- 为标识关系，.. 为非标识关系
+ER_BRIEF_CARDINALITY_CN = {
+    "||--||": "一对一",
+    "||--o|": "一对一（左恰好一，右零或一）",
+    "||--|{": "一对多（左恰好一，右一或多）",
+    "||--o{": "一对多（左一右多）",
+    "|o--||": "一对一（左零或一，右恰好一）",
+    "|o--o|": "一对一（左零或一，右零或一）",
+    "|o--|{": "一对多（左零或一，右一或多）",
+    "|o--o{": "一对多（左零或一，右零或多）",
+    "}|--||": "多对一（左一或多，右恰好一）",
+    "}|--o|": "多对一（左一或多，右零或一）",
+    "}|--|{": "多对多（左一或多，右一或多）",
+    "}|--o{": "多对多（左一或多，右零或多）",
+    "}o--||": "多对一（左零或多，右恰好一）",
+    "}o--o|": "多对一（左零或多，右零或一）",
+    "}o--|{": "多对多（左零或多，右一或多）",
+    "}o--o{": "多对多（左零或多，右零或多）",
+    "||..||": "一对一（左恰好一，右恰好一，非标识关系）",
+    "||..o|": "一对一（左恰好一，右零或一，非标识关系）",
+    "||..|{": "一对多（左恰好一，右一或多，非标识关系）",
+    "||..o{": "一对多（左恰好一，右零或多，非标识关系）",
+    "|o..||": "一对一（左零或一，右恰好一，非标识关系）",
+    "|o..o|": "一对一（左零或一，右零或一，非标识关系）",
+    "|o..|{": "一对多（左零或一，右一或多，非标识关系）",
+    "|o..o{": "一对多（左零或一，右零或多，非标识关系）",
+    "}|..||": "多对一（左一或多，右恰好一，非标识关系）",
+    "}|..o|": "多对一（左一或多，右零或一，非标识关系）",
+    "}|..|{": "多对多（左一或多，右一或多，非标识关系）",
+    "}|..o{": "多对多（左一或多，右零或多，非标识关系）",
+    "}o..||": "多对一（左零或多，右恰好一，非标识关系）",
+    "}o..o|": "多对一（左零或多，右零或一，非标识关系）",
+    "}o..|{": "多对多（左零或多，右一或多，非标识关系）",
+    "}o..o{": "多对多（左零或多，右零或多，非标识关系）",
+}
+
+# ---- er_diagram/split.py ----
+
+# 业务域 -> 分域子图文件名（ASCII）
+ER_SPLIT_DOMAIN_SLUG = {
+    "用户与权限域": "users",
+    "专利与挂牌域": "patents-listings",
+    "交易资金域": "trade",
+    "客服与风控域": "service",
+    "平台治理域": "governance",
+    "专利维保域": "maintenance",
+    "基础字典域": "dictionary",
+    "文件中心域": "files",
+    "其他": "other",
+}
+
+# 表名 -> (kind, 映射)；kind 相同的表参与冲突检查
+TABLES: dict[str, tuple[str, dict[str, str]]] = {
+    "normalize.domain": ("domain", NORMALIZE_DOMAIN_MAP),
+    "normalize.package": ("package", NORMALIZE_PACKAGE_MAP),
+    "normalize.route_type": ("route_type", NORMALIZE_ROUTE_TYPE_MAP),
+    "normalize.tag": ("tag", NORMALIZE_TAG_MAP),
+    "normalize.page_name_hint": ("page_name", NORMALIZE_PAGE_NAME_HINT),
+    "normalize.token": ("token", NORMALIZE_TOKEN_MAP),
+    "normalize.compound": ("compound", NORMALIZE_COMPOUND_MAP),
+    "normalize.action": ("action", NORMALIZE_ACTION_MAP),
+    "annotate.word": ("token", ANNOTATE_WORD_MAP),
+    "annotate.action": ("action", ANNOTATE_ACTION_MAP),
+    "annotate.page_exact": ("page_path", ANNOTATE_PAGE_EXACT),
+    "annotate.route_exact": ("route_path", ANNOTATE_ROUTE_EXACT),
+    "er.table": ("table", ER_TABLE_CN),
+    "er.rel_label": ("rel_label", ER_REL_LABEL_CN),
+    "er.token": ("token", ER_TOKEN_CN),
+    "er.field_exact": ("field", ER_FIELD_EXACT_CN),
+    "er_brief.table_domain": ("table_domain", ER_BRIEF_TABLE_DOMAIN),
+    "er_brief.token": ("token", ER_BRIEF_TOKEN_CN),
+    "er_brief.field_exact": ("field", ER_BRIEF_FIELD_EXACT_CN),
+    "er_brief.cardinality": ("cardinality", ER_BRIEF_CARDINALITY_CN),
+    "er_split.domain_slug": ("domain_slug", ER_SPLIT_DOMAIN_SLUG),
+}
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+甲方交接文档一体化流水线：
+- 在同一进程内串联 annotate-client-handover.py 与 normalize-client-handover-cn.py
+- 只读一次输入、只解析一次表格，最后一次原子写出
+- 输出各阶段耗时（读取/解析/注释/目录/中文化/写出）
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Iterable, Iterator, TypeVar
+
+from handover_ir import iter_nodes, regroup
+from translation_cache import shared_cache
+
+T = TypeVar("T")
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+
+def load_script(name: str, filename: str) -> ModuleType:
+    # 脚本文件名带连字符，不能直接 import；按文件加载并登记到 sys.modules
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / filename)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"cannot load {filename}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class StageTimer:
+    """流式阶段计时：每个阶段的迭代器包一层，阶段自身耗时 = 累计耗时 - 上游累计耗时。"""
+
+    def __init__(self) -> None:
+        self.stages: list[str] = []
+        self.cumulative: dict[str, float] = {}
+
+    def wrap(self, name: str, items: Iterable[T]) -> Iterator[T]:
+        self.stages.append(name)
+        self.cumulative[name] = 0.0
+        return self._timed(name, iter(items))
+
+    def _timed(self, name: str, it: Iterator[T]) -> Iterator[T]:
+        clock = time.perf_counter
+        while True:
+            start = clock()
+            try:
+                item = next(it)
+            except StopIteration:
+                self.cumulative[name] += clock() - start
+                return
+            self.cumulative[name] += clock() - start
+            yield item
+
+    def report(self, total: float, tail: str) -> list[str]:
+        rows: list[tuple[str, float]] = []
+        upstream = 0.0
+        for name in self.stages:
+            rows.append((name, self.cumulative[name] - upstream))
+            upstream = self.cumulative[name]
+        rows.append((tail, total - upstream))
+        lines = [f"{name:<10}{seconds * 1000:>10.1f} ms{seconds / total * 100 if total else 0.0:>7.1f}%" for name, seconds in rows]
+        lines.append(f"{'total':<10}{total * 1000:>10.1f} ms")
+        return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--input",
+        default="docs/architecture/client-handover-mini-program-admin.md",
+        help="输入 Markdown 文件",
+    )
+    parser.add_argument(
+        "--output",
+        default="docs/architecture/client-handover-mini-program-admin.md",
+        help="输出 Markdown 文件",
+    )
+    parser.add_argument(
+        "--translation-cache",
+        default="",
+        help="译文缓存文件（可选，两个阶段共用）",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="中文化阶段使用增量模式（同 normalize-client-handover-cn.py --incremental）",
+    )
+    parser.add_argument(
+        "--manifest",
+        default="",
+        help="增量清单文件（默认：<输出文件>.normalize-manifest.json）",
+    )
+    args = parser.parse_args()
+
+    annotate = load_script("annotate_client_handover", "annotate-client-handover.py")
+    normalize = load_script("normalize_client_handover_cn", "normalize-client-handover-cn.py")
+
+    in_path = Path(args.input)
+    out_path = Path(args.output)
+    cache_path = Path(args.translation_cache) if args.translation_cache else None
+    cache = shared_cache()
+    if cache_path is not None:
+        cache.load(cache_path)
+
+    timer = StageTimer()
+    started = time.perf_counter()
+    lines = timer.wrap("read", normalize.iter_source_lines(in_path))
+    nodes = timer.wrap("parse", iter_nodes(lines))
+    nodes = timer.wrap("annotate", regroup(annotate.annotate_nodes(nodes)))
+    nodes = timer.wrap("toc", normalize.iter_with_toc(nodes))
+    normalize.write_normalized(
+        nodes,
+        in_path,
+        out_path,
+        incremental=args.incremental,
+        manifest_path=Path(args.manifest) if args.manifest else None,
+        observe=lambda out: timer.wrap("normalize", out),
+    )
+    total = time.perf_counter() - started
+
+    if cache_path is not None:
+        cache.save(cache_path)
+        print(f"translation cache: {cache.stats()}")
+    for line in timer.report(total, "write"):
+        print(line)
+    print(str(out_path))
+
+
+if __name__ == "__main__":
+    main()
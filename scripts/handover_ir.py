@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+交接文档的结构化中间表示（IR）：
+- 文档切分为 TextLine / Table 节点，节点记录所在章节号（"## N."）
+- 表格行在首次访问单元格时才解析，未改写的行按原文输出
+- annotate / normalize 都作为节点流上的变换运行，串联时只解析、序列化各一次
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Union
+
+SECTION_RE = re.compile(r"^##\s+(\d+)\.")
+
+
+def parse_cells(line: str) -> list[str]:
+    return [c.strip() for c in line.strip().strip("|").split("|")]
+
+
+def format_row(cells: list[str]) -> str:
+    return "| " + " | ".join(cells) + " |"
+
+
+def sep_row(columns: int) -> str:
+    return "|" + "|".join(["---"] * columns) + "|"
+
+
+class Row:
+    # 原文与单元格二者至少有一个；缺的一方按需由另一方生成并缓存。
+    # 单元格列表视为只读，改写时应构造新的 Row。
+    __slots__ = ("_raw", "_cells")
+
+    def __init__(self, raw: str | None = None, cells: list[str] | None = None) -> None:
+        if raw is None and cells is None:
+            raise ValueError("Row requires raw text or cells")
+        self._raw = raw
+        self._cells = cells
+
+    @property
+    def cells(self) -> list[str]:
+        if self._cells is None:
+            self._cells = parse_cells(self._raw)
+        return self._cells
+
+    def render(self) -> str:
+        if self._raw is None:
+            self._raw = format_row(self._cells)
+        return self._raw
+
+    def __repr__(self) -> str:
+        return f"Row({self.render()!r})"
+
+
+@dataclass(slots=True)
+class TextLine:
+    text: str
+    section: int = 0
+
+
+@dataclass(slots=True)
+class Table:
+    header: Row
+    sep: str
+    rows: list[Row]
+    section: int = 0
+
+
+Node = Union[TextLine, Table]
+
+
+def section_number(line: str) -> int | None:
+    if not line.startswith("## "):
+        return None
+    m = SECTION_RE.match(line)
+    return int(m.group(1)) if m else None
+
+
+def _item_text(item: str | Row) -> str:
+    return item.render() if isinstance(item, Row) else item
+
+
+def iter_nodes(lines: Iterable[str | Row], section: int = 0) -> Iterator[Node]:
+    # "|" 开头且下一行以 "|---" 开头即为表格；其后连续的 "|" 行都是数据行。
+    # 输入也可以混入已解析的 Row（见 regroup），此时沿用其单元格，不再重新解析
+    it = iter(lines)
+    item = next(it, None)
+    while item is not None:
+        line = _item_text(item)
+        if line.startswith("|"):
+            nxt = next(it, None)
+            if nxt is not None and _item_text(nxt).startswith("|---"):
+                header = item if isinstance(item, Row) else Row(line)
+                rows: list[Row] = []
+                item = next(it, None)
+                while item is not None:
+                    text = _item_text(item)
+                    if not text.startswith("|"):
+                        break
+                    rows.append(item if isinstance(item, Row) else Row(text))
+                    item = next(it, None)
+                yield Table(header, _item_text(nxt), rows, section)
+                continue
+            yield TextLine(line, section)
+            item = nxt
+            continue
+
+        number = section_number(line)
+        if number is not None:
+            section = number
+        yield TextLine(line, section)
+        item = next(it, None)
+
+
+def table_lines(table: Table) -> list[str]:
+    return [table.header.render(), table.sep, *(row.render() for row in table.rows)]
+
+
+def has_nested_table(table: Table) -> bool:
+    # 数据行中再次出现 "|---" 时，逐行扫描会把它前一行当作另一张表的表头
+    return any(row.render().startswith("|---") for row in table.rows)
+
+
+def demote_table(table: Table, keep_header: bool = True) -> list[Node]:
+    # 表头未被识别时的回退：表头退化为普通行（或丢弃），其后各行重新扫描
+    lines = table_lines(table)
+    head: list[Node] = [TextLine(lines[0], table.section)] if keep_header else []
+    return head + list(iter_nodes(lines[1:], table.section))
+
+
+class NodeStream:
+    # 可回推的节点流：变换把拆开的节点压回队首后，按原顺序继续处理
+    __slots__ = ("_it", "_stack")
+
+    def __init__(self, nodes: Iterable[Node]) -> None:
+        self._it = iter(nodes)
+        self._stack: list[Node] = []
+
+    def __iter__(self) -> NodeStream:
+        return self
+
+    def __next__(self) -> Node:
+        if self._stack:
+            return self._stack.pop()
+        return next(self._it)
+
+    def push(self, nodes: list[Node]) -> None:
+        self._stack.extend(reversed(nodes))
+
+
+def _iter_items(nodes: Iterable[Node]) -> Iterator[str | Row]:
+    for node in nodes:
+        if isinstance(node, Table):
+            yield node.header
+            yield node.sep
+            yield from node.rows
+        else:
+            yield node.text
+
+
+def regroup(nodes: Iterable[Node]) -> Iterator[Node]:
+    # 变换可能删行或把表头退化为普通行；串联下一个变换前重新分组，
+    # 结果与"序列化后重新解析"一致，但已解析的行不再重新切分单元格
+    return iter_nodes(_iter_items(nodes))
+
+
+def iter_lines(nodes: Iterable[Node]) -> Iterator[str]:
+    for node in nodes:
+        if isinstance(node, Table):
+            yield node.header.render()
+            yield node.sep
+            for row in node.rows:
+                yield row.render()
+        else:
+            yield node.text
+
+
+def render_text(nodes: Iterable[Node]) -> str:
+    return "\n".join(iter_lines(nodes)).rstrip() + "\n"
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import math
+import os
+import re
+import struct
 from dataclasses import dataclass
 from pathlib import Path
 
 from PIL import Image
 
+from png_encoder import DEFAULT_PROFILE, PROFILES, save_png
+
 
 CLIENT_ORDER = [
     "home",
@@ -59,6 +65,34 @@ def _list_pngs(dir_path: Path) -> list[Path]:
     return sorted(dir_path.glob("*.png"))
 
 
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+DEFAULT_THUMB_CACHE = ".cache/ui-thumbnails"
+DEFAULT_THUMB_CACHE_MB = 512
+# Bump when the thumbnail recipe (resampling, conversion) changes.
+THUMB_CACHE_FORMAT = 1
+# Only files named like cache entries are ever evicted from the cache directory.
+THUMB_ENTRY_RE = re.compile(r"^[0-9a-f]{32}-\d+x\d+-v\d+\.png$")
+
+
+def _probe_size(path: Path) -> tuple[int, int]:
+    # Width/height sit in the IHDR chunk right after the signature; no decoder needed.
+    with path.open("rb") as f:
+        head = f.read(24)
+    if head[:8] != PNG_SIGNATURE or head[12:16] != b"IHDR":
+        raise ValueError(f"Not a PNG file: {path}")
+    width, height = struct.unpack(">II", head[16:24])
+    return width, height
+
+
+def _file_hash(path: Path) -> str:
+    # Chunked read instead of hashlib.file_digest, which needs Python 3.11.
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def _sort_by_known_order(paths: list[Path], *, prefix: str, order: list[str]) -> list[Path]:
     rank = {name: idx for idx, name in enumerate(order)}
 
@@ -95,19 +129,14 @@ def _compute_grid_size(sizes: list[tuple[int, int]], margin: int, columns: int)
     return out_w, out_h
 
 
-def _merge_grid(
-    images: list[Image.Image],
-    *,
-    margin: int,
-    background: str,
-    columns: int,
-) -> Image.Image:
-    sizes = [(im.width, im.height) for im in images]
+def _grid_positions(
+    sizes: list[tuple[int, int]], margin: int, columns: int
+) -> tuple[tuple[int, int], list[tuple[int, int]]]:
+    """Grid canvas size and the top-left position of each image, centered in its cell."""
     col_widths, row_heights = _layout_grid(sizes, columns)
 
     out_w = sum(col_widths) + margin * (len(col_widths) + 1)
     out_h = sum(row_heights) + margin * (len(row_heights) + 1)
-    out = Image.new("RGB", (out_w, out_h), color=background)
 
     col_offsets = [margin]
     for w in col_widths[:-1]:
@@ -117,16 +146,21 @@ def _merge_grid(
     for h in row_heights[:-1]:
         row_offsets.append(row_offsets[-1] + h + margin)
 
-    for idx, im in enumerate(images):
+    positions: list[tuple[int, int]] = []
+    for idx, (w, h) in enumerate(sizes):
         row = idx // columns
         col = idx % columns
-        cell_x = col_offsets[col]
-        cell_y = row_offsets[row]
-        x = cell_x + (col_widths[col] - im.width) // 2
-        y = cell_y + (row_heights[row] - im.height) // 2
-        out.paste(im, (x, y))
+        x = col_offsets[col] + (col_widths[col] - w) // 2
+        y = row_offsets[row] + (row_heights[row] - h) // 2
+        positions.append((x, y))
+    return (out_w, out_h), positions
 
-    return out
+
+def _scaled_size(size: tuple[int, int], scale: float) -> tuple[int, int]:
+    # Must match the size _resize produces.
+    if scale >= 1.0:
+        return size
+    return max(1, int(size[0] * scale)), max(1, int(size[1] * scale))
 
 
 def _resize(im: Image.Image, scale: float) -> Image.Image:
@@ -139,24 +173,104 @@ def _resize(im: Image.Image, scale: float) -> Image.Image:
     return im.resize((new_w, new_h), Image.Resampling.LANCZOS)
 
 
-def _stack_vertical(
-    images: list[Image.Image],
+@dataclass
+class ThumbnailCache:
+    """Pre-scaled screenshots keyed by source hash and target size (lossless PNG, same pixels).
+
+    root=None disables the cache; every screenshot is then decoded and resized each run.
+    max_bytes > 0 bounds the directory: prune() evicts the least recently used entries.
+    """
+
+    root: Path | None
+    max_bytes: int = 0
+    hits: int = 0
+    misses: int = 0
+    evicted: int = 0
+
+    def _entry(self, path: Path, size: tuple[int, int]) -> Path | None:
+        if self.root is None:
+            return None
+        return self.root / f"{_file_hash(path)}-{size[0]}x{size[1]}-v{THUMB_CACHE_FORMAT}.png"
+
+    def load(self, path: Path, size: tuple[int, int], scale: float) -> Image.Image:
+        """Decode path as RGB at the scaled size (identical to _resize of the full decode)."""
+        if scale >= 1.0:
+            with Image.open(path) as src:
+                return src.convert("RGB")
+
+        entry = self._entry(path, size)
+        if entry is not None and entry.exists():
+            self.hits += 1
+            os.utime(entry)  # recency for prune()
+            with Image.open(entry) as cached:
+                return cached.convert("RGB")
+
+        with Image.open(path) as src:
+            rgb = src.convert("RGB")
+        im = _resize(rgb, scale)
+        if im is not rgb:
+            rgb.close()
+        if entry is not None:
+            self.misses += 1
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            tmp = entry.with_name(entry.name + ".tmp")
+            im.save(tmp, format="PNG", compress_level=1)
+            os.replace(tmp, entry)
+        return im
+
+    def prune(self) -> None:
+        if self.root is None or self.max_bytes <= 0 or not self.root.is_dir():
+            return
+        entries = [(e.stat(), e) for e in self.root.iterdir() if THUMB_ENTRY_RE.match(e.name)]
+        entries.sort(key=lambda item: item[0].st_mtime_ns, reverse=True)
+        total = 0
+        for st, entry in entries:
+            total += st.st_size
+            if total > self.max_bytes:
+                entry.unlink(missing_ok=True)
+                self.evicted += 1
+
+
+@dataclass(frozen=True)
+class Section:
+    paths: list[Path]
+    sizes: list[tuple[int, int]]  # source sizes, before scaling
+    columns: int
+
+
+def _compose_board(
+    sections: list[Section],
     *,
-    background: str,
+    scale: float,
+    margin: int,
     gap: int,
+    background: str,
+    thumbnails: ThumbnailCache,
 ) -> Image.Image:
-    if not images:
-        raise ValueError("stack_vertical requires at least 1 image")
-    width = max(im.width for im in images)
-    height = sum(im.height for im in images) + gap * (len(images) - 1)
+    """Paste every screenshot straight into the final board.
+
+    Sections are grids stacked vertically and centered, as before, but there is no per-section
+    canvas: each screenshot is opened, converted, resized, pasted and closed in turn, so peak
+    memory is the board plus one screenshot.
+    """
+    grids = []
+    for section in sections:
+        sizes = [_scaled_size(size, scale) for size in section.sizes]
+        grid_size, positions = _grid_positions(sizes, margin, section.columns)
+        grids.append((section.paths, sizes, grid_size, positions))
+
+    width = max(w for _, _, (w, _), _ in grids)
+    height = sum(h for _, _, (_, h), _ in grids) + gap * (len(grids) - 1)
     out = Image.new("RGB", (width, height), color=background)
-    y = 0
-    for idx, im in enumerate(images):
-        x = (width - im.width) // 2
-        out.paste(im, (x, y))
-        y += im.height
-        if idx != len(images) - 1:
-            y += gap
+
+    top = 0
+    for paths, sizes, (grid_w, grid_h), positions in grids:
+        left = (width - grid_w) // 2
+        for path, size, (x, y) in zip(paths, sizes, positions):
+            im = thumbnails.load(path, size, scale)
+            out.paste(im, (left + x, top + y))
+            im.close()
+        top += grid_h + gap
     return out
 
 
@@ -246,6 +360,38 @@ def main() -> None:
         default=120_000_000,
         help="Auto downscale output to stay under this pixel count (default: 120000000). Set 0 to disable.",
     )
+    parser.add_argument(
+        "--png-profile",
+        choices=sorted(PROFILES),
+        default=DEFAULT_PROFILE,
+        help=(
+            "PNG encode profile: fast (dev previews), balanced, smallest (handover builds), "
+            f"smallest-palette (smallest plus a lossless palette for <= 256-color images). Default: {DEFAULT_PROFILE}."
+        ),
+    )
+    parser.add_argument(
+        "--png-colors",
+        type=int,
+        default=0,
+        help="Quantize the board to a palette of N colors (lossy, max 256). Default 0 keeps exact pixels.",
+    )
+    parser.add_argument(
+        "--thumb-cache",
+        default=DEFAULT_THUMB_CACHE,
+        help=(
+            "Cache of downscaled screenshots keyed by source hash and size "
+            f"('none' to disable; default: {DEFAULT_THUMB_CACHE})."
+        ),
+    )
+    parser.add_argument(
+        "--thumb-cache-max-mb",
+        type=int,
+        default=DEFAULT_THUMB_CACHE_MB,
+        help=(
+            "Evict least recently used thumbnails once the cache exceeds this many MB "
+            f"(default: {DEFAULT_THUMB_CACHE_MB}). Set 0 for no limit."
+        ),
+    )
     args = parser.parse_args()
 
     input_dir = Path(args.input_dir)
@@ -273,21 +419,8 @@ def main() -> None:
             "Run: powershell -ExecutionPolicy Bypass -File scripts/capture-ui.ps1"
         )
 
-    client_sizes: list[tuple[int, int]] = []
-    for p in client_paths:
-        im = Image.open(p)
-        try:
-            client_sizes.append(im.size)
-        finally:
-            im.close()
-
-    admin_sizes: list[tuple[int, int]] = []
-    for p in admin_paths:
-        im = Image.open(p)
-        try:
-            admin_sizes.append(im.size)
-        finally:
-            im.close()
+    client_sizes = [_probe_size(p) for p in client_paths]
+    admin_sizes = [_probe_size(p) for p in admin_paths]
 
     scale = _compute_scale_for_combined(
         client_sizes=client_sizes,
@@ -318,46 +451,34 @@ def main() -> None:
         if pixels > args.max_total_pixels:
             scale *= math.sqrt(args.max_total_pixels / pixels)
 
-    images_client = [_resize(Image.open(p).convert("RGB"), scale) for p in client_paths]
-    images_admin = [_resize(Image.open(p).convert("RGB"), scale) for p in admin_paths]
+    margin = max(1, int(args.margin * scale)) if scale < 1.0 else args.margin
+    gap = max(1, int(args.section_gap * scale)) if scale < 1.0 else args.section_gap
+
+    sections: list[Section] = []
+    if client_paths:
+        sections.append(Section(client_paths, client_sizes, args.client_columns))
+    if admin_paths:
+        sections.append(Section(admin_paths, admin_sizes, args.admin_columns))
 
+    thumbnails = ThumbnailCache(
+        None if args.thumb_cache.lower() == "none" else Path(args.thumb_cache),
+        max_bytes=args.thumb_cache_max_mb * 1024 * 1024,
+    )
+    out = _compose_board(
+        sections, scale=scale, margin=margin, gap=gap, background=args.background, thumbnails=thumbnails
+    )
+    thumbnails.prune()
     try:
-        margin = max(1, int(args.margin * scale)) if scale < 1.0 else args.margin
-        gap = max(1, int(args.section_gap * scale)) if scale < 1.0 else args.section_gap
-
-        sections: list[Image.Image] = []
-        if images_client:
-            sections.append(
-                _merge_grid(
-                    images_client,
-                    margin=margin,
-                    background=args.background,
-                    columns=args.client_columns,
-                )
-            )
-        if images_admin:
-            sections.append(
-                _merge_grid(
-                    images_admin,
-                    margin=margin,
-                    background=args.background,
-                    columns=args.admin_columns,
-                )
-            )
-
-        if len(sections) == 1:
-            out = sections[0]
-        else:
-            out = _stack_vertical(sections, background=args.background, gap=gap)
-
-        out.save(output_path, format="PNG", optimize=True)
+        stats = save_png(out, output_path, args.png_profile, colors=args.png_colors)
     finally:
-        for im in images_client:
-            im.close()
-        for im in images_admin:
-            im.close()
+        out.close()
 
-    print(f"Wrote: {output_path} ({out.width}x{out.height})")
+    print(f"Wrote: {output_path} ({out.width}x{out.height}; {stats.describe()})")
+    if thumbnails.root is not None and scale < 1.0:
+        print(
+            f"Thumbnails: {thumbnails.hits} cached, {thumbnails.misses} resized, {thumbnails.evicted} evicted "
+            f"(scale {scale:.3f})"
+        )
 
 
 if __name__ == "__main__":
@@ -10,762 +10,224 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-
-
-DOMAIN_MAP = {
-    "public discovery/search": "公共浏览与检索",
-    "public discovery/patent-map": "公共浏览与专利地图",
-    "my-content create/update/submit": "我的内容创建、编辑与提交",
-    "conversations + notifications": "会话消息与通知",
-    "auth/me/verification": "登录态、个人中心与认证",
-    "orders/payment/address/invoice": "订单、支付、地址与发票",
-    "static/config (no critical API write)": "静态配置展示（无关键写接口）",
-    "client/misc": "小程序通用能力",
-    "favorites": "收藏能力",
-    "admin/misc": "管理后台通用能力",
-    "admin/verifications": "认证审核",
-    "admin/listings-audit": "挂牌审核",
-    "admin/tech-managers": "技术经理管理",
-    "admin/orders": "订单管理",
-    "admin/refunds": "退款管理",
-    "admin/settlements": "结算管理",
-    "admin/invoices": "发票管理",
-    "admin/reports": "报表管理",
-    "admin/comments": "评论管理",
-    "admin/audit-logs": "审计日志",
-    "admin/rbac": "权限管理",
-    "admin/config": "系统配置",
-    "admin/config-home-announcements": "首页公告配置",
-    "admin/patent-maintenance": "专利维保管理",
-    "admin/regions": "地区字典管理",
-    "admin/patents": "专利与认领管理",
-    "admin/dashboard": "后台首页看板",
-}
-
-PACKAGE_MAP = {
-    "main": "主包",
-}
-
-ROUTE_TYPE_MAP = {
-    "path": "路径路由",
-    "index": "默认首页路由",
-}
-
-TAG_MAP = {
-    "Listings": "挂牌",
-    "Achievements": "成果",
-    "Comments": "评论",
-    "Messaging": "消息会话",
-    "Maintenance": "专利维保",
-    "Patents": "专利",
-    "Config": "配置",
-    "Search": "检索",
-    "Organizations": "机构",
-    "TechManagers": "技术经理",
-    "Notifications": "通知",
-    "Orders": "订单",
-    "Payments": "支付",
-    "Contracts": "合同",
-    "Invoices": "发票",
-    "Addresses": "地址",
-    "Verification": "认证",
-    "Auth": "认证",
-    "Admin": "管理后台",
-    "Regions": "地区",
-    "Cases": "工单",
-    "AI": "智能解析",
-    "RBAC": "权限",
-    "Users": "用户",
-    "Dashboard": "看板",
-    "Favorites": "收藏",
-    "Reports": "报表",
-    "Refunds": "退款",
-    "Settlements": "结算",
-    "Announcements": "公告",
-}
-
-PAGE_NAME_HINT = {
-    "verifications": "认证审核",
-    "cases": "工单",
-    "refunds": "退款",
-    "settlements": "结算",
-    "reports": "报表",
-    "comments": "评论",
-    "regions": "地区",
-    "patents": "专利",
-    "patentsoperations": "专利操作",
-    "conversationsplatform": "平台会话",
-    "trade规则": "交易规则",
-    "媒体视频preview": "媒体视频预览",
-    "审计logs": "审计日志",
-}
-
-TOKEN_MAP = {
-    "home": "首页",
-    "tech": "技术",
-    "manager": "经理",
-    "managers": "经理",
-    "publish": "发布",
-    "messages": "消息",
-    "message": "消息",
-    "me": "我的",
-    "search": "检索",
-    "patent": "专利",
-    "patents": "专利",
-    "orders": "订单",
-    "order": "订单",
-    "checkout": "支付",
-    "deposit": "订金",
-    "final": "尾款",
-    "success": "成功",
-    "achievement": "成果",
-    "achievements": "成果",
-    "chat": "会话",
-    "support": "客服",
-    "consultation": "咨询",
-    "faq": "常见问题",
-    "contact": "联系",
-    "legal": "法律",
-    "privacy": "隐私",
-    "terms": "条款",
-    "guide": "指引",
-    "onboarding": "引导",
-    "choose": "选择",
-    "identity": "身份",
-    "verification": "认证",
-    "form": "表单",
-    "notifications": "通知",
-    "notification": "通知",
-    "announcements": "公告",
-    "announcement": "公告",
-    "listing": "挂牌",
-    "listings": "挂牌",
-    "favorites": "收藏",
-    "favorite": "收藏",
-    "organizations": "机构",
-    "organization": "机构",
-    "inventors": "发明人",
-    "inventor": "发明人",
-    "map": "地图",
-    "trade": "交易",
-    "rules": "规则",
-    "contracts": "合同",
-    "contract": "合同",
-    "invoices": "发票",
-    "invoice": "发票",
-    "addresses": "地址",
-    "address": "地址",
-    "edit": "编辑",
-    "claims": "认领",
-    "claim": "认领",
-    "maintenance": "维保",
-    "settings": "设置",
-    "about": "关于",
-    "profile": "资料",
-    "login": "登录",
-    "my": "我的",
-    "ipc": "IPC",
-    "picker": "选择器",
-    "media": "媒体",
-    "video": "视频",
-    "preview": "预览",
-    "admin": "后台",
-    "misc": "杂项",
-    "dashboard": "看板",
-    "auth": "认证",
-    "session": "会话",
-    "conversations": "会话",
-    "conversation": "会话",
-    "platform": "平台",
-    "case": "工单",
-    "cases": "工单",
-    "refunds": "退款",
-    "refund": "退款",
-    "settlements": "结算",
-    "settlement": "结算",
-    "reports": "报表",
-    "report": "报表",
-    "comments": "评论",
-    "comment": "评论",
-    "audit": "审计",
-    "logs": "日志",
-    "log": "日志",
-    "rbac": "权限",
-    "config": "配置",
-    "regions": "地区",
-    "region": "地区",
-    "operations": "操作",
-    "public": "公共",
-    "discovery": "浏览",
-    "static": "静态",
-    "critical": "关键",
-    "write": "写入",
-    "api": "接口",
-    "title": "标题",
-    "summary": "摘要",
-    "description": "描述",
-    "content": "内容",
-    "intro": "简介",
-    "remark": "备注",
-    "words": "词条",
-    "word": "词条",
-    "keyword": "关键词",
-    "keywords": "关键词",
-    "industry": "行业",
-    "tags": "标签",
-    "tag": "标签",
-    "source": "来源",
-    "maturity": "成熟度",
-    "sort": "排序",
-    "name": "名称",
-    "nickname": "昵称",
-    "actor": "操作人",
-    "code": "编码",
-    "id": "ID",
-    "uuid": "唯一ID",
-    "user": "用户",
-    "users": "用户",
-    "publisher": "发布者",
-    "seller": "卖方",
-    "buyer": "买方",
-    "requester": "申请人",
-    "author": "作者",
-    "cover": "封面",
-    "file": "文件",
-    "files": "文件",
-    "type": "类型",
-    "status": "状态",
-    "mode": "模式",
-    "modes": "模式",
-    "level": "级别",
-    "total": "总",
-    "active": "有效",
-    "ranked": "排名",
-    "unassigned": "未分配",
-    "mappable": "可映射",
-    "top": "最高",
-    "plain": "纯文本",
-    "json": "JSON",
-    "is": "是否",
-    "default": "默认",
-    "at": "时间",
-    "created": "创建",
-    "updated": "更新",
-    "display": "显示",
-    "service": "服务",
-    "view": "浏览",
-    "consult": "咨询",
-    "count": "数量",
-    "price": "价格",
-    "amount": "金额",
-    "payment": "支付",
-    "payout": "放款",
-    "tax": "税额",
-    "phone": "手机号",
-    "email": "邮箱",
-    "url": "链接",
-    "role": "角色",
-    "permission": "权限",
-    "featured": "推荐",
-    "parse": "解析",
-    "ai": "智能",
-    "hot": "热门",
-    "sensitive": "敏感",
-    "taxonomy": "分类",
-    "recommendation": "推荐",
-    "banner": "横幅",
-    "template": "模板",
-    "templates": "模板",
-    "item": "条目",
-    "items": "条目",
-    "detail": "详情",
-    "task": "任务",
-    "tasks": "任务",
-    "material": "材料",
-    "materials": "材料",
-    "normalize": "规范化",
-    "list": "列表",
-    "line": "行",
-    "ok": "成功",
-    "shelf": "上架",
-    "off": "下架",
-    "submit": "提交",
-    "approve": "通过",
-    "reject": "驳回",
-    "assign": "分配",
-    "reply": "回复",
-    "send": "发送",
-    "read": "已读",
-    "unread": "未读",
-    "offline": "下线",
-    "publish2": "发布",
-    "regioncode": "地区编码",
-    "industrytags": "行业标签",
-    "keywordsjson": "关键词JSON",
-    "industrytagsjson": "行业标签JSON",
-    "cooperationmodesjson": "合作模式JSON",
-    "servicetagsjson": "服务标签JSON",
-    "reasontagsjson": "原因标签JSON",
-    "summaryplain": "纯文本摘要",
-    "actornickname": "操作人昵称",
-    "isdefault": "是否默认",
-    "page": "页码",
-    "size": "大小",
-    "org": "机构",
-    "category": "分类",
-    "routing": "路由",
-    "license": "许可",
-    "assignee": "受让方",
-    "applicant": "申请人",
-    "schedule": "日程",
-    "application": "申请",
-    "fen": "分",
-    "evidence": "凭证",
-    "proof": "凭证",
-    "duplicate": "重复",
-    "policy": "策略",
-    "operator": "操作人",
-    "reason": "原因",
-    "error": "错误",
-    "severity": "严重级别",
-    "deal": "成交",
-    "failed": "失败",
-    "mime": "媒体",
-    "processed": "处理",
-    "scope": "范围",
-    "bytes": "字节",
-    "skipped": "跳过",
-    "transfer": "转让",
-    "center": "中心",
-    "lat": "纬度",
-    "lng": "经度",
-    "channels": "渠道",
-    "channel": "渠道",
-    "fail": "失败",
-    "finished": "完成",
-    "paused": "暂停",
-    "started": "开始",
-    "verified": "已核验",
-    "encumbrance": "权利负担",
-    "expected": "预计",
-    "completion": "完成",
-    "days": "天",
-    "grant": "授权",
-    "publication": "公开",
-    "issued": "发放",
-    "paid": "已支付",
-    "review": "审核",
-    "urgency": "紧急程度",
-    "can": "可",
-    "confidence": "置信度",
-    "due": "到期",
-    "event": "事件",
-    "features": "特征",
-    "grace": "宽限",
-    "period": "期间",
-    "kind": "类别",
-    "notes": "备注",
-    "priority": "优先级",
-    "replies": "回复",
-    "assigned": "已分配",
-    "agent": "坐席",
-    "close": "关闭",
-    "filters": "筛选",
-    "invalid": "无效",
-    "model": "模型",
-    "version": "版本",
-    "parent": "父级",
-    "pinned": "置顶",
-    "reviewed": "已审核",
-    "row": "行",
-    "score": "分值",
-    "submitted": "已提交",
-    "supply": "供给",
-    "target": "目标",
-    "validated": "已校验",
-    "valid": "有效",
-    "year": "年",
-    "max": "最大",
-    "min": "最小",
-    "abstract": "摘要",
-    "attached": "附加",
-    "executed": "执行",
-    "from": "来源",
-    "late": "延迟",
-    "fee": "费用",
-    "deliverables": "交付物",
-    "loc": "位置",
-    "text": "文本",
-    "enabled": "启用",
-    "job": "任务",
-    "no": "编号",
-    "stats": "统计",
-    "result": "结果",
-    "results": "结果",
-    "applicationnonorm": "标准申请号",
-    "publicationnodisplay": "公开号展示",
-    "grantpublicationnodisplay": "授权公开号展示",
-    "officialreceiptfileid": "官方回执文件ID",
-    "topics": "主题",
-    "date": "日期",
-    "cs": "客服",
-    "cooperation": "合作",
-    "sms": "短信",
-    "intent": "支付意图",
-    "intents": "支付意图",
-    "bind": "绑定",
-    "customer": "客户",
-    "mp": "小程序",
-    "verify": "验证",
-    "execute": "执行",
-    "manual": "手动",
-    "validate": "校验",
-    "dispute": "纠纷",
-    "sla": "服务时效",
-    "notify": "通知回调",
-    "wechatpay": "微信支付",
-    "feedback": "反馈",
-    "finance": "财务",
-    "health": "健康",
-    "temporary": "临时",
-    "ack": "确认",
-    "complete": "完成",
-    "execution": "执行",
-    "overview": "概览",
-    "quote": "报价",
-    "cancel": "取消",
-    "position": "位置",
-    "stamp": "戳",
-    "str": "串",
-    "for": "对应",
-    "package": "参数包",
-    "one": "候选",
-    "of": "项",
-    "link": "链接",
-    "time": "时间",
-    "requested": "请求",
-    "masked": "脱敏",
-    "ranking": "排名",
-    "owned": "已拥有",
-    "enc": "加密",
-    "unified": "统一",
-    "social": "社会",
-    "credit": "信用",
-    "note": "备注",
-    "raw": "原始",
-    "filing": "申请",
-    "range": "范围",
-    "percent": "百分比",
-    "start": "开始",
-    "uploaded": "上传",
-    "signed": "签署",
-    "in": "内",
-    "before": "变更前",
-    "after": "变更后",
-    "request": "请求",
-    "ip": "IP",
-    "device": "设备",
-    "by": "由",
-    "import": "导入",
-    "main": "主",
-    "system": "系统",
-    "key": "键",
-    "to": "至",
-    "commission": "佣金",
-    "avatar": "头像",
-    "rank": "排名",
-    "logo": "标识",
-    "existing": "既有",
-    "negotiable": "可议价",
-    "official": "官方",
-    "receipt": "回执",
-    "pledge": "质押",
-    "rate": "费率",
-    "until": "截止",
-    "action": "操作",
-    "owner": "所有者",
-    "definition": "定义",
-    "rating": "评分",
-    "jurisdiction": "法域",
-    "reconcile": "对账",
-    "pay": "支付",
-    "end": "结束",
-    "method": "方式",
-    "norm": "规范",
-    "last": "最近",
-    "reviewer": "审核人",
-    "counterpart": "对方",
-    "sender": "发送方",
-    "deadline": "截止时间",
-    "primary": "主要",
-    "term": "期限",
-    "txn": "交易",
-    "input": "输入",
-    "normalized": "规范化",
-    "submission": "提交",
-    "boost": "提升",
-    "condition": "条件",
-    "fixed": "固定",
-    "number": "编号",
-    "requests": "请求",
-    "snapshot": "快照",
-    "auto": "自动",
-    "milestones": "里程碑",
-    "payload": "载荷",
-    "published": "已发布",
-    "root": "根",
-    "sent": "已发送",
-    "spec": "规格",
-    "weights": "权重",
-    "as": "作为",
-    "matches": "匹配",
-    "ref": "参考",
-    "cooldown": "冷却",
-    "minutes": "分钟",
-    "generated": "生成",
-    "gross": "总额",
-    "missing": "缺失",
-    "claimed": "已认领",
-    "province": "省",
-    "city": "市",
-    "q": "查询词",
-    "threshold": "阈值",
-    "triggered": "触发",
-    "watermark": "水印",
-    "batch": "批次",
-    "completed": "完成",
-    "business": "工作日",
-    "mappings": "映射",
-    "on": "当",
-    "timeout": "超时",
-    "scenario": "场景",
-    "strategy": "策略",
-    "upload": "上传",
-    "webhook": "回调",
-    "window": "窗口",
-    "audio": "音频",
-    "clear": "清除",
-    "dedupe": "去重",
-    "hours": "小时",
-    "deleted": "已删除",
-    "descendant": "子级",
-    "expires": "过期",
-    "seconds": "秒",
-    "image": "图片",
-    "industries": "行业",
-    "occurred": "发生",
-    "parsed": "解析",
-    "query": "查询",
-    "figure": "图",
-    "decay": "衰减",
-    "half": "半衰",
-    "life": "周期",
-    "value": "数值",
-    "warnings": "警告",
-    "assignments": "分配",
-    "attachments": "附件",
-    "feedbacks": "反馈",
-    "participants": "参与者",
-    "children": "子项",
-    "classifications": "分类",
-    "country": "国家",
-    "export": "导出",
-    "extra": "扩展",
-    "context": "上下文",
-    "idempotency": "幂等",
-    "keys": "键",
-    "identifiers": "标识",
-    "match": "匹配",
-    "milestone": "里程碑",
-    "next": "下一条",
-    "cursor": "游标",
-    "nonce": "随机串",
-    "parties": "参与方",
-    "patch": "补丁",
-    "applied": "已应用",
-    "provider": "服务商",
-    "recognized": "识别",
-    "refresh": "刷新",
-    "hash": "哈希",
-    "response": "响应",
-    "schema": "结构",
-    "sign": "签名",
-    "ttl": "存活期",
-    "wechat": "微信",
-    "openid": "开放ID",
-    "params": "参数",
-    "token": "令牌",
-    "access": "访问",
-}
-
-COMPOUND_MAP = {
-    "off-shelf": "下架",
-    "patent-maintenance": "专利维保",
-    "tech-managers": "技术经理",
-    "home-announcements": "首页公告",
-    "audit-logs": "审计日志",
-    "industry-tags": "行业标签",
-    "hot-search": "热门搜索",
-    "sensitive-words": "敏感词",
-    "trade-rules": "交易规则",
-    "parse-results": "解析结果",
-    "patent-claims": "专利认领",
-    "payment-confirm": "支付确认",
-    "cover-file": "封面文件",
-}
-
-ACTION_MAP = {
-    "approve": "审核通过",
-    "reject": "审核驳回",
-    "publish": "发布",
-    "off-shelf": "下架",
-    "offshelf": "下架",
-    "offline": "下线",
-    "submit": "提交",
-    "ack": "确认",
-    "export": "导出",
-    "upload": "上传",
-    "download": "下载",
-    "bind": "绑定",
-    "unbind": "解绑",
-    "login": "登录",
-    "logout": "退出登录",
-    "refresh": "刷新",
-    "cancel": "取消",
-    "close": "关闭",
-    "open": "开启",
-    "assign": "分配",
-    "reply": "回复",
-    "send": "发送",
-    "read": "已读",
-    "unread": "标记未读",
-    "remove": "移除",
-    "delete": "删除",
-    "status": "更新状态",
-    "sla": "更新SLA",
-    "notes": "新增备注",
-    "evidence": "上传凭证",
-    "agents": "分配坐席",
-    "quote": "报价",
-    "receipt": "上传回执",
-    "reconcile": "对账",
-    "payment-confirm": "确认支付",
-}
+from typing import Callable, Iterable, Iterator
+
+from glossary import glossary_version, load_table, table_version
+from handover_ir import (
+    SECTION_RE,
+    Node,
+    NodeStream,
+    Row,
+    Table,
+    TextLine,
+    demote_table,
+    format_row,
+    has_nested_table,
+    iter_lines,
+    iter_nodes,
+    parse_cells,
+    render_text,
+    sep_row,
+)
+from translation_cache import shared_cache, translator_version
+
+
+DOMAIN_MAP = load_table("normalize.domain")
+PACKAGE_MAP = load_table("normalize.package")
+ROUTE_TYPE_MAP = load_table("normalize.route_type")
+TAG_MAP = load_table("normalize.tag")
+PAGE_NAME_HINT = load_table("normalize.page_name_hint")
+TOKEN_MAP = load_table("normalize.token")
+COMPOUND_MAP = load_table("normalize.compound")
+ACTION_MAP = load_table("normalize.action")
 
 
 def has_chinese(text: str) -> bool:
     return bool(re.search(r"[\u4e00-\u9fff]", text))
 
 
-def parse_cells(line: str) -> list[str]:
-    return [c.strip() for c in line.strip().strip("|").split("|")]
+ANNOTATION_PAREN_RE = re.compile("[（）]")
 
 
-def format_row(cells: list[str]) -> str:
-    return "| " + " | ".join(cells) + " |"
+@dataclass(frozen=True, slots=True)
+class AnnotatedCell:
+    base: str  # 去掉全部（…）注释并压缩空白后的原值
+    annotation: str  # 末尾（…）内的注释；末尾不是注释时为空串
 
 
-def sep_row(columns: int) -> str:
-    return "|" + "|".join(["---"] * columns) + "|"
+@lru_cache(maxsize=65536)
+def parse_annotated(value: str) -> AnnotatedCell:
+    # 同一单元格值（包名、业务域、标签、端别等）在文档中大量重复，解析结果按值缓存
+    if "（" not in value:
+        # 没有左括号时不会删除任何字符（单独的"）"原样保留），只需压缩空白
+        return AnnotatedCell(" ".join(value.split()), "")
+
+    # 跳跃式扫描：depth 为 0 时整段保留直到下一个"（"；括号内只找下一个括号。
+    # 未闭合的"（"会吞掉其后全部内容，与逐字符扫描一致
+    kept: list[str] = []
+    depth = 0
+    pos = 0
+    group_start = group_end = -1
+    while True:
+        if depth == 0:
+            idx = value.find("（", pos)
+            if idx < 0:
+                kept.append(value[pos:])
+                break
+            kept.append(value[pos:idx])
+            depth = 1
+            group_start = idx
+            pos = idx + 1
+            continue
+        m = ANNOTATION_PAREN_RE.search(value, pos)
+        if m is None:
+            break
+        pos = m.end()
+        if m.group() == "（":
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                group_end = m.start()
+
+    annotation = ""
+    if group_end > group_start >= 0 and not value[group_end + 1 :].strip():
+        annotation = value[group_start + 1 : group_end]
+    return AnnotatedCell(" ".join("".join(kept).split()), annotation)
 
 
 def strip_trailing_annotation(value: str) -> str:
     if not value:
         return ""
-    out_chars: list[str] = []
-    depth = 0
-    for ch in value:
-        if ch == "（":
-            depth += 1
-            continue
-        if ch == "）":
-            if depth > 0:
-                depth -= 1
-                continue
-        if depth == 0:
-            out_chars.append(ch)
-    cleaned = "".join(out_chars)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
-    return cleaned
+    return parse_annotated(value).base
+
+
+CAMEL_BOUNDARY_RE = re.compile(r"([a-z0-9])([A-Z])")
+IDENTIFIER_PART_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z]|\d|$)|[A-Z]?[a-z]+|\d+")
+DIGITS_RE = re.compile(r"\d+")
+WORD_RE = re.compile(r"[A-Za-z][A-Za-z0-9_-]*")
+# 等价于依次执行 \s*/\s* -> 、，\s*\+\s* -> 、，\s+ -> 空串
+SEPARATOR_RE = re.compile(r"(\s*[/+]\s*)|\s+")
+UPPER_TOKENS = {"API", "UUID", "JSON", "URL", "IPC", "RBAC", "SLA", "PDF", "AI", "AT"}
 
 
 def split_identifier(token: str) -> list[str]:
     token = token.replace("-", "_")
-    token = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", token)
+    token = CAMEL_BOUNDARY_RE.sub(r"\1_\2", token)
     parts: list[str] = []
     for part in token.split("_"):
         if not part:
             continue
-        matches = re.findall(r"[A-Z]+(?=[A-Z][a-z]|\d|$)|[A-Z]?[a-z]+|\d+", part)
+        matches = IDENTIFIER_PART_RE.findall(part)
         parts.extend(matches or [part])
     return parts
 
 
-def token_to_cn(token: str) -> str:
-    raw = token.strip()
-    if not raw:
-        return ""
-    low = raw.lower()
-    if low in TOKEN_MAP:
-        return TOKEN_MAP[low]
-    if low.endswith("s") and low[:-1] in TOKEN_MAP:
-        return TOKEN_MAP[low[:-1]]
-    if low == "id":
-        return "ID"
-    if re.fullmatch(r"\d+", raw):
-        return raw
-    if raw.upper() in {"API", "UUID", "JSON", "URL", "IPC", "RBAC", "SLA", "PDF", "AI", "AT"}:
-        return raw.upper()
-    if len(raw) <= 3 and raw.isupper():
+class PhraseTranslator:
+    """PAGE_NAME_HINT / COMPOUND_MAP / TOKEN_MAP 只编译一次；单词译文按词缓存。"""
+
+    def __init__(self, page_hints: dict[str, str], compounds: dict[str, str], tokens: dict[str, str]) -> None:
+        self.page_hints = page_hints
+        self.compounds = compounds
+        self.tokens = tokens
+        # 复合词之间存在首尾重叠（如 hot-search / home-announcements），逐条替换的先后顺序
+        # 会影响结果；因此用一个交替正则做一次扫描预判，命中时才按原顺序逐条替换
+        self._compound_any = (
+            re.compile("|".join(re.escape(src) for src in compounds), re.IGNORECASE) if compounds else None
+        )
+        self._compound_passes = [(re.compile(re.escape(src), re.IGNORECASE), dst) for src, dst in compounds.items()]
+        self._word_cache: dict[str, str] = {}
+
+    def token(self, token: str) -> str:
+        raw = token.strip()
+        if not raw:
+            return ""
+        low = raw.lower()
+        if low in self.tokens:
+            return self.tokens[low]
+        if low.endswith("s") and low[:-1] in self.tokens:
+            return self.tokens[low[:-1]]
+        if low == "id":
+            return "ID"
+        if DIGITS_RE.fullmatch(raw):
+            return raw
+        if raw.upper() in UPPER_TOKENS:
+            return raw.upper()
+        if len(raw) <= 3 and raw.isupper():
+            return raw
         return raw
-    return raw
 
+    def word(self, word: str) -> str:
+        cached = self._word_cache.get(word)
+        if cached is not None:
+            return cached
+        lower = word.lower()
+        if lower in self.page_hints:
+            converted = self.page_hints[lower]
+        elif lower in self.compounds:
+            converted = self.compounds[lower]
+        else:
+            converted = "".join(self.token(p) for p in split_identifier(word)) or word
+        self._word_cache[word] = converted
+        return converted
 
-def phrase_to_cn(text: str) -> str:
-    source = text.strip().strip("`")
-    if not source or source == "-":
-        return source
+    def _word_repl(self, match: re.Match[str]) -> str:
+        return self.word(match.group(0))
 
-    lower_source = source.lower()
-    if lower_source in PAGE_NAME_HINT:
-        return PAGE_NAME_HINT[lower_source]
-    if lower_source in COMPOUND_MAP:
-        return COMPOUND_MAP[lower_source]
+    def translate(self, text: str) -> str:
+        source = text.strip().strip("`")
+        if not source or source == "-":
+            return source
 
-    normalized = source.replace("+", " + ")
+        lower_source = source.lower()
+        if lower_source in self.page_hints:
+            return self.page_hints[lower_source]
+        if lower_source in self.compounds:
+            return self.compounds[lower_source]
 
-    # 先替换复合词，避免逐词拆分后出现“下架上架”之类重复表达
-    for src, dst in COMPOUND_MAP.items():
-        normalized = re.sub(re.escape(src), dst, normalized, flags=re.IGNORECASE)
+        normalized = source.replace("+", " + ")
 
-    def repl(match: re.Match[str]) -> str:
-        word = match.group(0)
-        lower = word.lower()
-        if lower in PAGE_NAME_HINT:
-            return PAGE_NAME_HINT[lower]
-        if lower in COMPOUND_MAP:
-            return COMPOUND_MAP[lower]
-        pieces = split_identifier(word)
-        converted = "".join(token_to_cn(p) for p in pieces)
-        return converted if converted else word
-
-    converted = re.sub(r"[A-Za-z][A-Za-z0-9_-]*", repl, normalized)
-    converted = re.sub(r"\s*/\s*", "、", converted)
-    converted = re.sub(r"\s*\+\s*", "、", converted)
-    converted = re.sub(r"\s+", "", converted)
-    converted = converted.replace("（）", "")
-    return converted
+        # 先替换复合词，避免逐词拆分后出现“下架上架”之类重复表达
+        if self._compound_any is not None and self._compound_any.search(normalized):
+            for pattern, dst in self._compound_passes:
+                normalized = pattern.sub(dst, normalized)
+
+        converted = WORD_RE.sub(self._word_repl, normalized)
+        converted = SEPARATOR_RE.sub(_separator_repl, converted)
+        return converted.replace("（）", "")
+
+
+def _separator_repl(match: re.Match[str]) -> str:
+    return "、" if match.lastindex else ""
+
+
+PHRASE_TRANSLATOR = PhraseTranslator(PAGE_NAME_HINT, COMPOUND_MAP, TOKEN_MAP)
+
+
+def token_to_cn(token: str) -> str:
+    return PHRASE_TRANSLATOR.token(token)
+
+
+def phrase_to_cn(text: str) -> str:
+    return PHRASE_TRANSLATOR.translate(text)
 
 
 def append_cn_annotation(value: str, cn_text: str) -> str:
-    base = strip_trailing_annotation(value)
-    if not cn_text:
-        return base
-    if base == cn_text:
-        return base
-    return f"{base}（{cn_text}）"
+    cell = parse_annotated(value)
+    if not cn_text or cell.base == cn_text:
+        return cell.base
+    # 上次运行的输出已带同一注释时原样返回，不再重新拼接
+    if cell.annotation == cn_text and value == f"{cell.base}（{cn_text}）":
+        return value
+    return f"{cell.base}（{cn_text}）"
 
 
 def package_desc(package_value: str) -> str:
@@ -890,11 +352,26 @@ def field_base_from_path(field_path: str) -> str:
     return target
 
 
+ONE_OF_RE = re.compile(r"oneOf(\d+)", re.IGNORECASE)
+
+# 第5/6章数千行字段反复出现同名字段（createdAt/status/...），按字段名缓存译文
+TRANSLATION_CACHE = shared_cache()
+CACHE_VERSION = translator_version(
+    table_version("normalize.page_name_hint", "normalize.compound", "normalize.token"),
+    __file__,
+    Path(__file__).with_name("handover_ir.py"),
+)
+
+
 def field_desc_from_path(field_path: str) -> str:
     base = field_base_from_path(field_path)
     if not base:
         return "-"
-    one_of_match = re.fullmatch(r"oneOf(\d+)", base, flags=re.IGNORECASE)
+    return TRANSLATION_CACHE.lookup("normalize.field_desc", CACHE_VERSION, base, _field_desc_from_base)
+
+
+def _field_desc_from_base(base: str) -> str:
+    one_of_match = ONE_OF_RE.fullmatch(base)
     if one_of_match:
         return f"候选类型{one_of_match.group(1)}"
     desc = phrase_to_cn(base)
@@ -930,240 +407,422 @@ def build_toc_lines() -> list[str]:
     ]
 
 
-def upsert_toc(lines: list[str]) -> list[str]:
-    cleaned: list[str] = []
-    i = 0
-    while i < len(lines):
-        if lines[i].strip() == "## 目录":
-            i += 1
-            while i < len(lines):
-                if re.match(r"^##\s+\d+\.", lines[i]):
-                    break
-                i += 1
-            continue
-        cleaned.append(lines[i])
-        i += 1
-
-    insert_at = 0
-    for idx, line in enumerate(cleaned):
-        if re.match(r"^##\s+1\.", line):
-            insert_at = idx
-            break
-
-    return cleaned[:insert_at] + build_toc_lines() + cleaned[insert_at:]
+FIRST_SECTION_RE = re.compile(r"^##\s+1\.")
+PAGE_HEADING_RE = re.compile(r"^(####\s+[A-Z]+-\d+\s+`[^`]+`\s+)(.+)$")
 
+RowRewriter = Callable[[list[str]], "list[str] | None"]
 
-def enhance_markdown(text: str) -> str:
-    lines = text.splitlines()
-    lines = upsert_toc(lines)
 
-    out: list[str] = []
-    section = 0
-    i = 0
+def iter_source_lines(path: Path) -> Iterator[str]:
+    # 逐行读取，切分口径与 str.splitlines() 一致，避免整份文档驻留内存
+    with path.open("r", encoding="utf-8-sig") as fh:
+        for raw in fh:
+            yield from raw.splitlines()
 
-    while i < len(lines):
-        line = lines[i]
 
-        if line.startswith("## "):
-            m = re.match(r"^##\s+(\d+)\.", line)
-            if m:
-                section = int(m.group(1))
-            out.append(line)
-            i += 1
-            continue
-
-        if line.startswith("#### "):
-            hm = re.match(r"^(####\s+[A-Z]+-\d+\s+`[^`]+`\s+)(.+)$", line)
-            if hm:
-                suffix = normalize_page_name(hm.group(2), "")
-                out.append(hm.group(1) + suffix)
-                i += 1
+def iter_with_toc(nodes: Iterable[Node]) -> Iterator[Node]:
+    # 删除旧目录（到下一个 "## N." 为止），并在 "## 1." 之前插入新目录；
+    # 只有 "## 1." 之前的少量前言节点需要缓冲
+    pending: list[Node] | None = []
+    skipping = False
+    for node in nodes:
+        text = node.text if isinstance(node, TextLine) else None
+        if skipping:
+            if text is None or not SECTION_RE.match(text):
                 continue
-
-        # Section 1 table
-        if (
-            section == 1
-            and i + 1 < len(lines)
-            and lines[i].startswith("|")
-            and lines[i + 1].startswith("|---")
-        ):
-            header = parse_cells(lines[i])
-            if header == ["页面编号", "页面路径", "页面名称", "所属包", "业务域"]:
-                out.append(format_row(header))
-                out.append(sep_row(len(header)))
-                i += 2
-                while i < len(lines) and lines[i].startswith("|"):
-                    row = parse_cells(lines[i])
-                    if len(row) >= 5 and row[0].startswith("MP-"):
-                        row = row[:5]
-                        row[2] = normalize_page_name(row[2], row[1])
-                        row[3] = append_cn_annotation(row[3], package_desc(row[3]))
-                        row[4] = append_cn_annotation(row[4], domain_desc(row[4]))
-                        out.append(format_row(row))
-                    else:
-                        out.append(lines[i])
-                    i += 1
-                continue
-
-        # Section 2 table
-        if (
-            section == 2
-            and i + 1 < len(lines)
-            and lines[i].startswith("|")
-            and lines[i + 1].startswith("|---")
-        ):
-            header = parse_cells(lines[i])
-            if header == ["页面编号", "路由类型", "路由路径", "页面名称", "业务域"]:
-                out.append(format_row(header))
-                out.append(sep_row(len(header)))
-                i += 2
-                while i < len(lines) and lines[i].startswith("|"):
-                    row = parse_cells(lines[i])
-                    if len(row) >= 5 and row[0].startswith("ADM-"):
-                        row = row[:5]
-                        row[1] = append_cn_annotation(row[1], route_type_desc(row[1]))
-                        row[3] = normalize_page_name(row[3], row[2])
-                        row[4] = append_cn_annotation(row[4], domain_desc(row[4]))
-                        out.append(format_row(row))
-                    else:
-                        out.append(lines[i])
-                    i += 1
-                continue
-
-        # Section 3 summary table
-        if (
-            section == 3
-            and i + 1 < len(lines)
-            and lines[i].startswith("|")
-            and lines[i + 1].startswith("|---")
+            skipping = False
+        if text is not None and text.strip() == "## 目录":
+            skipping = True
+            continue
+        if pending is not None:
+            if text is not None and FIRST_SECTION_RE.match(text):
+                yield from pending
+                yield from (TextLine(line) for line in build_toc_lines())
+                pending = None
+                yield node
+            else:
+                pending.append(node)
+            continue
+        yield node
+
+    if pending is not None:
+        yield from (TextLine(line) for line in build_toc_lines())
+        yield from pending
+
+
+def _rewrite_client_page_row(row: list[str]) -> list[str] | None:
+    if len(row) >= 5 and row[0].startswith("MP-"):
+        row = row[:5]
+        row[2] = normalize_page_name(row[2], row[1])
+        row[3] = append_cn_annotation(row[3], package_desc(row[3]))
+        row[4] = append_cn_annotation(row[4], domain_desc(row[4]))
+        return row
+    return None
+
+
+def _rewrite_admin_page_row(row: list[str]) -> list[str] | None:
+    if len(row) >= 5 and row[0].startswith("ADM-"):
+        row = row[:5]
+        row[1] = append_cn_annotation(row[1], route_type_desc(row[1]))
+        row[3] = normalize_page_name(row[3], row[2])
+        row[4] = append_cn_annotation(row[4], domain_desc(row[4]))
+        return row
+    return None
+
+
+def _rewrite_page_summary_row(row: list[str]) -> list[str] | None:
+    if len(row) >= 5 and (row[0].startswith("MP-") or row[0].startswith("ADM-")):
+        row = row[:5]
+        row[1] = normalize_page_name(row[1], "")
+        return row
+    return None
+
+
+def _rewrite_page_api_row(row: list[str]) -> list[str] | None:
+    if len(row) >= 5:
+        method = row[0]
+        path = row[1]
+        opid = row[2]
+        auth = row[3]
+        tags = translate_tags(row[4])
+        if method.strip() == "-":
+            desc = "-"
+        else:
+            desc = api_desc("", method, path, opid)
+        return [method, path, opid, auth, tags, desc]
+    return None
+
+
+def _rewrite_api_row(row: list[str]) -> list[str] | None:
+    if len(row) >= 7:
+        side = append_cn_annotation(row[0], side_desc(row[0]))
+        method = row[1]
+        path = row[2]
+        opid = row[3]
+        auth = row[4]
+        tags = translate_tags(row[5])
+        schemas = row[6]
+        desc = api_desc(row[0], method, path, opid)
+        return [side, method, path, opid, auth, tags, schemas, desc]
+    return None
+
+
+def _rewrite_schema_field_row(row: list[str]) -> list[str] | None:
+    if len(row) >= 5 and row[0].startswith("`"):
+        row = row[:5]
+        row[4] = normalize_desc(row[4], row[0])
+        return row
+    return None
+
+
+def _rewrite_prisma_field_row(row: list[str]) -> list[str] | None:
+    if len(row) >= 6 and row[0].startswith("`"):
+        row = row[:6]
+        row[5] = normalize_desc(row[5], row[0])
+        return row
+    return None
+
+
+def match_table_rule(section: int, header: list[str]) -> tuple[list[str], RowRewriter] | None:
+    # 返回 (新表头, 行改写函数)；行改写函数返回 None 表示原样保留该行
+    if section == 1 and header == ["页面编号", "页面路径", "页面名称", "所属包", "业务域"]:
+        return header, _rewrite_client_page_row
+    if section == 2 and header == ["页面编号", "路由类型", "路由路径", "页面名称", "业务域"]:
+        return header, _rewrite_admin_page_row
+    if section == 3:
+        if header == ["页面编号", "页面名称", "关联接口数", "关联 Schema 数", "关联字段总数"]:
+            return header, _rewrite_page_summary_row
+        # Section 3.1 interface table
+        if header in (
+            ["方法", "路径", "OperationId", "鉴权", "标签"],
+            ["方法", "路径", "OperationId", "鉴权", "标签", "接口说明"],
         ):
-            header = parse_cells(lines[i])
-            if header == ["页面编号", "页面名称", "关联接口数", "关联 Schema 数", "关联字段总数"]:
-                out.append(format_row(header))
-                out.append(sep_row(len(header)))
-                i += 2
-                while i < len(lines) and lines[i].startswith("|"):
-                    row = parse_cells(lines[i])
-                    if len(row) >= 5 and (row[0].startswith("MP-") or row[0].startswith("ADM-")):
-                        row = row[:5]
-                        row[1] = normalize_page_name(row[1], "")
-                        out.append(format_row(row))
-                    else:
-                        out.append(lines[i])
-                    i += 1
-                continue
-
-            # Section 3.1 interface table
-            if header == ["方法", "路径", "OperationId", "鉴权", "标签"] or header == [
-                "方法",
-                "路径",
-                "OperationId",
-                "鉴权",
-                "标签",
-                "接口说明",
-            ]:
-                new_header = ["方法", "路径", "OperationId", "鉴权", "标签", "接口说明"]
-                out.append(format_row(new_header))
-                out.append(sep_row(len(new_header)))
-                i += 2
-                while i < len(lines) and lines[i].startswith("|"):
-                    row = parse_cells(lines[i])
-                    if len(row) >= 5:
-                        method = row[0]
-                        path = row[1]
-                        opid = row[2]
-                        auth = row[3]
-                        tags = translate_tags(row[4])
-                        if method.strip() == "-":
-                            desc = "-"
-                        else:
-                            desc = api_desc("", method, path, opid)
-                        out.append(format_row([method, path, opid, auth, tags, desc]))
-                    else:
-                        out.append(lines[i])
-                    i += 1
+            return ["方法", "路径", "OperationId", "鉴权", "标签", "接口说明"], _rewrite_page_api_row
+    if section == 4 and header[:7] == ["端别", "方法", "路径", "OperationId", "鉴权", "标签", "关联 Schema"]:
+        return (
+            ["端别", "方法", "路径", "OperationId", "鉴权", "标签", "关联 Schema", "接口说明"],
+            _rewrite_api_row,
+        )
+    if section == 5 and header == ["字段路径", "类型", "必填", "枚举", "说明"]:
+        return header, _rewrite_schema_field_row
+    if section == 6 and header == ["字段", "类型", "必填", "枚举", "Prisma 属性", "字段说明"]:
+        return header, _rewrite_prisma_field_row
+    return None
+
+
+@lru_cache(maxsize=65536)
+def rewrite_row_text(rewrite_row: RowRewriter, line: str) -> str | None:
+    # 字段表中大量行完全相同（如 id/createdAt），重跑自身输出时几乎全部命中，只剩拷贝开销
+    cells = rewrite_row(parse_cells(line))
+    return None if cells is None else format_row(cells)
+
+
+def normalize_nodes(nodes: Iterable[Node]) -> Iterator[Node]:
+    # 逐节点改写：识别的表格按规则重写表头与数据行，其余节点原样透传
+    stream = NodeStream(nodes)
+    for node in stream:
+        if isinstance(node, Table):
+            rule = match_table_rule(node.section, node.header.cells)
+            if rule is None:
+                if has_nested_table(node):
+                    stream.push(demote_table(node))
+                else:
+                    yield node
                 continue
+            header, rewrite_row = rule
+            rows: list[Row] = []
+            for row in node.rows:
+                out = rewrite_row_text(rewrite_row, row.render())
+                rows.append(row if out is None else Row(out))
+            yield Table(Row(cells=header), sep_row(len(header)), rows, node.section)
+            continue
 
-        # Section 4 table
-        if (
-            section == 4
-            and i + 1 < len(lines)
-            and lines[i].startswith("|")
-            and lines[i + 1].startswith("|---")
-        ):
-            header = parse_cells(lines[i])
-            if header[:7] == ["端别", "方法", "路径", "OperationId", "鉴权", "标签", "关联 Schema"]:
-                new_header = ["端别", "方法", "路径", "OperationId", "鉴权", "标签", "关联 Schema", "接口说明"]
-                out.append(format_row(new_header))
-                out.append(sep_row(len(new_header)))
-                i += 2
-                while i < len(lines) and lines[i].startswith("|"):
-                    row = parse_cells(lines[i])
-                    if len(row) >= 7:
-                        side = append_cn_annotation(row[0], side_desc(row[0]))
-                        method = row[1]
-                        path = row[2]
-                        opid = row[3]
-                        auth = row[4]
-                        tags = translate_tags(row[5])
-                        schemas = row[6]
-                        desc = api_desc(row[0], method, path, opid)
-                        out.append(format_row([side, method, path, opid, auth, tags, schemas, desc]))
-                    else:
-                        out.append(lines[i])
-                    i += 1
+        if node.text.startswith("#### "):
+            hm = PAGE_HEADING_RE.match(node.text)
+            if hm:
+                yield TextLine(hm.group(1) + normalize_page_name(hm.group(2), ""), node.section)
                 continue
+        yield node
 
-        # Section 5 table
-        if (
-            section == 5
-            and i + 1 < len(lines)
-            and lines[i].startswith("|")
-            and lines[i + 1].startswith("|---")
-        ):
-            header = parse_cells(lines[i])
-            if header == ["字段路径", "类型", "必填", "枚举", "说明"]:
-                out.append(format_row(header))
-                out.append(sep_row(len(header)))
-                i += 2
-                while i < len(lines) and lines[i].startswith("|"):
-                    row = parse_cells(lines[i])
-                    if len(row) >= 5 and row[0].startswith("`"):
-                        row = row[:5]
-                        row[4] = normalize_desc(row[4], row[0])
-                        out.append(format_row(row))
-                    else:
-                        out.append(lines[i])
-                    i += 1
-                continue
 
-        # Section 6 table
-        if (
-            section == 6
-            and i + 1 < len(lines)
-            and lines[i].startswith("|")
-            and lines[i + 1].startswith("|---")
-        ):
-            header = parse_cells(lines[i])
-            if header == ["字段", "类型", "必填", "枚举", "Prisma 属性", "字段说明"]:
-                out.append(format_row(header))
-                out.append(sep_row(len(header)))
-                i += 2
-                while i < len(lines) and lines[i].startswith("|"):
-                    row = parse_cells(lines[i])
-                    if len(row) >= 6 and row[0].startswith("`"):
-                        row = row[:6]
-                        row[5] = normalize_desc(row[5], row[0])
-                        out.append(format_row(row))
-                    else:
-                        out.append(lines[i])
-                    i += 1
-                continue
+def iter_enhanced_lines(lines: Iterable[str], section: int = 0) -> Iterator[str]:
+    return iter_lines(normalize_nodes(iter_nodes(lines, section)))
 
-        out.append(line)
-        i += 1
 
-    return "\n".join(out).rstrip() + "\n"
+def enhance_markdown(text: str) -> str:
+    return render_text(normalize_nodes(iter_with_toc(iter_nodes(text.splitlines()))))
+
+
+def write_lines(lines: Iterable[str], out_path: Path) -> None:
+    # 与 "\n".join(lines).rstrip() + "\n" 等价的流式写出：只缓冲末尾的空白行；
+    # 先写临时文件再替换，输入输出为同一文件时也安全
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8-sig", newline="\n") as fh:
+            tail: list[str] = []
+            wrote = False
+            for line in lines:
+                if line.strip():
+                    for held in tail:
+                        if wrote:
+                            fh.write("\n")
+                        fh.write(held)
+                        wrote = True
+                    tail = [line]
+                else:
+                    tail.append(line)
+            if tail and tail[0].strip():
+                if wrote:
+                    fh.write("\n")
+                fh.write(tail[0].rstrip())
+            fh.write("\n")
+        os.replace(tmp_path, out_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def normalize_block(item: tuple[int, list[str]]) -> list[str]:
+    section, block = item
+    return list(iter_enhanced_lines(block, section))
+
+
+def _init_worker(cache_path: Path | None) -> None:
+    # 子进程预载译文缓存；子进程新算出的译文不回写，落盘缓存仍由主进程负责
+    if cache_path is not None:
+        TRANSLATION_CACHE.load(cache_path)
+
+
+def normalize_blocks(
+    items: list[tuple[int, list[str]]],
+    jobs: int,
+    cache_path: Path | None = None,
+) -> list[list[str]]:
+    # 进程池并行改写各块，pool.map 保证结果按输入顺序返回
+    if jobs <= 1 or len(items) < 2:
+        return [normalize_block(item) for item in items]
+    chunksize = max(1, len(items) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(cache_path,)) as pool:
+        return list(pool.map(normalize_block, items, chunksize=chunksize))
+
+
+MANIFEST_FORMAT = 1
+BLOCK_HEADING_PREFIXES = ("## ", "### ", "#### ")
+
+
+def iter_blocks(lines: Iterable[str]) -> Iterator[tuple[int, list[str]]]:
+    # 按 "## " / "### " / "#### " 标题切块，并带上块起始处的章节号；
+    # 表格不会跨越标题行，因此各块在给定章节号后可独立改写
+    section = 0
+    block_section = 0
+    block: list[str] = []
+    for line in lines:
+        if line.startswith(BLOCK_HEADING_PREFIXES):
+            if block:
+                yield block_section, block
+            block = [line]
+            block_section = section
+            m = SECTION_RE.match(line)
+            if m:
+                section = int(m.group(1))
+        else:
+            block.append(line)
+    if block:
+        yield block_section, block
+
+
+def content_end(lines: list[str]) -> int:
+    # 块末尾空行的起点：空行取决于与下一块的间隔（文件末尾换行、编辑时增删的空行），不属于块内容
+    end = len(lines)
+    while end and not lines[end - 1].strip():
+        end -= 1
+    return end
+
+
+def block_hash(section: int, lines: list[str]) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{section}\n".encode("utf-8"))
+    digest.update("\n".join(lines[: content_end(lines)]).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def engine_version() -> str:
+    # 脚本本身、术语表或共用 IR 变化时，旧清单全部失效
+    digest = hashlib.sha1(Path(__file__).read_bytes())
+    digest.update(Path(__file__).with_name("handover_ir.py").read_bytes())
+    digest.update(glossary_version().encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def load_manifest(path: Path, engine: str) -> dict[str, str]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("format") != MANIFEST_FORMAT or payload.get("engine") != engine:
+        return {}
+    blocks = payload.get("blocks")
+    return blocks if isinstance(blocks, dict) else {}
+
+
+def save_manifest(path: Path, engine: str, blocks: dict[str, str]) -> None:
+    payload = {"format": MANIFEST_FORMAT, "engine": engine, "blocks": blocks}
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def load_previous_blocks(path: Path, wanted: set[str]) -> dict[str, list[str]]:
+    previous: dict[str, list[str]] = {}
+    if not wanted or not path.exists():
+        return previous
+    for section, block in iter_blocks(iter_source_lines(path)):
+        key = block_hash(section, block)
+        if key in wanted:
+            previous[key] = block
+    return previous
+
+
+class IncrementalNormalizer:
+    """未变化的块直接复用上次输出，只有变化块重新走表格改写。"""
+
+    def __init__(self, manifest: dict[str, str], previous: dict[str, list[str]]) -> None:
+        self.manifest = manifest
+        self.known_outputs = set(manifest.values())
+        self.previous = previous
+        self.blocks: dict[str, str] = {}
+        self.reused = 0
+        self.processed = 0
+
+    def reuse(self, key: str, block: list[str]) -> list[str] | None:
+        # 原地生成时输入本身就是上次的输出
+        if key in self.known_outputs:
+            return block
+        out_key = self.manifest.get(key)
+        if out_key is None:
+            return None
+        out = self.previous.get(out_key)
+        if out is None:
+            return None
+        # 改写不增删块尾空行，复用时沿用本次输入的块尾空行
+        return out[: content_end(out)] + block[content_end(block) :]
+
+    def iter_lines(
+        self,
+        blocks: Iterable[tuple[int, list[str]]],
+        jobs: int = 1,
+        cache_path: Path | None = None,
+    ) -> Iterator[str]:
+        if jobs <= 1:
+            for section, block in blocks:
+                key = block_hash(section, block)
+                out = self.reuse(key, block)
+                if out is None:
+                    out = normalize_block((section, block))
+                    self.processed += 1
+                else:
+                    self.reused += 1
+                self.blocks[key] = block_hash(section, out)
+                yield from out
+            return
+
+        planned: list[tuple[int, str, list[str], list[str] | None]] = []
+        for section, block in blocks:
+            key = block_hash(section, block)
+            planned.append((section, key, block, self.reuse(key, block)))
+        pending = [(section, block) for section, _, block, out in planned if out is None]
+        results = iter(normalize_blocks(pending, jobs, cache_path))
+        for section, key, _, out in planned:
+            if out is None:
+                out = next(results)
+                self.processed += 1
+            else:
+                self.reused += 1
+            self.blocks[key] = block_hash(section, out)
+            yield from out
+
+    def stats(self) -> str:
+        return f"reused={self.reused} processed={self.processed} blocks={self.reused + self.processed}"
+
+
+def _iter_parallel_lines(lines: Iterable[str], jobs: int, cache_path: Path | None) -> Iterator[str]:
+    for out in normalize_blocks(list(iter_blocks(lines)), jobs, cache_path):
+        yield from out
+
+
+def write_normalized(
+    nodes: Iterable[Node],
+    in_path: Path,
+    out_path: Path,
+    *,
+    incremental: bool = False,
+    manifest_path: Path | None = None,
+    jobs: int = 1,
+    cache_path: Path | None = None,
+    observe: Callable[[Iterator[str]], Iterator[str]] | None = None,
+) -> None:
+    # 改写节点流并原子写出；observe 可包装输出行迭代器（handover-pipeline 用于分阶段计时）
+    incremental_run: IncrementalNormalizer | None = None
+    if incremental:
+        if manifest_path is None:
+            manifest_path = out_path.with_name(out_path.name + ".normalize-manifest.json")
+        engine = engine_version()
+        manifest = load_manifest(manifest_path, engine)
+        previous: dict[str, list[str]] = {}
+        if out_path.resolve() != in_path.resolve():
+            previous = load_previous_blocks(out_path, set(manifest.values()))
+        incremental_run = IncrementalNormalizer(manifest, previous)
+        # 按块切分时以行为单位：块内再由 normalize_block 解析为节点
+        lines = incremental_run.iter_lines(iter_blocks(iter_lines(nodes)), jobs, cache_path)
+    elif jobs > 1:
+        lines = _iter_parallel_lines(iter_lines(nodes), jobs, cache_path)
+    else:
+        lines = iter_lines(normalize_nodes(nodes))
+    if observe is not None:
+        lines = observe(lines)
+    write_lines(lines, out_path)
+    if incremental_run is not None:
+        save_manifest(manifest_path, engine, incremental_run.blocks)
+        print(f"incremental: {incremental_run.stats()}")
 
 
 def main() -> None:
@@ -1178,14 +837,50 @@ def main() -> None:
         default="docs/architecture/client-handover-mini-program-admin.md",
         help="输出 Markdown 文件",
     )
+    parser.add_argument(
+        "--translation-cache",
+        default="",
+        help="译文缓存文件（可选，跨次运行复用字段译文）",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="增量模式：按章节/小节标题切块哈希，未变化的块直接复用上次输出",
+    )
+    parser.add_argument(
+        "--manifest",
+        default="",
+        help="增量清单文件（默认：<输出文件>.normalize-manifest.json）",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="并行进程数：按章节/小节块拆分后并行改写，输出与串行一致（0 表示使用全部 CPU）",
+    )
     args = parser.parse_args()
 
     in_path = Path(args.input)
     out_path = Path(args.output)
-
-    text = in_path.read_text(encoding="utf-8-sig")
-    enhanced = enhance_markdown(text)
-    out_path.write_text(enhanced, encoding="utf-8-sig", newline="\n")
+    cache_path = Path(args.translation_cache) if args.translation_cache else None
+    if cache_path is not None:
+        TRANSLATION_CACHE.load(cache_path)
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+
+    manifest_path = Path(args.manifest) if args.manifest else None
+    nodes = iter_with_toc(iter_nodes(iter_source_lines(in_path)))
+    write_normalized(
+        nodes,
+        in_path,
+        out_path,
+        incremental=args.incremental,
+        manifest_path=manifest_path,
+        jobs=jobs,
+        cache_path=cache_path,
+    )
+    if cache_path is not None:
+        TRANSLATION_CACHE.save(cache_path)
+        print(f"translation cache: {TRANSLATION_CACHE.stats()}")
     print(str(out_path))
 
 
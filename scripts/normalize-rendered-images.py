@@ -1,15 +1,37 @@
 from __future__ import annotations
 
 import argparse
-from collections import Counter
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Callable, Iterable, Iterator
 
 from PIL import Image, ImageChops, ImageColor
 
+from png_encoder import DEFAULT_PROFILE, PROFILES, EncodeStats, save_png
+
+try:
+    import numpy as np
+except ImportError:  # optional: fall back to the PIL bbox path
+    np = None
+
 # Allow very large rendered diagrams to be normalized without PIL bomb warnings.
 Image.MAX_IMAGE_PIXELS = None
 
+BBOX_BACKENDS = ("auto", "numpy", "pil")
+# Rows per band for bbox scanning and re-padding: a few MB per band on 8k-wide diagrams.
+BAND_ROWS = 256
+
+MANIFEST_FORMAT = 1
+DEFAULT_MANIFEST = ".cache/normalize-rendered-images.json"
+
 
 def _iter_images(paths: Iterable[Path]) -> list[Path]:
     out: list[Path] = []
@@ -31,7 +53,7 @@ def _iter_images(paths: Iterable[Path]) -> list[Path]:
 
 
 def _sample_background_rgb(img: Image.Image) -> tuple[int, int, int]:
-    rgb = img.convert("RGB")
+    rgb = img if img.mode == "RGB" else img.convert("RGB")
     w, h = rgb.size
     samples = [
         rgb.getpixel((0, 0)),
@@ -53,6 +75,154 @@ def _diff_mask_max_channel(rgb: Image.Image, bg_rgb: tuple[int, int, int]) -> Im
     return ImageChops.lighter(ImageChops.lighter(r, g), b)
 
 
+Box = tuple[int, int, int, int]
+BandFlags = Callable[[Box], tuple[Any, Any]]
+
+
+def _content_bbox_pil(img: Image.Image, bg_rgb: tuple[int, ...], tolerance: int) -> Box | None:
+    rgb = img if img.mode == "RGB" else img.convert("RGB")
+    mask = _diff_mask_max_channel(rgb, bg_rgb)
+    mask = mask.point(lambda p: 255 if p > tolerance else 0)
+    return mask.getbbox()
+
+
+def _alpha_bbox_pil(img: Image.Image, tolerance: int) -> Box | None:
+    rgba = img if img.mode == "RGBA" else img.convert("RGBA")
+    alpha_mask = rgba.getchannel("A").point(lambda p: 255 if p > tolerance else 0)
+    return alpha_mask.getbbox()
+
+
+def _scan_bands(size: tuple[int, int], band_flags: BandFlags) -> Box | None:
+    """Find the content bbox from per-band (row_hits, col_hits) flags.
+
+    Bands are scanned from the top edge down and from the bottom edge up until content is hit;
+    the rows in between can no longer move the vertical bounds, so only the column margins that
+    are still empty get scanned there, and scanning stops once content reaches both sides.
+    """
+    w, h = size
+    top = -1
+    scanned_top = 0
+    for y0 in range(0, h, BAND_ROWS):
+        scanned_top = min(h, y0 + BAND_ROWS)
+        rows, cols = band_flags((0, y0, w, scanned_top))
+        ys = np.flatnonzero(rows)
+        if ys.size:
+            xs = np.flatnonzero(cols)
+            top, bottom = y0 + int(ys[0]), y0 + int(ys[-1]) + 1
+            left, right = int(xs[0]), int(xs[-1]) + 1
+            break
+    if top < 0:
+        return None
+
+    scanned_bottom = h
+    while scanned_bottom > scanned_top:
+        y0 = max(scanned_top, scanned_bottom - BAND_ROWS)
+        rows, cols = band_flags((0, y0, w, scanned_bottom))
+        scanned_bottom = y0
+        ys = np.flatnonzero(rows)
+        if ys.size:
+            xs = np.flatnonzero(cols)
+            bottom = y0 + int(ys[-1]) + 1
+            left, right = min(left, int(xs[0])), max(right, int(xs[-1]) + 1)
+            break
+
+    for y0 in range(scanned_top, scanned_bottom, BAND_ROWS):
+        if left == 0 and right == w:
+            break
+        y1 = min(scanned_bottom, y0 + BAND_ROWS)
+        if left > 0:
+            xs = np.flatnonzero(band_flags((0, y0, left, y1))[1])
+            if xs.size:
+                left = int(xs[0])
+        if right < w:
+            xs = np.flatnonzero(band_flags((right, y0, w, y1))[1])
+            if xs.size:
+                right += int(xs[-1]) + 1
+    return (left, top, right, bottom)
+
+
+def _content_bbox_numpy(img: Image.Image, bg_rgb: tuple[int, ...], tolerance: int) -> Box | None:
+    """Same result as the PIL path: bbox of pixels whose max channel difference exceeds tolerance.
+
+    max(|c - bg_c|) > tolerance  <=>  some channel lies outside [lo_c, hi_c] (bg_c -/+ tolerance,
+    clamped), and with uint8 wrap-around that is (c - lo_c) > (hi_c - lo_c). Each band is shifted
+    once and reduced with a row max and a column max; no difference image is built. Bands rather
+    than one full-frame array: a 77 MPix tobytes() copy alone costs more than the whole PIL path.
+    """
+    w, h = img.size
+    if tolerance < 0:
+        return (0, 0, w, h)
+    bg = np.array(bg_rgb[:3], dtype=np.int16)
+    lo = np.clip(bg - tolerance, 0, 255).astype(np.uint8)
+    span = np.clip(bg + tolerance, 0, 255).astype(np.uint8) - lo
+    lo_row = np.tile(lo, w)
+    span_row = np.tile(span, w)
+    uniform = bool((span == span[0]).all())
+
+    def band_flags(box: Box) -> tuple[Any, Any]:
+        band = img.crop(box)
+        if band.mode != "RGB":
+            band = band.convert("RGB")
+        n = band.width * 3
+        shifted = np.subtract(np.frombuffer(band.tobytes(), dtype=np.uint8).reshape(band.height, n), lo_row[:n])
+        if uniform:
+            rows = shifted.max(axis=1) > span[0]
+        else:
+            rows = (shifted > span_row[:n]).any(axis=1)
+        cols = (shifted.max(axis=0) > span_row[:n]).reshape(band.width, 3).any(axis=1)
+        return rows, cols
+
+    return _scan_bands((w, h), band_flags)
+
+
+def _alpha_bbox_numpy(img: Image.Image, tolerance: int) -> Box | None:
+    w, h = img.size
+    if tolerance < 0:
+        return (0, 0, w, h)
+    if tolerance >= 255:
+        return None
+
+    def band_flags(box: Box) -> tuple[Any, Any]:
+        band = img.crop(box)
+        if "A" not in band.getbands():
+            band = band.convert("RGBA")
+        alpha = band.getchannel("A")
+        a = np.frombuffer(alpha.tobytes(), dtype=np.uint8).reshape(alpha.height, alpha.width)
+        return a.max(axis=1) > tolerance, a.max(axis=0) > tolerance
+
+    return _scan_bands((w, h), band_flags)
+
+
+def _use_numpy(backend: str) -> bool:
+    if backend == "numpy" and np is None:
+        raise RuntimeError("bbox backend 'numpy' requested but numpy is not installed")
+    return backend != "pil" and np is not None
+
+
+def content_bbox(img: Image.Image, bg_rgb: tuple[int, ...], tolerance: int, backend: str = "auto") -> Box | None:
+    if _use_numpy(backend):
+        return _content_bbox_numpy(img, bg_rgb, tolerance)
+    return _content_bbox_pil(img, bg_rgb, tolerance)
+
+
+def alpha_bbox(img: Image.Image, tolerance: int, backend: str = "auto") -> Box | None:
+    if _use_numpy(backend):
+        return _alpha_bbox_numpy(img, tolerance)
+    return _alpha_bbox_pil(img, tolerance)
+
+
+def _repad(img: Image.Image, box: Box, mode: str, fill: tuple[int, ...], outer_margin: int) -> Image.Image:
+    # Copy the crop band by band so only one band is converted/held besides the source and output.
+    left, top, right, bottom = box
+    out = Image.new(mode, (right - left + outer_margin * 2, bottom - top + outer_margin * 2), color=fill)
+    for y0 in range(top, bottom, BAND_ROWS):
+        piece = img.crop((left, y0, right, min(bottom, y0 + BAND_ROWS)))
+        if piece.mode != mode:
+            piece = piece.convert(mode)
+        out.paste(piece, (outer_margin, outer_margin + y0 - top), piece if mode == "RGBA" else None)
+    return out
+
+
 def normalize_png(
     input_path: Path,
     output_path: Path,
@@ -61,64 +231,185 @@ def normalize_png(
     tolerance: int,
     crop_padding: int,
     outer_margin: int,
-) -> bool:
+    bbox_backend: str = "auto",
+    png_profile: str = DEFAULT_PROFILE,
+    png_colors: int = 0,
+) -> EncodeStats | None:
+    """Trim and re-pad one PNG; returns the encode stats, or None when the image has no content."""
     img = Image.open(input_path)
     try:
         force_transparent = background is not None and background.lower() == "transparent"
         if force_transparent or img.mode in ("RGBA", "LA"):
-            rgba = img.convert("RGBA")
-            alpha = rgba.split()[-1]
-            alpha_mask = alpha.point(lambda p: 255 if p > tolerance else 0)
-            bbox = alpha_mask.getbbox()
-            if bbox is None:
-                return False
-
-            left, top, right, bottom = bbox
-            left = max(0, left - crop_padding)
-            top = max(0, top - crop_padding)
-            right = min(rgba.width, right + crop_padding)
-            bottom = min(rgba.height, bottom + crop_padding)
-
-            cropped = rgba.crop((left, top, right, bottom))
-            out_w = cropped.width + outer_margin * 2
-            out_h = cropped.height + outer_margin * 2
-            out = Image.new("RGBA", (out_w, out_h), color=(0, 0, 0, 0))
-            out.paste(cropped, (outer_margin, outer_margin), cropped)
-
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            out.save(output_path, format="PNG", optimize=True)
-            return True
-
-        rgb = img.convert("RGB")
-        bg_rgb = _sample_background_rgb(rgb)
-        if background is not None:
-            bg_rgb = ImageColor.getrgb(background)
-
-        mask = _diff_mask_max_channel(rgb, bg_rgb)
-        mask = mask.point(lambda p: 255 if p > tolerance else 0)
-        bbox = mask.getbbox()
+            mode = "RGBA"
+            fill: tuple[int, ...] = (0, 0, 0, 0)
+            bbox = alpha_bbox(img, tolerance, bbox_backend)
+        else:
+            mode = "RGB"
+            fill = _sample_background_rgb(img)
+            if background is not None:
+                fill = ImageColor.getrgb(background)
+            bbox = content_bbox(img, fill, tolerance, bbox_backend)
         if bbox is None:
-            return False
+            return None
 
         left, top, right, bottom = bbox
         left = max(0, left - crop_padding)
         top = max(0, top - crop_padding)
-        right = min(rgb.width, right + crop_padding)
-        bottom = min(rgb.height, bottom + crop_padding)
-
-        cropped = rgb.crop((left, top, right, bottom))
-        out_w = cropped.width + outer_margin * 2
-        out_h = cropped.height + outer_margin * 2
-        out = Image.new("RGB", (out_w, out_h), color=bg_rgb)
-        out.paste(cropped, (outer_margin, outer_margin))
+        right = min(img.width, right + crop_padding)
+        bottom = min(img.height, bottom + crop_padding)
 
+        out = _repad(img, (left, top, right, bottom), mode, fill, outer_margin)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        out.save(output_path, format="PNG", optimize=True)
-        return True
+        return save_png(out, output_path, png_profile, colors=png_colors)
     finally:
         img.close()
 
 
+# Manifest fingerprint: [size, mtime_ns, blake2b]. Size + mtime is the constant-time check;
+# the hash is only read when the stat differs (e.g. after a git checkout touched the file).
+Fingerprint = list[Any]
+
+
+def _file_hash(path: Path) -> str:
+    # Chunked read instead of hashlib.file_digest, which needs Python 3.11.
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _fingerprint(path: Path) -> Fingerprint:
+    st = path.stat()
+    return [st.st_size, st.st_mtime_ns, _file_hash(path)]
+
+
+def _matches(path: Path, fp: Fingerprint | None) -> bool:
+    if fp is None:
+        return False
+    try:
+        st = path.stat()
+    except OSError:
+        return False
+    if st.st_size != fp[0]:
+        return False
+    if st.st_mtime_ns == fp[1]:
+        return True
+    current = _fingerprint(path)
+    if current[2] != fp[2]:
+        return False
+    fp[1] = current[1]  # same bytes, new mtime: refresh so the next run takes the stat path
+    return True
+
+
+def _engine_version() -> str:
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(Path(__file__).read_bytes())
+    digest.update(Path(__file__).with_name("png_encoder.py").read_bytes())
+    return digest.hexdigest()
+
+
+def _load_manifest(path: Path) -> dict[str, dict[str, Any]]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("format") != MANIFEST_FORMAT:
+        return {}
+    files = payload.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _save_manifest(path: Path, files: dict[str, dict[str, Any]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps({"format": MANIFEST_FORMAT, "files": files}, indent=1, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _is_unchanged(entry: dict[str, Any] | None, input_path: Path, output_path: Path, params: dict[str, Any]) -> bool:
+    """True when the last run used the same parameters and neither file changed since.
+
+    The input may match either the recorded source or the recorded output: with --in-place the
+    file on disk is the already-normalized output.
+    """
+    if not entry or entry.get("params") != params or entry.get("input") != input_path.resolve().as_posix():
+        return False
+    target = entry.get("target")
+    if not (_matches(input_path, entry.get("source")) or _matches(input_path, target)):
+        return False
+    return target is None or _matches(output_path, target)
+
+
+@dataclass(frozen=True)
+class FileResult:
+    path: Path
+    status: str  # "processed" | "unchanged" | "skipped" | "failed"
+    seconds: float
+    error: str = ""
+    source: Fingerprint | None = None
+    target: Fingerprint | None = None
+    encode: EncodeStats | None = None
+
+
+def _normalize_task(task: tuple[Path, Path, dict[str, Any]]) -> FileResult:
+    input_path, output_path, options = task
+    started = time.perf_counter()
+    try:
+        source = _fingerprint(input_path)
+        encode = normalize_png(input_path, output_path, **options)
+        target = _fingerprint(output_path) if encode else None
+    except Exception as exc:  # a corrupt or unreadable PNG must not abort the batch
+        return FileResult(input_path, "failed", time.perf_counter() - started, f"{type(exc).__name__}: {exc}")
+    status = "processed" if encode else "skipped"
+    return FileResult(input_path, status, time.perf_counter() - started, source=source, target=target, encode=encode)
+
+
+def _iter_results(tasks: list[tuple[Path, Path, dict[str, Any]]], jobs: int) -> Iterator[FileResult]:
+    """Yield one result per task, always in input order.
+
+    With jobs > 1 at most ``2 * jobs`` tasks are submitted at a time, so a long
+    list of large diagrams never piles up pending work or finished results.
+
+    If a worker dies (e.g. killed for memory) the pool is broken: every task still
+    in flight on it is reported as failed, and the remaining tasks continue on a
+    fresh pool (or serially, if a fresh pool cannot take work either).
+    """
+    if jobs <= 1 or len(tasks) < 2:
+        for task in tasks:
+            yield _normalize_task(task)
+        return
+
+    window = jobs * 2
+    queue = deque(tasks)
+    while queue:
+        submitted = 0
+        broken = False
+        pending: deque[tuple[Path, Future[FileResult]]] = deque()
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            while True:
+                while queue and not broken and len(pending) < window:
+                    try:
+                        future = pool.submit(_normalize_task, queue[0])
+                    except BrokenProcessPool:
+                        broken = True
+                        break
+                    pending.append((queue.popleft()[0], future))
+                    submitted += 1
+                if not pending:
+                    break
+                path, future = pending.popleft()
+                try:
+                    yield future.result()
+                except Exception as exc:
+                    broken = broken or isinstance(exc, BrokenProcessPool)
+                    yield FileResult(path, "failed", 0.0, f"{type(exc).__name__}: {exc}")
+        if queue and not submitted:
+            for task in queue:
+                yield _normalize_task(task)
+            return
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Normalize rendered Mermaid PNGs: trim empty margins and add symmetric padding to center the chart.",
@@ -162,6 +453,41 @@ def main() -> None:
         default=48,
         help="Symmetric padding (px) around the cropped content in the output image.",
     )
+    parser.add_argument(
+        "--bbox-backend",
+        choices=BBOX_BACKENDS,
+        default="auto",
+        help="Content bbox detection for opaque PNGs: numpy (vectorized), pil, or auto (numpy when installed).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes (0 = all CPUs). Output files and report order match a serial run.",
+    )
+    parser.add_argument(
+        "--png-profile",
+        choices=sorted(PROFILES),
+        default=DEFAULT_PROFILE,
+        help=(
+            "PNG encode profile: fast (dev previews), balanced, smallest (handover builds), "
+            f"smallest-palette (smallest plus a lossless palette for <= 256-color images). Default: {DEFAULT_PROFILE}."
+        ),
+    )
+    parser.add_argument(
+        "--png-colors",
+        type=int,
+        default=0,
+        help="Quantize output to a palette of N colors (lossy, max 256). Default 0 keeps exact pixels.",
+    )
+    parser.add_argument(
+        "--manifest",
+        default=DEFAULT_MANIFEST,
+        help=(
+            "JSON manifest of input/output hashes and parameters; files unchanged since the last run are "
+            f"skipped ('none' to always reprocess; default: {DEFAULT_MANIFEST})."
+        ),
+    )
     args = parser.parse_args()
 
     paths = _iter_images([Path(p) for p in args.paths])
@@ -171,8 +497,23 @@ def main() -> None:
     out_dir = Path(args.out_dir) if args.out_dir else None
     background = args.background or None
 
-    processed = 0
-    skipped = 0
+    options = {
+        "background": background,
+        "tolerance": args.tolerance,
+        "crop_padding": args.crop_padding,
+        "outer_margin": args.outer_margin,
+        "bbox_backend": args.bbox_backend,
+        "png_profile": args.png_profile,
+        "png_colors": args.png_colors,
+    }
+    # The bbox backend does not change output, so it is not part of the manifest parameters.
+    params = {key: value for key, value in options.items() if key != "bbox_backend"}
+    params["engine"] = _engine_version()
+    manifest_path = None if args.manifest.lower() == "none" else Path(args.manifest)
+    entries = _load_manifest(manifest_path) if manifest_path else {}
+
+    tasks: list[tuple[Path, Path, dict[str, Any]]] = []
+    slots: list[tuple[str, FileResult | None]] = []
     for p in paths:
         if args.in_place:
             out_path = p
@@ -180,21 +521,68 @@ def main() -> None:
             if out_dir is None:
                 out_dir = p.parent / "normalized"
             out_path = out_dir / p.name
-
-        ok = normalize_png(
-            p,
-            out_path,
-            background=background,
-            tolerance=args.tolerance,
-            crop_padding=args.crop_padding,
-            outer_margin=args.outer_margin,
-        )
-        if ok:
-            processed += 1
+        # Keyed by output: one input may be normalized into several --out-dir targets.
+        key = out_path.resolve().as_posix()
+        if manifest_path and _is_unchanged(entries.get(key), p, out_path, params):
+            slots.append((key, FileResult(p, "unchanged", 0.0)))
         else:
-            skipped += 1
+            slots.append((key, None))
+            tasks.append((p, out_path, options))
+
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+    counts = Counter({"processed": 0, "unchanged": 0, "skipped": 0, "failed": 0})
+    busy = 0.0
+    encode_seconds = 0.0
+    encode_bytes = 0
+    slowest: FileResult | None = None
+    started = time.perf_counter()
+    fresh = _iter_results(tasks, jobs)
+    try:
+        for key, known in slots:
+            result = known or next(fresh)
+            if result.status == "failed":
+                entries.pop(key, None)
+            elif result.status != "unchanged":
+                entries[key] = {
+                    "input": result.path.resolve().as_posix(),
+                    "params": params,
+                    "source": result.source,
+                    "target": result.target,
+                }
+            counts[result.status] += 1
+            busy += result.seconds
+            if slowest is None or result.seconds > slowest.seconds:
+                slowest = result
+            line = f"  {result.status:<9}{result.seconds:>8.2f}s  {result.path}"
+            if result.encode:
+                encode_seconds += result.encode.seconds
+                encode_bytes += result.encode.size
+                line += f"  ({result.encode.describe()})"
+            if result.error:
+                line += f"  ({result.error})"
+            print(line)
+    finally:
+        # Keep what finished even if the run is interrupted, so the next run skips it.
+        if manifest_path:
+            _save_manifest(manifest_path, entries)
+    wall = time.perf_counter() - started
 
-    print(f"Processed: {processed}, skipped: {skipped}")
+    print(
+        f"Processed: {counts['processed']}, unchanged: {counts['unchanged']}, "
+        f"skipped: {counts['skipped']}, failed: {counts['failed']}"
+    )
+    if slowest is not None:
+        print(
+            f"Timing: wall {wall:.2f}s, per-file total {busy:.2f}s, mean {busy / len(slots):.2f}s, "
+            f"slowest {slowest.seconds:.2f}s ({slowest.path.name}), jobs {jobs}"
+        )
+    if counts["processed"]:
+        print(
+            f"Encode: {args.png_profile}, {encode_seconds:.2f}s for {counts['processed']} file(s), "
+            f"{encode_bytes / 1e6:.2f} MB written"
+        )
+    if counts["failed"]:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
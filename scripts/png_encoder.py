@@ -0,0 +1,85 @@
+"""
+PNG encode profiles shared by the documentation image scripts.
+
+- fast: zlib level 1 with the run-length strategy; dev previews (several times faster than smallest)
+- balanced: zlib level 6 with the default strategy
+- smallest: PIL's optimize=True; byte-identical to the previous output
+- smallest-palette: smallest plus a lossless palette when an RGB image has at most 256 colors
+  (opt-in: costs a color-count pass and changes the PNG mode)
+
+colors > 0 additionally quantizes to a palette of that many colors (lossy) before encoding.
+"""
+
+from __future__ import annotations
+
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+from PIL import Image, ImageChops
+
+
+@dataclass(frozen=True)
+class PngProfile:
+    name: str
+    compress_level: int
+    compress_type: int  # zlib strategy
+    optimize: bool
+    lossless_palette: bool
+
+
+PROFILES = {
+    "fast": PngProfile("fast", compress_level=1, compress_type=zlib.Z_RLE, optimize=False, lossless_palette=False),
+    "balanced": PngProfile(
+        "balanced", compress_level=6, compress_type=zlib.Z_DEFAULT_STRATEGY, optimize=False, lossless_palette=False
+    ),
+    "smallest": PngProfile(
+        "smallest", compress_level=9, compress_type=zlib.Z_DEFAULT_STRATEGY, optimize=True, lossless_palette=False
+    ),
+    "smallest-palette": PngProfile(
+        "smallest-palette",
+        compress_level=9,
+        compress_type=zlib.Z_DEFAULT_STRATEGY,
+        optimize=True,
+        lossless_palette=True,
+    ),
+}
+DEFAULT_PROFILE = "smallest"
+
+
+@dataclass(frozen=True)
+class EncodeStats:
+    profile: str
+    mode: str
+    seconds: float
+    size: int
+
+    def describe(self) -> str:
+        return f"{self.profile} {self.mode}, encode {self.seconds:.2f}s, {self.size / 1e6:.2f} MB"
+
+
+def _to_palette(img: Image.Image, colors: int, lossless: bool) -> Image.Image:
+    if img.mode not in ("RGB", "RGBA"):
+        return img
+    if colors > 0:
+        method = Image.Quantize.FASTOCTREE if img.mode == "RGBA" else Image.Quantize.MEDIANCUT
+        return img.quantize(min(colors, 256), method=method, dither=Image.Dither.NONE)
+    if not lossless or img.mode != "RGB" or img.getcolors(256) is None:
+        return img
+    # <= 256 distinct colors: median cut ends with one box per color; keep it only if it round-trips
+    paletted = img.quantize(256, method=Image.Quantize.MEDIANCUT, dither=Image.Dither.NONE)
+    if ImageChops.difference(paletted.convert("RGB"), img).getbbox() is not None:
+        return img
+    return paletted
+
+
+def save_png(img: Image.Image, path: Path, profile: str = DEFAULT_PROFILE, *, colors: int = 0) -> EncodeStats:
+    spec = PROFILES[profile]
+    started = time.perf_counter()
+    out = _to_palette(img, colors, spec.lossless_palette)
+    if spec.optimize:
+        out.save(path, format="PNG", optimize=True)
+    else:
+        out.save(path, format="PNG", compress_level=spec.compress_level, compress_type=spec.compress_type)
+    return EncodeStats(profile, out.mode, time.perf_counter() - started, path.stat().st_size)
@@ -9,9 +9,15 @@
   [int]$NormalizeTolerance = 4,
   [int]$NormalizeCropPadding = 6,
   [int]$NormalizeOuterMargin = 48,
+  [int]$NormalizeJobs = 0,
+  [ValidateSet("fast","balanced","smallest","smallest-palette")][string]$PngProfile = "smallest",
   [switch]$NoNormalizePng,
   [switch]$NoPdfFit,
-  [switch]$NoSvg
+  [switch]$NoSvg,
+  [switch]$SplitErByDomain,
+  [string]$ErDomainsDir = "docs/architecture/er-domains",
+  [string]$RenderCacheDir = ".cache/diagram-render",
+  [switch]$NoRenderCache
 )
 
 $ErrorActionPreference = "Stop"
@@ -19,6 +25,13 @@ $ErrorActionPreference = "Stop"
 $NormalizePng = -not $NoNormalizePng
 $PdfFit = -not $NoPdfFit
 $Svg = -not $NoSvg
+$UseRenderCache = -not $NoRenderCache
+
+# Bump when the cache entry layout or the key recipe changes.
+$RenderCacheFormat = 1
+$script:CacheHits = 0
+$script:CacheMisses = 0
+$pendingCacheEntries = New-Object System.Collections.Generic.List[object]
 
 function ResolveExistingDiagrams([string[]]$paths, [string]$label) {
   $existing = @()
@@ -32,6 +45,86 @@ function ResolveExistingDiagrams([string[]]$paths, [string]$label) {
   return $existing
 }
 
+function GetStringSha256([string]$text) {
+  $sha = [System.Security.Cryptography.SHA256]::Create()
+  try {
+    $bytes = [System.Text.Encoding]::UTF8.GetBytes($text)
+    return ([System.BitConverter]::ToString($sha.ComputeHash($bytes)) -replace "-", "").ToLowerInvariant()
+  } finally {
+    $sha.Dispose()
+  }
+}
+
+function GetRenderOptionsKey() {
+  # Everything that changes the bytes of a rendered/normalized output belongs in the key.
+  $normalizeScriptHash = ""
+  if ($NormalizePng -and (Test-Path "scripts/normalize-rendered-images.py")) {
+    $normalizeScriptHash = (Get-FileHash -Algorithm SHA256 -LiteralPath "scripts/normalize-rendered-images.py").Hash
+    if (Test-Path "scripts/png_encoder.py") {
+      $normalizeScriptHash += (Get-FileHash -Algorithm SHA256 -LiteralPath "scripts/png_encoder.py").Hash
+    }
+  }
+  return @(
+    "format=$RenderCacheFormat",
+    "background=$PngBackground",
+    "width=$PngWidth",
+    "height=$PngHeight",
+    "scale=$PngScale",
+    "pdfFit=$PdfFit",
+    "svg=$Svg",
+    "normalize=$NormalizePng",
+    "tolerance=$NormalizeTolerance",
+    "cropPadding=$NormalizeCropPadding",
+    "outerMargin=$NormalizeOuterMargin",
+    "pngProfile=$PngProfile",
+    "normalizeScript=$normalizeScriptHash"
+  ) -join "`n"
+}
+
+function GetDiagramCacheKey([string]$diagramPath, [string]$optionsKey) {
+  $initLine = Get-Content -LiteralPath $diagramPath -Encoding UTF8 |
+    Where-Object { $_ -match '^\s*%%\{init:' } |
+    Select-Object -First 1
+  $sourceHash = (Get-FileHash -Algorithm SHA256 -LiteralPath $diagramPath).Hash
+  return GetStringSha256 "$optionsKey`ninit=$initLine`nsource=$sourceHash"
+}
+
+function GetOutputExtensions() {
+  $extensions = @("png", "pdf")
+  if ($Svg) {
+    $extensions += "svg"
+  }
+  return $extensions
+}
+
+function RestoreFromCache([string]$key, [string]$outDir, [string]$baseName) {
+  $entryDir = Join-Path $RenderCacheDir $key
+  # The marker is written last, so interrupted stores are treated as misses.
+  if (-not (Test-Path (Join-Path $entryDir "complete"))) {
+    return $false
+  }
+  $extensions = GetOutputExtensions
+  foreach ($ext in $extensions) {
+    if (-not (Test-Path (Join-Path $entryDir "diagram.$ext"))) {
+      return $false
+    }
+  }
+  foreach ($ext in $extensions) {
+    Copy-Item -LiteralPath (Join-Path $entryDir "diagram.$ext") -Destination (Join-Path $outDir "$baseName.$ext") -Force
+  }
+  return $true
+}
+
+function StoreInCache($entry) {
+  $entryDir = Join-Path $RenderCacheDir $entry.Key
+  New-Item -ItemType Directory -Force $entryDir | Out-Null
+  $extensions = GetOutputExtensions
+  foreach ($ext in $extensions) {
+    Copy-Item -LiteralPath (Join-Path $entry.OutDir "$($entry.BaseName).$ext") -Destination (Join-Path $entryDir "diagram.$ext") -Force
+  }
+  Set-Content -LiteralPath (Join-Path $entryDir "complete") -Value $entry.Key -Encoding ascii
+}
+
 function RenderDiagram([string]$diagramPath, [string]$outDir, [string]$outputBaseName = "") {
   $baseName = if ([string]::IsNullOrWhiteSpace($outputBaseName)) {
     [IO.Path]::GetFileNameWithoutExtension($diagramPath)
@@ -84,8 +177,40 @@ function RenderDiagram([string]$diagramPath, [string]$outDir, [string]$outputBas
   }
 }
 
+function RenderDiagramCached([string]$diagramPath, [string]$outDir, [string]$outputBaseName, [string]$optionsKey) {
+  $baseName = if ([string]::IsNullOrWhiteSpace($outputBaseName)) {
+    [IO.Path]::GetFileNameWithoutExtension($diagramPath)
+  } else {
+    $outputBaseName
+  }
+  if (-not $UseRenderCache) {
+    RenderDiagram $diagramPath $outDir $baseName
+    return
+  }
+
+  $key = GetDiagramCacheKey $diagramPath $optionsKey
+  if (RestoreFromCache $key $outDir $baseName) {
+    $script:CacheHits++
+    Write-Host "Cache hit: $diagramPath -> $baseName"
+    return
+  }
+
+  $script:CacheMisses++
+  RenderDiagram $diagramPath $outDir $baseName
+  # Stored after normalization so cached PNGs are already trimmed.
+  $pendingCacheEntries.Add([PSCustomObject]@{
+    Key = $key
+    OutDir = $outDir
+    BaseName = $baseName
+  })
+}
+
 function NormalizePngDir([string]$outDir) {
-  if (-not $NormalizePng) {
+  NormalizePngPaths @($outDir) "Normalize PNGs in: $outDir"
+}
+
+function NormalizePngPaths([string[]]$paths, [string]$message) {
+  if (-not $NormalizePng -or $paths.Count -eq 0) {
     return
   }
 
@@ -94,18 +219,24 @@ function NormalizePngDir([string]$outDir) {
     return
   }
 
-  Write-Host "Normalize PNGs in: $outDir"
+  Write-Host $message
 
   $argsList = @(
     "scripts/normalize-rendered-images.py",
-    "--in-place",
-    $outDir,
+    "--in-place"
+  )
+  $argsList += $paths
+  $argsList += @(
     "--tolerance",
     $NormalizeTolerance,
     "--crop-padding",
     $NormalizeCropPadding,
     "--outer-margin",
-    $NormalizeOuterMargin
+    $NormalizeOuterMargin,
+    "--jobs",
+    $NormalizeJobs,
+    "--png-profile",
+    $PngProfile
   )
 
   if ($PngBackground) {
@@ -114,7 +245,7 @@ function NormalizePngDir([string]$outDir) {
 
   python @argsList
   if ($LASTEXITCODE -ne 0) {
-    throw "normalize-rendered-images.py failed for: $outDir"
+    throw "normalize-rendered-images.py failed for: $($paths -join ', ')"
   }
 }
 
@@ -126,7 +257,7 @@ if ($hasErCn) {
   $architectureFiles = $architectureFiles | Where-Object { $_.Name -ine "er-diagram.mmd" }
 }
 
-$architectureDiagrams = $architectureFiles |
+$architectureDiagrams = @($architectureFiles |
   Sort-Object Name |
   ForEach-Object {
     $outputBaseName = if ($_.Name -ieq "er-diagram-cn.mmd") { "er-diagram" } else { $_.BaseName }
@@ -134,7 +265,25 @@ $architectureDiagrams = $architectureFiles |
       InputPath = $_.FullName
       OutputBaseName = $outputBaseName
     }
+  })
+
+if ($SplitErByDomain) {
+  # Render one sub-diagram per business domain plus a domain overview instead of the monolithic ER diagram.
+  Write-Host "Split ER diagram by domain: $ErDomainsDir"
+  python scripts/generate-er-diagrams.py --only cn-mmd --domains-dir $ErDomainsDir
+  if ($LASTEXITCODE -ne 0) {
+    throw "generate-er-diagrams.py failed (domain split)"
   }
+  $architectureDiagrams = @($architectureDiagrams | Where-Object { $_.OutputBaseName -ne "er-diagram" })
+  $architectureDiagrams += @(Get-ChildItem -Path $ErDomainsDir -Filter "*.mmd" -File |
+    Sort-Object Name |
+    ForEach-Object {
+      [PSCustomObject]@{
+        InputPath = $_.FullName
+        OutputBaseName = "er-diagram-$($_.BaseName)"
+      }
+    })
+}
 
 if (-not $architectureDiagrams -or $architectureDiagrams.Count -eq 0) {
   throw "No architecture diagrams found under docs/architecture"
@@ -168,24 +317,44 @@ if ($IncludeDemo) {
   $demoInputs = ResolveExistingDiagrams -paths $demoCandidates -label "demo"
 }
 
+$renderOptionsKey = ""
+if ($UseRenderCache) {
+  New-Item -ItemType Directory -Force $RenderCacheDir | Out-Null
+  $renderOptionsKey = GetRenderOptionsKey
+}
+
 foreach ($diagram in $architectureDiagrams) {
-  RenderDiagram $diagram.InputPath $ArchitectureOutDir $diagram.OutputBaseName
+  RenderDiagramCached $diagram.InputPath $ArchitectureOutDir $diagram.OutputBaseName $renderOptionsKey
 }
 
 if ($demoInputs.Count -gt 0) {
   foreach ($diagramPath in $demoInputs) {
-    RenderDiagram $diagramPath $DemoOutDir
+    RenderDiagramCached $diagramPath $DemoOutDir "" $renderOptionsKey
   }
 }
 
-NormalizePngDir $ArchitectureOutDir
-if ($demoInputs.Count -gt 0) {
-  NormalizePngDir $DemoOutDir
+if ($UseRenderCache) {
+  # Only freshly rendered PNGs need trimming; cache hits were stored normalized.
+  $freshPngs = @($pendingCacheEntries | ForEach-Object { Join-Path $_.OutDir "$($_.BaseName).png" })
+  NormalizePngPaths $freshPngs "Normalize freshly rendered PNGs: $($freshPngs.Count)"
+  foreach ($entry in $pendingCacheEntries) {
+    StoreInCache $entry
+  }
+} else {
+  NormalizePngDir $ArchitectureOutDir
+  if ($demoInputs.Count -gt 0) {
+    NormalizePngDir $DemoOutDir
+  }
 }
 
 Write-Host "Done."
 Write-Host "Architecture diagrams rendered: $($architectureDiagrams.Count)"
 Write-Host "Architecture outputs:          $ArchitectureOutDir"
+if ($UseRenderCache) {
+  $lookups = $script:CacheHits + $script:CacheMisses
+  $hitRate = if ($lookups -gt 0) { [math]::Round($script:CacheHits * 100.0 / $lookups, 1) } else { 0 }
+  Write-Host "Render cache:                   hits=$($script:CacheHits) misses=$($script:CacheMisses) hit_rate=$hitRate% ($RenderCacheDir)"
+}
 if ($demoInputs.Count -gt 0) {
   Write-Host "Demo diagrams rendered:         $($demoInputs.Count)"
   Write-Host "Demo outputs:                   $DemoOutDir"
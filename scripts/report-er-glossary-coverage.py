@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+ER 术语覆盖率报告：统计字段名中回退为英文原文的词，按出现次数排序。
+- 来源：docs/architecture/er-diagram.mmd，或 --prisma 指定的 Prisma schema
+- 分别按中文 mmd（er.*）与讲解文档（er_brief.*）两套词表统计
+- 只解析模型，不渲染任何输出
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from er_diagram import render_brief, render_cn
+from er_diagram.coverage import analyze, index_fields
+from er_diagram.pipeline import load_model
+
+# 渲染器 -> (整词表, 分词表)；表名中文两者共用 er.table
+GLOSSARIES = {
+    "cn-mmd": (render_cn.FIELD_EXACT_CN, render_cn.TOKEN_CN),
+    "brief": (render_brief.FIELD_EXACT_CN, render_brief.TOKEN_CN),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--input", default="docs/architecture/er-diagram.mmd", help="输入 ER mmd")
+    parser.add_argument("--prisma", default="", help="改为统计 Prisma schema（例如 apps/api/prisma/schema.prisma）")
+    parser.add_argument(
+        "--renderer",
+        default=",".join(GLOSSARIES),
+        help=f"统计哪些渲染器的词表，逗号分隔（可选：{', '.join(GLOSSARIES)}）",
+    )
+    parser.add_argument("--top", type=int, default=20, help="列出前 N 个缺失词")
+    args = parser.parse_args()
+
+    names = [x.strip() for x in args.renderer.split(",") if x.strip()]
+    unknown = [x for x in names if x not in GLOSSARIES]
+    if unknown:
+        parser.error(f"unknown renderer(s): {', '.join(unknown)}")
+
+    if args.prisma:
+        model = load_model(prisma_path=Path(args.prisma))
+    else:
+        model = load_model(mmd_path=Path(args.input))
+    index = index_fields(model)
+
+    for name in names:
+        exact, tokens = GLOSSARIES[name]
+        report = analyze(model, exact, tokens, render_cn.TABLE_CN, index=index)
+        print(f"== {name}")
+        print(
+            f"fields: {report.field_covered}/{report.field_total} covered ({report.ratio * 100:.1f}%), "
+            f"distinct names: {report.distinct_covered}/{report.distinct_total}, "
+            f"missing tokens: {len(report.missing)}"
+        )
+        if report.missing:
+            print(f"{'token':<24}{'occurrences':>12}{'unlocks':>9}  examples")
+            for entry in report.missing[: args.top]:
+                print(f"{entry.token:<24}{entry.occurrences:>12}{entry.unlocks:>9}  {', '.join(entry.examples)}")
+        if report.tables_missing:
+            print(f"tables without er.table entry: {len(report.tables_missing)} ({', '.join(report.tables_missing[: args.top])})")
+        print("")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""er_diagram.split：总览边不分方向；清理旧子图时只删除本工具写出的文件。"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from er_diagram.model import EntityDef, ErModel, RelationDef  # noqa: E402
+from er_diagram.split import MANIFEST_NAME, render_overview, write_domain_diagrams  # noqa: E402
+
+
+def make_model(*relations: tuple[str, str]) -> ErModel:
+    entities = [EntityDef(name=name, fields=[]) for name in ("USERS", "PATENTS", "FILES")]
+    rels = [RelationDef(left=left, card="||--o{", right=right, label="ref") for left, right in relations]
+    return ErModel(init_line="", entities=entities, relations=rels)
+
+
+class OverviewTest(unittest.TestCase):
+    def test_both_directions_share_one_edge(self) -> None:
+        overview = render_overview(make_model(("USERS", "PATENTS"), ("PATENTS", "USERS")))
+        edges = [line for line in overview.splitlines() if "}o..o{" in line]
+        self.assertEqual(len(edges), 1)
+        self.assertIn('"2 条关系"', edges[0])
+
+
+class StaleCleanupTest(unittest.TestCase):
+    def test_only_previously_written_files_are_removed(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            out_dir = Path(tmp)
+            (out_dir / "unrelated.mmd").write_text("erDiagram\n", encoding="utf-8")
+            first = {p.name for p in write_domain_diagrams(make_model(("USERS", "FILES")), out_dir)}
+            smaller = ErModel(init_line="", entities=[EntityDef(name="USERS", fields=[])], relations=[])
+            second = {p.name for p in write_domain_diagrams(smaller, out_dir)}
+
+            self.assertLess(second, first)
+            self.assertEqual({p.name for p in out_dir.glob("*.mmd")}, second | {"unrelated.mmd"})
+            self.assertTrue((out_dir / MANIFEST_NAME).is_file())
+
+
+if __name__ == "__main__":
+    unittest.main()
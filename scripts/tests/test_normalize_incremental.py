@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""normalize-client-handover-cn.py --incremental：改动一行后，其余块全部复用上次输出。"""
+
+from __future__ import annotations
+
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+SCRIPT = SCRIPTS_DIR / "normalize-client-handover-cn.py"
+DOC = SCRIPTS_DIR.parent / "docs" / "architecture" / "client-handover-mini-program-admin.md"
+STATS_RE = re.compile(r"incremental: reused=(\d+) processed=(\d+) blocks=(\d+)")
+
+
+def run(in_path: Path, out_path: Path, *extra: str) -> tuple[int, int, int]:
+    result = subprocess.run(
+        [sys.executable, str(SCRIPT), "--input", str(in_path), "--output", str(out_path), *extra],
+        check=True,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+    )
+    m = STATS_RE.search(result.stdout)
+    return tuple(int(x) for x in m.groups()) if m else (0, 0, 0)
+
+
+def edit_one_line(path: Path, trailing: str) -> None:
+    # 在中部某个小节标题后插入一行，并改变文件末尾的空行
+    lines = path.read_text(encoding="utf-8").rstrip("\n").split("\n")
+    headings = [i for i, line in enumerate(lines) if line.startswith("### ")]
+    at = headings[len(headings) // 2] + 1
+    lines.insert(at, "新增的一行说明。")
+    path.write_text("\n".join(lines) + trailing, encoding="utf-8")
+
+
+class IncrementalRerunTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def test_in_place_rerun_after_one_line_edit(self) -> None:
+        doc = self.tmp / "doc.md"
+        shutil.copyfile(DOC, doc)
+        _, _, blocks = run(doc, doc, "--incremental")
+        self.assertGreater(blocks, 10)
+
+        edit_one_line(doc, "\n\n\n")
+        expected = self.tmp / "full.md"
+        run(doc, expected)
+        reused, processed, total = run(doc, doc, "--incremental")
+        self.assertEqual((reused, processed, total), (blocks - 1, 1, blocks))
+        self.assertEqual(doc.read_text(encoding="utf-8"), expected.read_text(encoding="utf-8"))
+
+    def test_separate_output_ignores_trailing_blank_lines(self) -> None:
+        src = self.tmp / "src.md"
+        out = self.tmp / "out.md"
+        shutil.copyfile(DOC, src)
+        _, _, blocks = run(src, out, "--incremental")
+
+        edit_one_line(src, "")  # 同时去掉文件末尾换行：最后一块仍应命中清单
+        expected = self.tmp / "full.md"
+        run(src, expected)
+        reused, processed, total = run(src, out, "--incremental")
+        self.assertEqual((reused, processed, total), (blocks - 1, 1, blocks))
+        self.assertEqual(out.read_text(encoding="utf-8"), expected.read_text(encoding="utf-8"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+"""png_encoder: the default profile matches the previous optimize=True output byte for byte."""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from PIL import Image, ImageChops, ImageDraw
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from png_encoder import DEFAULT_PROFILE, save_png  # noqa: E402
+
+
+def few_colors() -> Image.Image:
+    img = Image.new("RGB", (320, 200), (255, 255, 255))
+    draw = ImageDraw.Draw(img)
+    draw.rectangle((20, 20, 180, 120), fill=(30, 90, 200))
+    draw.ellipse((150, 60, 300, 180), fill=(220, 60, 40))
+    return img
+
+
+class DefaultProfileTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.dir = Path(self.tmp.name)
+
+    def test_default_matches_optimize_true(self) -> None:
+        img = few_colors()
+        baseline = self.dir / "baseline.png"
+        img.save(baseline, format="PNG", optimize=True)
+        stats = save_png(img, self.dir / "default.png", DEFAULT_PROFILE)
+        self.assertEqual(stats.mode, "RGB")
+        self.assertEqual((self.dir / "default.png").read_bytes(), baseline.read_bytes())
+
+    def test_palette_profile_is_lossless(self) -> None:
+        img = few_colors()
+        stats = save_png(img, self.dir / "palette.png", "smallest-palette")
+        self.assertEqual(stats.mode, "P")
+        with Image.open(self.dir / "palette.png") as out:
+            self.assertIsNone(ImageChops.difference(out.convert("RGB"), img).getbbox())
+
+
+if __name__ == "__main__":
+    unittest.main()
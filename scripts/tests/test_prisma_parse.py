@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""er_diagram.prisma：enum / type 声明在引用它们的 model 之后时，字段仍按标量列输出。"""
+
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from er_diagram.prisma import compile_schema  # noqa: E402
+
+SCHEMA = """
+model Order {
+  id      String      @id
+  status  OrderStatus @default(PENDING)
+  address Address?
+  userId  String
+  user    User        @relation(fields: [userId], references: [id])
+}
+
+model User {
+  id     String  @id
+  orders Order[]
+}
+
+enum OrderStatus {
+  PENDING
+  PAID
+}
+
+type Address {
+  city String
+}
+"""
+
+
+class ForwardDeclarationTest(unittest.TestCase):
+    def test_enum_and_type_declared_after_model(self) -> None:
+        entities, relations = compile_schema(SCHEMA)
+        order = next(e for e in entities if e.name == "ORDER")
+        self.assertEqual(
+            [(f.ftype, f.name, f.key_tags) for f in order.fields],
+            [("string", "id", ["PK"]), ("string", "status", []), ("json", "address", []), ("string", "userId", ["FK"])],
+        )
+        self.assertEqual([(r.left, r.right, r.label) for r in relations], [("USER", "ORDER", "user")])
+
+
+if __name__ == "__main__":
+    unittest.main()
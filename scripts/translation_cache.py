@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+交接文档脚本共用的标识符译文缓存：
+- 有界 LRU，键为 (命名空间, 版本, 原始标识符)；版本由词典版本与译法源码哈希组成（见 translator_version）
+- 记录命中/未命中次数
+- 可选落盘（JSON），重复生成时跳过未变化标识符的翻译
+- 同一进程内的脚本共用一个实例（见 shared_cache），串联运行时只加载/保存一次
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable
+
+CACHE_FORMAT = 1
+DEFAULT_MAXSIZE = 16384
+
+
+def dictionary_version(*maps: dict[str, str]) -> str:
+    digest = hashlib.sha1()
+    for mapping in maps:
+        digest.update(json.dumps(mapping, ensure_ascii=False, sort_keys=True).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()[:12]
+
+
+def translator_version(dictionary: str, *sources: str | Path) -> str:
+    # 落盘缓存的版本键：词典改动或译法代码（脚本本身及其依赖模块）改动后，旧条目都不再命中
+    digest = hashlib.sha1(dictionary.encode("utf-8"))
+    for source in sources:
+        digest.update(b"\0")
+        digest.update(Path(source).read_bytes())
+    return digest.hexdigest()[:12]
+
+
+class TranslationCache:
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str, str], str] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, namespace: str, version: str, token: str, compute: Callable[[str], str]) -> str:
+        key = (namespace, version, token)
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = compute(token)
+        self._entries[key] = value
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def stats(self) -> str:
+        total = self.hits + self.misses
+        rate = self.hits / total * 100 if total else 0.0
+        return f"hits={self.hits} misses={self.misses} hit_rate={rate:.1f}% size={len(self._entries)}/{self.maxsize}"
+
+    def load(self, path: Path) -> int:
+        # 缓存文件缺失或格式不符时视为空缓存；旧版本词典的条目不会命中，按 LRU 自然淘汰
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return 0
+        if not isinstance(payload, dict) or payload.get("format") != CACHE_FORMAT:
+            return 0
+        loaded = 0
+        for item in payload.get("entries", []):
+            if not isinstance(item, list) or len(item) != 4 or not all(isinstance(x, str) for x in item):
+                continue
+            namespace, version, token, value = item
+            self._entries[(namespace, version, token)] = value
+            self._entries.move_to_end((namespace, version, token))
+            loaded += 1
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return loaded
+
+    def save(self, path: Path) -> None:
+        payload = {
+            "format": CACHE_FORMAT,
+            "entries": [[ns, version, token, value] for (ns, version, token), value in self._entries.items()],
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+
+_SHARED_CACHE: TranslationCache | None = None
+
+
+def shared_cache() -> TranslationCache:
+    global _SHARED_CACHE
+    if _SHARED_CACHE is None:
+        _SHARED_CACHE = TranslationCache()
+    return _SHARED_CACHE